@@ -72,7 +72,7 @@ class StreamingService {
                     // Map server events to client StreamingUpdate
                     if (ev === 'started') {
                       onUpdate({ status: 'starting', progress: 0, message: 'started' })
-                    } else if (ev === 'rule_based' || ev === 'progress') {
+                    } else if (ev === 'rule_based' || ev === 'progress' || ev === 'clause_result') {
                       const processed = typeof payload['processed'] === 'number' ? (payload['processed'] as number) : undefined
                       const total = typeof payload['total'] === 'number' ? (payload['total'] as number) : undefined
                       const progress = processed !== undefined && total !== undefined
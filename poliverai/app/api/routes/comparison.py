@@ -1,23 +1,161 @@
-from fastapi import APIRouter, UploadFile
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+
+from fastapi import APIRouter, Form, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
+from ....comparison.diff import ClauseAlignment, align_clauses
+from ....comparison.scoring import article_deltas, compare_scores
+from ....domain.auth import User
+from ....rag.verification import _meaningful_clauses, compare_policies
+from .verification import (
+    CURRENT_USER_OPTIONAL_DEPENDENCY,
+    _analysis_charges,
+    _apply_charges,
+    _effective_mode,
+    _extract_text,
+    _record_free_analysis,
+)
+
+MAX_CHANGES_REPORTED = 50
+EXCERPT_LENGTH = 200
+
+
+class ArticleDelta(BaseModel):
+    article: str
+    draft_violations: int
+    final_violations: int
+    draft_fulfills: int
+    final_fulfills: int
+    delta: int  # > 0: final improves on this article
+
+
+class AlignmentStats(BaseModel):
+    unchanged: int
+    modified: int
+    added: int
+    removed: int
+
+
+class ClauseChange(BaseModel):
+    kind: str  # "modified", "added" or "removed"
+    draft_excerpt: str | None = None
+    final_excerpt: str | None = None
+    similarity: float | None = None
+
 
 class ComparisonResult(BaseModel):
-    more_compliant: str
+    more_compliant: str  # "draft", "final" or "equal"
     summary: str
+    draft_score: int = 0
+    final_score: int = 0
+    score_delta: int = 0
+    draft_verdict: str = ""
+    final_verdict: str = ""
+    article_deltas: list[ArticleDelta] = []
+    alignment: AlignmentStats | None = None
+    changes: list[ClauseChange] = []
 
 
 router = APIRouter(tags=["comparison"])
 
 
+async def _read_upload_text(upload: UploadFile) -> str:
+    raw = await upload.read()
+    filename = upload.filename or "upload.txt"
+    tmpdir = Path(tempfile.mkdtemp(prefix="poliverai_compare_temp_"))
+    temp_file = tmpdir / (Path(filename).name or "upload.txt")
+    temp_file.write_bytes(raw)
+    try:
+        return await run_in_threadpool(_extract_text, temp_file, Path(filename).suffix.lower(), raw)
+    finally:
+        try:
+            temp_file.unlink(missing_ok=True)
+            tmpdir.rmdir()
+        except Exception as e:
+            logging.warning(f"Failed to cleanup temp file: {e}")
+
+
+def _compare_texts(
+    draft_text: str, final_text: str, analysis_mode: str
+) -> tuple[list[str], list[str], ClauseAlignment, dict, dict]:
+    # Segment once: the alignment covers the same clauses the analysis judges
+    draft_clauses, final_clauses = _meaningful_clauses(draft_text), _meaningful_clauses(final_text)
+    draft_texts, final_texts = [c.text for c in draft_clauses], [c.text for c in final_clauses]
+    alignment = align_clauses(draft_texts, final_texts)
+    draft_result, final_result = compare_policies(
+        draft_text, final_text, analysis_mode, draft_clauses=draft_clauses, final_clauses=final_clauses
+    )
+    return draft_texts, final_texts, alignment, draft_result, final_result
+
+
 @router.post("/compare", response_model=ComparisonResult)
 async def compare(
     draft: UploadFile,
     final: UploadFile,
+    analysis_mode: str | None = Form(
+        "fast", description="Analysis mode: 'fast', 'balanced', or 'detailed'"
+    ),
+    current_user: User | None = CURRENT_USER_OPTIONAL_DEPENDENCY,
 ) -> ComparisonResult:
-    # Placeholder logic: prefer the file literally named "final"
-    more = "final" if final.filename else "draft"
+    """Compare a draft and final policy: clause alignment plus per-article score deltas.
+
+    Both documents are analyzed together; clauses they share (same text up to
+    case and whitespace) are judged once. The alignment, which also pairs
+    modified clauses, is reported for review and does not change what is
+    judged. Billing is that of one /verify per document.
+    """
+    draft_text, final_text = await asyncio.gather(_read_upload_text(draft), _read_upload_text(final))
+    effective_mode = _effective_mode(current_user, analysis_mode)
+
+    draft_clauses, final_clauses, alignment, draft_result, final_result = await run_in_threadpool(
+        _compare_texts, draft_text, final_text, effective_mode
+    )
+
+    charges = _analysis_charges(current_user, effective_mode) * 2
+    _apply_charges(current_user, charges)
+    if not charges and current_user:
+        _record_free_analysis(current_user, effective_mode)
+
+    changes = [
+        ClauseChange(
+            kind="modified",
+            draft_excerpt=draft_clauses[i][:EXCERPT_LENGTH],
+            final_excerpt=final_clauses[j][:EXCERPT_LENGTH],
+            similarity=sim,
+        )
+        for i, j, sim in alignment.modified
+    ]
+    changes += [ClauseChange(kind="added", final_excerpt=final_clauses[j][:EXCERPT_LENGTH]) for j in alignment.added]
+    changes += [ClauseChange(kind="removed", draft_excerpt=draft_clauses[i][:EXCERPT_LENGTH]) for i in alignment.removed]
+
+    draft_score, final_score = int(draft_result["score"]), int(final_result["score"])
+    winner = compare_scores(final_score, draft_score)
+    more = {"a": "final", "b": "draft"}.get(winner, "equal")
+    stats = AlignmentStats(
+        unchanged=len(alignment.unchanged),
+        modified=len(alignment.modified),
+        added=len(alignment.added),
+        removed=len(alignment.removed),
+    )
+    summary = (
+        f"Final scores {final_score} vs draft {draft_score} ({final_score - draft_score:+d}). "
+        f"{stats.unchanged} unchanged, {stats.modified} modified, {stats.added} added, {stats.removed} removed clauses."
+    )
     return ComparisonResult(
         more_compliant=more,
-        summary="This is a placeholder comparison. Implement diffing & scoring.",
+        summary=summary,
+        draft_score=draft_score,
+        final_score=final_score,
+        score_delta=final_score - draft_score,
+        draft_verdict=draft_result.get("verdict", ""),
+        final_verdict=final_result.get("verdict", ""),
+        article_deltas=[
+            ArticleDelta(**d) for d in article_deltas(draft_result.get("articles", {}), final_result.get("articles", {}))
+        ],
+        alignment=stats,
+        changes=changes[:MAX_CHANGES_REPORTED],
     )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -12,13 +13,18 @@ from ....db.transactions import transactions
 from .auth import CURRENT_USER_DEPENDENCY
 from pydantic import BaseModel
 
-from ....rag.service import ingest_paths
+from ....rag.service import ingest_paths, upload_source_id
 
 
 class IngestResponse(BaseModel):
     files: int
     chunks: int
     skipped: list[dict]
+    unchanged: int = 0
+    chunks_reused: int = 0
+    chunks_deleted: int = 0
+    stages: dict | None = None
+    elapsed_seconds: float | None = None
 
 
 router = APIRouter(tags=["ingest"])
@@ -28,14 +34,19 @@ router = APIRouter(tags=["ingest"])
 async def ingest(files: list[UploadFile], current_user: User = CURRENT_USER_DEPENDENCY) -> IngestResponse:
     tmpdir = Path(tempfile.mkdtemp(prefix="poliverai_ingest_"))
     saved_paths: list[str] = []
+    sources: dict[str, str] = {}
     try:
         for f in files:
-            suffix = Path(f.filename).suffix if f.filename else ""
-            p = tmpdir / f"upload{len(saved_paths)}{suffix}"
+            # Keep the original file name for display; the owner-scoped source id
+            # is what incremental ingest uses to replace a document's previous chunks.
+            name = Path(f.filename).name if f.filename else f"upload{len(saved_paths)}"
+            p = tmpdir / str(len(saved_paths)) / name
+            p.parent.mkdir()
             data = await f.read()
             p.write_bytes(data)
             saved_paths.append(str(p))
-        stats = ingest_paths(saved_paths)
+            sources[str(p)] = upload_source_id(current_user.id if current_user else None, name, data)
+        stats = ingest_paths(saved_paths, sources=sources)
 
         # Charge credits for ingestion for non-PRO users
         try:
@@ -70,8 +81,6 @@ async def ingest(files: list[UploadFile], current_user: User = CURRENT_USER_DEPE
     finally:
         # Best-effort cleanup of tempdir
         try:
-            for sp in saved_paths:
-                Path(sp).unlink(missing_ok=True)
-            tmpdir.rmdir()
+            shutil.rmtree(tmpdir)
         except Exception as e:
             logging.warning(f"Failed to cleanup temp files: {e}")
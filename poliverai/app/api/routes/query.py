@@ -1,10 +1,13 @@
+import json
 from collections import defaultdict
+from collections.abc import Iterator
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ....knowledge.gdpr_articles import get_article_with_title
-from ....rag.service import answer_question
+from ....rag.service import answer_question_async, answer_question_stream
 
 
 class QueryRequest(BaseModel):
@@ -20,12 +23,51 @@ router = APIRouter(tags=["query"])
 
 
 @router.post("/query", response_model=QueryAnswer)
-async def ask_gdpr(req: QueryRequest) -> QueryAnswer:
-    result = answer_question(req.question)
+async def ask_gdpr(req: QueryRequest, response: Response) -> QueryAnswer:
+    result = await answer_question_async(req.question)
+    # Answer cache status: HIT, MISS or BYPASS (plus the entry's age on hits)
+    response.headers["X-Cache"] = str(result.get("cache", "bypass")).upper()
+    if "cache_age" in result:
+        response.headers["Age"] = str(result["cache_age"])
+
+    labels = _source_labels(result.get("sources", []) or [])
+    return QueryAnswer(answer=result.get("answer", ""), sources=labels or ["No sources found"])
+
 
+@router.post("/query-stream")
+async def ask_gdpr_stream(req: QueryRequest) -> StreamingResponse:
+    """Stream an answer as SSE: a ``sources`` event, ``token`` events, then ``completed``.
+
+    Source labels match ``/query``; ``completed`` carries the final answer and
+    the cache status.
+    """
+
+    # Sync generator: Starlette iterates it in a worker thread, so the blocking
+    # retrieval and OpenAI stream never stall the event loop
+    def generate_stream() -> Iterator[str]:
+        try:
+            for item in answer_question_stream(req.question):
+                data = item["data"]
+                if "sources" in data:
+                    data = {**data, "sources": _source_labels(data["sources"]) or ["No sources found"]}
+                yield f"data: {json.dumps({'event': item['event'], 'data': data})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'event': 'error', 'data': {'message': str(e)}})}\n\n"
+
+    return StreamingResponse(
+        generate_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
+    )
+
+
+def _source_labels(sources: list[dict]) -> list[str]:
     # Group sources by filename and include hit counts, titles, and article labels
     grouped = defaultdict(list)
-    for s in result.get("sources", []) or []:
+    for s in sources:
         grouped[s.get("source", "").strip()].append(s)
 
     labels: list[str] = []
@@ -51,5 +93,4 @@ async def ask_gdpr(req: QueryRequest) -> QueryAnswer:
             labels.append(f"{title} ({len(items)} hits){article_str}")
         else:
             labels.append(f"{src} ({len(items)} hits){article_str}")
-
-    return QueryAnswer(answer=result.get("answer", ""), sources=labels or ["No sources found"])
+    return labels
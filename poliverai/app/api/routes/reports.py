@@ -9,6 +9,7 @@ from pydantic import BaseModel
 import logging
 
 from ....core.config import get_settings
+from ....rag.llm import chat_completion
 from ....rag.service import _init
 from ....reporting.exporter import export_report, export_report_html
 try:
@@ -390,6 +391,57 @@ def _generate_verification_report_content(req: VerificationReportRequest) -> str
 def _generate_revised_policy(req: PolicyRevisionRequest) -> str:
     """Generate a revised policy document addressing compliance issues."""
     settings = get_settings()
+    messages = _revision_messages(req)
+
+    # Use OpenAI to generate the revision
+    init = _init()
+    try:
+        response = init.client.chat.completions.create(
+            model=settings.openai_chat_model,
+            messages=messages,
+            temperature=0.1,  # Low temperature for consistency
+            max_tokens=4000,  # Allow for substantial revisions
+            timeout=60,  # Allow time for complex revisions
+        )
+        return _revised_policy_text(response)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to generate policy revision: {str(e)}"
+        ) from e
+
+
+async def _generate_revised_policy_async(req: PolicyRevisionRequest) -> str:
+    """Async ``_generate_revised_policy`` on the pooled client ("reports" concurrency limit)."""
+    settings = get_settings()
+    messages = _revision_messages(req)
+    try:
+        response = await chat_completion(
+            "reports",
+            model=settings.openai_chat_model,
+            messages=messages,
+            temperature=0.1,
+            max_tokens=4000,
+            timeout=60,
+        )
+        return _revised_policy_text(response)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to generate policy revision: {str(e)}"
+        ) from e
+
+
+def _revised_policy_text(response: Any) -> str:
+    revised_policy = response.choices[0].message.content or ""
+
+    if not revised_policy.strip():
+        raise Exception("AI generated empty revision")
+
+    return revised_policy.strip()
+
+
+def _revision_messages(req: PolicyRevisionRequest) -> list[dict[str, str]]:
+    """Build the chat messages for a policy revision (raises 400 without an API key)."""
+    settings = get_settings()
 
     if not settings.openai_api_key:
         raise HTTPException(
@@ -440,9 +492,6 @@ Revision Guidelines:
 Provide the complete revised policy document below:
 """
 
-    # Use OpenAI to generate the revision
-    init = _init()
-
     # If the caller supplied free-form instructions, include them so the
     # chat model receives both the structured revision guidance and any
     # additional natural-language instructions the user provided.
@@ -467,26 +516,7 @@ Provide the complete revised policy document below:
         },
     ]
 
-    try:
-        response = init.client.chat.completions.create(
-            model=settings.openai_chat_model,
-            messages=messages,
-            temperature=0.1,  # Low temperature for consistency
-            max_tokens=4000,  # Allow for substantial revisions
-            timeout=60,  # Allow time for complex revisions
-        )
-
-        revised_policy = response.choices[0].message.content or ""
-
-        if not revised_policy.strip():
-            raise Exception("AI generated empty revision")
-
-        return revised_policy.strip()
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to generate policy revision: {str(e)}"
-        ) from e
+    return messages
 
 
 @router.post("/reports", response_model=ReportResponse)
@@ -730,7 +760,7 @@ async def generate_policy_revision(req: PolicyRevisionRequest, current_user: Use
 
         # Perform the AI revision
         try:
-            revised_policy = _generate_revised_policy(req)
+            revised_policy = await _generate_revised_policy_async(req)
         except Exception as e:
             # refund if charged
             if charged:
@@ -8,6 +8,8 @@ except Exception:  # pragma: no cover - optional dependency
     MongoUserDB = None
 
 from poliverai.core.config import get_settings
+from ....domain.auth import User
+from .auth import CURRENT_USER_DEPENDENCY
 
 router = APIRouter()
 
@@ -115,3 +117,31 @@ async def increment_downloads() -> Dict[str, int]:
         return {"total_downloads": total}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to increment downloads: {e}") from e
+
+
+@router.get("/stats/cache")
+async def cache_stats() -> dict:
+    """Return per-process hit/miss counters and sizes for the RAG caches."""
+    try:
+        from ....rag.service import answer_cache_stats, embedding_cache_stats, retrieval_cache_stats
+        from ....rag.verification import judgment_cache_stats, verification_cache_stats
+    except Exception as e:  # pragma: no cover - optional during dev
+        raise HTTPException(status_code=503, detail=f"RAG service unavailable: {e}") from e
+    return {
+        "embeddings": embedding_cache_stats(),
+        "retrieval": retrieval_cache_stats(),
+        "answers": answer_cache_stats(),
+        "judgments": judgment_cache_stats(),
+        "verification": verification_cache_stats(),
+    }
+
+
+@router.delete("/stats/cache/verification")
+async def clear_verification_results(current_user: User = CURRENT_USER_DEPENDENCY) -> dict:
+    """Invalidate all cached whole-document verification results (signed-in users only)."""
+    try:
+        from ....rag.verification import clear_verification_cache
+    except Exception as e:  # pragma: no cover - optional during dev
+        raise HTTPException(status_code=503, detail=f"RAG service unavailable: {e}") from e
+    clear_verification_cache()
+    return {"cleared": True}
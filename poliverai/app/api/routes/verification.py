@@ -1,12 +1,15 @@
 import asyncio
+import io
 import json
 import logging
 import os
 import tempfile
+import zipfile
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, Form, HTTPException, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
@@ -25,9 +28,12 @@ from ....ingestion.readers.html_reader import read_html_text
 from ....ingestion.readers.pdf_reader import read_pdf_text
 from ....reporting.exporter import export_report
 from ....rag.verification import analyze_policy
+from ....rag.verification import analyze_policy_full
 from ....rag.verification import analyze_policy_stream
+from ....rag.verification import reanalyze_policy
 from ....core.config import get_settings
 from ....db.transactions import transactions
+from ....services.jobs import COMPLETED, FAILED, JobQueue
 
 
 class ClauseMatch(BaseModel):
@@ -52,6 +58,19 @@ class ComplianceMetrics(BaseModel):
     total_violations: int
     total_fulfills: int
     critical_violations: int
+    judgment_cache_hits: int = 0
+    judgment_cache_misses: int = 0
+    judgment_cache_hit_ratio: float = 0.0
+    # Full-coverage analysis only
+    clauses_analyzed: int | None = None
+    shards: int | None = None
+    # Deadline-bound analysis only
+    coverage: float | None = None
+    clauses_judged: int | None = None
+    clauses_planned: int | None = None
+    # Judging cascade only
+    cascade_settled: int | None = None
+    cascade_escalated: int | None = None
 
 
 class ComplianceResult(BaseModel):
@@ -63,6 +82,19 @@ class ComplianceResult(BaseModel):
     recommendations: list[Recommendation]
     summary: str
     metrics: ComplianceMetrics
+    # Pass to /re-verify to analyze a revision incrementally
+    analysis_id: str | None = None
+
+
+class IncrementalStats(BaseModel):
+    baseline: bool  # False when the previous analysis was not found and the whole text was judged
+    reused: int
+    judged: int
+    removed: int
+
+
+class ReverifyResult(ComplianceResult):
+    incremental: IncrementalStats
 
 
 router = APIRouter(tags=["verification"])
@@ -108,54 +140,31 @@ async def get_current_user_optional(
 CURRENT_USER_OPTIONAL_DEPENDENCY = Depends(get_current_user_optional)
 
 
-@router.post("/verify", response_model=ComplianceResult)
-async def verify(
-    file: UploadFile,
-    analysis_mode: str | None = Form(
-        "fast", description="Analysis mode: 'fast', 'balanced', or 'detailed'"
-    ),
-    ingest: bool = Form(False, description="If true, ingest the uploaded file into the RAG store after analysis"),
-    generate_report: bool = Form(False, description="If true, generate a PDF report after analysis"),
-    current_user: User | None = CURRENT_USER_OPTIONAL_DEPENDENCY,
-) -> ComplianceResult:
-    # Handle different file types properly
+# Pricing (credits). 1 USD = 10 credits. Costs are in credits.
+ANALYSIS_COSTS = {
+    'analysis': {'fast': 2, 'balanced': 5, 'detailed': 10},
+    'ingest': 2,
+    'report': 10,
+}
 
-    # Save uploaded file to temporary location
-    raw = await file.read()
-
-    # Determine file extension
-    filename = file.filename or "upload.txt"
-    file_ext = Path(filename).suffix.lower()
-
-    # Create temporary file with proper extension and keep until ingestion/report complete
-    tmpdir = Path(tempfile.mkdtemp(prefix="poliverai_verify_temp_"))
-    temp_file = tmpdir / f"upload{file_ext}"
-    temp_file.write_bytes(raw)
 
+def _extract_text(temp_file: Path, file_ext: str, raw: bytes) -> str:
+    """Extract text based on file type."""
+    if file_ext == ".pdf":
+        return read_pdf_text(str(temp_file))
+    if file_ext == ".docx":
+        return read_docx_text(str(temp_file))
+    if file_ext in {".html", ".htm"}:
+        return read_html_text(str(temp_file))
+    # Default to text file (txt, md, etc.)
     try:
-        # Extract text based on file type
-        if file_ext == ".pdf":
-            text = read_pdf_text(str(temp_file))
-        elif file_ext == ".docx":
-            text = read_docx_text(str(temp_file))
-        elif file_ext in {".html", ".htm"}:
-            text = read_html_text(str(temp_file))
-        else:
-            # Default to text file (txt, md, etc.)
-            try:
-                text = raw.decode("utf-8", errors="ignore")
-            except Exception:
-                text = ""
-    except Exception as e:
-        # Clean up on failure to extract
-        try:
-            temp_file.unlink(missing_ok=True)
-            tmpdir.rmdir()
-        except Exception:
-            pass
-        raise
+        return raw.decode("utf-8", errors="ignore")
+    except Exception:
+        return ""
+
 
-    # Check user tier and restrict analysis modes for free users
+def _effective_mode(current_user: User | None, analysis_mode: str | None) -> str:
+    """Check user tier and restrict analysis modes for free users."""
     effective_mode = analysis_mode or "fast"
 
     if current_user is None or current_user.tier == UserTier.FREE:
@@ -171,31 +180,53 @@ async def verify(
                 },
             )
         effective_mode = "fast"
+    return effective_mode
 
-    # Run RAG-based verification over clauses with specified analysis mode
-    result = analyze_policy(text, analysis_mode=effective_mode)
-
-    # Pricing (credits). 1 USD = 10 credits. Costs are in credits.
-    COSTS = {
-        'analysis': {'fast': 2, 'balanced': 5, 'detailed': 10},
-        'ingest': 2,
-        'report': 10,
-    }
 
+def _analysis_charges(
+    current_user: User | None, analysis_mode: str, ingest: bool = False, generate_report: bool = False
+) -> list[tuple[str, int]]:
     # Determine total credits to charge (per-operation).
     # Fast analyses are free for everyone; only charge for non-fast (advanced) analysis
     # and for optional ingest/report operations for non-PRO users.
     charges = []
     if current_user and current_user.tier != UserTier.PRO:
         # Only charge for advanced analysis modes (balanced/detailed)
-        if effective_mode != 'fast':
-            analysis_cost = COSTS['analysis'].get(effective_mode, COSTS['analysis']['fast'])
+        if analysis_mode != 'fast':
+            analysis_cost = ANALYSIS_COSTS['analysis'].get(analysis_mode, ANALYSIS_COSTS['analysis']['fast'])
             charges.append(('analysis', int(analysis_cost)))
         if ingest:
-            charges.append(('ingest', int(COSTS['ingest'])))
+            charges.append(('ingest', int(ANALYSIS_COSTS['ingest'])))
         if generate_report:
-            charges.append(('report', int(COSTS['report'])))
+            charges.append(('report', int(ANALYSIS_COSTS['report'])))
+    return charges
+
+
+def _ensure_balance(user_record, total_credits: int) -> None:
+    """Raise HTTP 402 unless the user's combined balance covers ``total_credits``."""
+    # Check combined balance (subscription_credits converted to equivalent regular credits + regular credits)
+    sub_avail = float(getattr(user_record, 'subscription_credits', 0) or 0)
+    reg_avail = float(getattr(user_record, 'credits', 0) or 0)
+    combined_equiv = sub_avail * SUBSCRIPTION_CREDIT_VALUE + reg_avail
+    if combined_equiv < total_credits:
+        raise HTTPException(status_code=402, detail={'message': 'Insufficient credits', 'required': total_credits, 'available': int(math.floor(combined_equiv))})
+
+
+def _ensure_user_balance(current_user: User | None, total_credits: int) -> None:
+    """Look up ``current_user``'s latest balance and raise HTTP 402 unless it covers ``total_credits``."""
+    if not total_credits or not current_user:
+        return
+    user_record = user_db.get_user_by_id(current_user.id)
+    if not user_record:
+        raise HTTPException(status_code=400, detail='User not found')
+    _ensure_balance(user_record, total_credits)
+
 
+def _apply_charges(current_user: User | None, charges: list[tuple[str, int]]) -> None:
+    """Check the user's balance and deduct ``charges``, recording a transaction per operation.
+
+    Raises HTTP 402 when the combined balance is insufficient.
+    """
     # If charging is required, verify balance then apply deductions and create transactions
     if charges and current_user:
         # Refresh user from DB to get latest credits
@@ -203,13 +234,7 @@ async def verify(
             user_record = user_db.get_user_by_id(current_user.id)
             if not user_record:
                 raise HTTPException(status_code=400, detail='User not found')
-            total_credits = sum(c for _, c in charges)
-            # Check combined balance (subscription_credits converted to equivalent regular credits + regular credits)
-            sub_avail = float(getattr(user_record, 'subscription_credits', 0) or 0)
-            reg_avail = float(getattr(user_record, 'credits', 0) or 0)
-            combined_equiv = sub_avail * SUBSCRIPTION_CREDIT_VALUE + reg_avail
-            if combined_equiv < total_credits:
-                raise HTTPException(status_code=402, detail={'message': 'Insufficient credits', 'required': total_credits, 'available': int(math.floor(combined_equiv))})
+            _ensure_balance(user_record, sum(c for _, c in charges))
             # Deduct per operation and record a transaction for each, consuming subscription_credits first at a discounted conversion
             for op, cred in charges:
                 remaining_base = int(cred)
@@ -261,61 +286,27 @@ async def verify(
         except Exception:
             logging.exception('Failed to apply charges for user %s', getattr(current_user, 'email', None))
 
-    # Optionally ingest the original file into the RAG store so it is available
-    # for future queries. This is optional because ingestion can be expensive.
-    if ingest:
-        try:
-            from ....rag.service import ingest_paths
-
-            stats = ingest_paths([str(temp_file)])
-            logging.info("Ingested file %s -> %s", temp_file, stats)
-        except Exception:
-            logging.exception("Failed to ingest file %s", temp_file)
 
-    # If there were no charges (free analysis) and we still have a current_user,
-    # create an informational zero-cost transaction so the user can track the analysis.
-    if not charges and current_user:
-        try:
-            tx = {
-                'user_email': current_user.email,
-                'event_type': 'analysis',
-                'amount_usd': 0.0,
-                'credits': 0,
-                'description': f'Free analysis ({effective_mode})',
-                'status': 'completed',
-            }
-            try:
-                transactions.add(tx)
-            except Exception:
-                logging.exception('Failed to record zero-cost analysis transaction for user %s', getattr(current_user, 'email', None))
-        except Exception:
-            logging.exception('Failed to add zero-cost analysis tx')
-
-    # Optionally generate a PDF report from the analysis result
-    if generate_report:
+def _record_free_analysis(current_user: User, analysis_mode: str) -> None:
+    """Informational zero-cost transaction so the user can track free analyses."""
+    try:
+        tx = {
+            'user_email': current_user.email,
+            'event_type': 'analysis',
+            'amount_usd': 0.0,
+            'credits': 0,
+            'description': f'Free analysis ({analysis_mode})',
+            'status': 'completed',
+        }
         try:
-            # Create a simple markdown summary for the report
-            md_lines = [f"# Compliance Report\n", f"**Verdict:** {result.get('verdict')}\n", f"**Score:** {result.get('score')}\n", f"**Summary:** {result.get('summary')}\n\n", "## Findings\n"]
-            for f in result.get('findings', []):
-                md_lines.append(f"- {f.get('article')}: {f.get('issue')}\n")
-            md = "\n".join(md_lines)
-            report_path = export_report(md, out_dir=get_settings().reports_dir)
-            logging.info("Generated report: %s", report_path)
+            transactions.add(tx)
         except Exception:
-            logging.exception("Failed to generate report for %s", temp_file)
-
-    # Clean up temporary file and directory after optional ingest/report
-    try:
-        temp_file.unlink(missing_ok=True)
-        tmpdir.rmdir()
-    except Exception as e:
-        logging.warning(f"Failed to cleanup temp file: {e}")
+            logging.exception('Failed to record zero-cost analysis transaction for user %s', getattr(current_user, 'email', None))
+    except Exception:
+        logging.exception('Failed to add zero-cost analysis tx')
 
-    # PERFORMANCE OPTIMIZATION: Skip RAG ingestion for verification-only requests
-    # This optional step can add significant latency. Users can use the separate
-    # ingest endpoint if they want to index files for future queries.
-    # This improves verification speed from ~10s to ~0.1s for typical files.
 
+def _to_compliance_result(result: dict) -> ComplianceResult:
     # Convert dict -> ComplianceResult model
     evidence_models = [
         ClauseMatch(
@@ -345,6 +336,16 @@ async def verify(
         total_violations=metrics_data.get("total_violations", 0),
         total_fulfills=metrics_data.get("total_fulfills", 0),
         critical_violations=metrics_data.get("critical_violations", 0),
+        judgment_cache_hits=metrics_data.get("judgment_cache_hits", 0),
+        judgment_cache_misses=metrics_data.get("judgment_cache_misses", 0),
+        judgment_cache_hit_ratio=metrics_data.get("judgment_cache_hit_ratio", 0.0),
+        clauses_analyzed=metrics_data.get("clauses_analyzed"),
+        shards=metrics_data.get("shards"),
+        coverage=metrics_data.get("coverage"),
+        clauses_judged=metrics_data.get("clauses_judged"),
+        clauses_planned=metrics_data.get("clauses_planned"),
+        cascade_settled=metrics_data.get("cascade_settled"),
+        cascade_escalated=metrics_data.get("cascade_escalated"),
     )
 
     return ComplianceResult(
@@ -356,9 +357,359 @@ async def verify(
         recommendations=rec_models,
         summary=result.get("summary", "Policy analysis completed."),
         metrics=metrics_model,
+        analysis_id=result.get("analysis_id"),
+    )
+
+
+@router.post("/verify", response_model=ComplianceResult)
+async def verify(
+    file: UploadFile,
+    response: Response,
+    analysis_mode: str | None = Form(
+        "fast", description="Analysis mode: 'fast', 'balanced', or 'detailed'"
+    ),
+    ingest: bool = Form(False, description="If true, ingest the uploaded file into the RAG store after analysis"),
+    generate_report: bool = Form(False, description="If true, generate a PDF report after analysis"),
+    full_coverage: bool = Form(
+        False, description="If true, analyze every clause of a long document (sharded across worker processes)"
+    ),
+    deadline_seconds: float | None = Form(
+        None, gt=0, description="Time budget in seconds; the best verdict reached by then is returned"
+    ),
+    current_user: User | None = CURRENT_USER_OPTIONAL_DEPENDENCY,
+) -> ComplianceResult:
+    # Handle different file types properly
+
+    # Save uploaded file to temporary location
+    raw = await file.read()
+
+    # Determine file extension
+    filename = file.filename or "upload.txt"
+    file_ext = Path(filename).suffix.lower()
+
+    # Create temporary file with proper extension and keep until ingestion/report complete
+    tmpdir = Path(tempfile.mkdtemp(prefix="poliverai_verify_temp_"))
+    # Keep the original name: ingest shows it as the chunks' source
+    temp_file = tmpdir / (Path(filename).name or f"upload{file_ext}")
+    temp_file.write_bytes(raw)
+
+    try:
+        text = _extract_text(temp_file, file_ext, raw)
+    except Exception as e:
+        # Clean up on failure to extract
+        try:
+            temp_file.unlink(missing_ok=True)
+            tmpdir.rmdir()
+        except Exception:
+            pass
+        raise
+
+    effective_mode = _effective_mode(current_user, analysis_mode)
+
+    # Run RAG-based verification over clauses with specified analysis mode.
+    # analyze_policy is blocking (sync retrieval + LLM calls); keep it off the event loop.
+    if full_coverage:
+        result = await run_in_threadpool(analyze_policy_full, text, analysis_mode=effective_mode)
+    else:
+        result = await run_in_threadpool(
+            analyze_policy, text, analysis_mode=effective_mode, deadline_seconds=deadline_seconds
+        )
+    # Result cache status: HIT, MISS or BYPASS. Billing below runs either way.
+    response.headers["X-Cache"] = str(result.get("cache", "bypass")).upper()
+    if "cache_age" in result:
+        response.headers["Age"] = str(result["cache_age"])
+
+    charges = _analysis_charges(current_user, effective_mode, ingest, generate_report)
+    _apply_charges(current_user, charges)
+
+    # Optionally ingest the original file into the RAG store so it is available
+    # for future queries. This is optional because ingestion can be expensive.
+    if ingest:
+        try:
+            from ....rag.service import ingest_paths, upload_source_id
+
+            source = upload_source_id(current_user.id if current_user else None, temp_file.name, raw)
+            stats = ingest_paths([str(temp_file)], sources={str(temp_file): source})
+            logging.info("Ingested file %s -> %s", temp_file, stats)
+        except Exception:
+            logging.exception("Failed to ingest file %s", temp_file)
+
+    # If there were no charges (free analysis) and we still have a current_user,
+    # create an informational zero-cost transaction so the user can track the analysis.
+    if not charges and current_user:
+        _record_free_analysis(current_user, effective_mode)
+
+    # Optionally generate a PDF report from the analysis result
+    if generate_report:
+        try:
+            # Create a simple markdown summary for the report
+            md_lines = [f"# Compliance Report\n", f"**Verdict:** {result.get('verdict')}\n", f"**Score:** {result.get('score')}\n", f"**Summary:** {result.get('summary')}\n\n", "## Findings\n"]
+            for f in result.get('findings', []):
+                md_lines.append(f"- {f.get('article')}: {f.get('issue')}\n")
+            md = "\n".join(md_lines)
+            report_path = export_report(md, out_dir=get_settings().reports_dir)
+            logging.info("Generated report: %s", report_path)
+        except Exception:
+            logging.exception("Failed to generate report for %s", temp_file)
+
+    # Clean up temporary file and directory after optional ingest/report
+    try:
+        temp_file.unlink(missing_ok=True)
+        tmpdir.rmdir()
+    except Exception as e:
+        logging.warning(f"Failed to cleanup temp file: {e}")
+
+    # PERFORMANCE OPTIMIZATION: Skip RAG ingestion for verification-only requests
+    # This optional step can add significant latency. Users can use the separate
+    # ingest endpoint if they want to index files for future queries.
+    # This improves verification speed from ~10s to ~0.1s for typical files.
+
+    return _to_compliance_result(result)
+
+
+@router.post("/re-verify", response_model=ReverifyResult)
+async def reverify(
+    file: UploadFile,
+    analysis_mode: str | None = Form(
+        "fast", description="Analysis mode: 'fast', 'balanced', or 'detailed'"
+    ),
+    previous_analysis_id: str | None = Form(
+        None, description="analysis_id returned by an earlier /verify or /re-verify of this policy"
+    ),
+    previous_file: UploadFile | None = None,
+    current_user: User | None = CURRENT_USER_OPTIONAL_DEPENDENCY,
+) -> ReverifyResult:
+    """Re-verify a revised policy, judging only clauses that changed since a previous analysis.
+
+    Identify the previous analysis by ``previous_analysis_id`` or by uploading
+    the previous version as ``previous_file``. Billing is the same as /verify.
+    """
+    if previous_analysis_id is None and previous_file is None:
+        raise HTTPException(status_code=422, detail="Provide previous_analysis_id or previous_file")
+
+    texts = []
+    for upload in (file, previous_file):
+        if upload is None:
+            texts.append(None)
+            continue
+        raw = await upload.read()
+        filename = upload.filename or "upload.txt"
+        tmpdir = Path(tempfile.mkdtemp(prefix="poliverai_verify_temp_"))
+        temp_file = tmpdir / (Path(filename).name or "upload.txt")
+        temp_file.write_bytes(raw)
+        try:
+            texts.append(_extract_text(temp_file, Path(filename).suffix.lower(), raw))
+        finally:
+            try:
+                temp_file.unlink(missing_ok=True)
+                tmpdir.rmdir()
+            except Exception as e:
+                logging.warning(f"Failed to cleanup temp file: {e}")
+    text, previous_text = texts
+
+    effective_mode = _effective_mode(current_user, analysis_mode)
+    result = await run_in_threadpool(
+        reanalyze_policy,
+        text,
+        analysis_mode=effective_mode,
+        previous_analysis_id=previous_analysis_id,
+        previous_text=previous_text,
+    )
+
+    charges = _analysis_charges(current_user, effective_mode)
+    _apply_charges(current_user, charges)
+    if not charges and current_user:
+        _record_free_analysis(current_user, effective_mode)
+
+    return ReverifyResult(
+        **_to_compliance_result(result).model_dump(),
+        incremental=IncrementalStats(**result["incremental"]),
+    )
+
+
+# Batch verification: one job per submission, one pool task per document
+BATCH_EVENTS_POLL_SECONDS = 0.5
+BATCH_MAX_MEMBER_BYTES = 20 * 1024 * 1024  # Skip zip members larger than this (uncompressed)
+_batch_queue_state: JobQueue | None = None
+
+
+def _batch_queue() -> JobQueue:
+    global _batch_queue_state  # noqa: PLW0603
+    if _batch_queue_state is None:
+        s = get_settings()
+        _batch_queue_state = JobQueue(s.batch_verification_workers, s.batch_verification_max_jobs)
+    return _batch_queue_state
+
+
+def _expand_batch_uploads(
+    uploads: list[tuple[str, bytes]], max_documents: int, max_total_bytes: int
+) -> list[tuple[str, bytes]]:
+    """Flatten uploaded files, expanding .zip archives into their document members.
+
+    Raises HTTP 413 as soon as the submission exceeds ``max_documents`` or
+    ``max_total_bytes``; zip members are sized from their headers before any is read.
+    """
+    documents: list[tuple[str, bytes]] = []
+    total_bytes = 0
+
+    def _admit(size: int) -> None:
+        nonlocal total_bytes
+        total_bytes += size
+        if len(documents) >= max_documents:
+            raise HTTPException(status_code=413, detail=f"Too many documents; the limit is {max_documents}")
+        if total_bytes > max_total_bytes:
+            raise HTTPException(
+                status_code=413, detail=f"Submission too large; the limit is {max_total_bytes} bytes"
+            )
+
+    for filename, raw in uploads:
+        if Path(filename).suffix.lower() != ".zip":
+            _admit(len(raw))
+            documents.append((filename, raw))
+            continue
+        try:
+            with zipfile.ZipFile(io.BytesIO(raw)) as archive:
+                for info in archive.infolist():
+                    name = info.filename
+                    if info.is_dir() or name.startswith("__MACOSX/") or Path(name).name.startswith("."):
+                        continue
+                    if info.file_size > BATCH_MAX_MEMBER_BYTES:
+                        logging.warning("Skipping oversized zip member %s (%d bytes)", name, info.file_size)
+                        continue
+                    _admit(info.file_size)
+                    documents.append((f"{filename}/{name}", archive.read(info)))
+        except zipfile.BadZipFile as e:
+            raise HTTPException(status_code=400, detail=f"Invalid zip archive {filename}: {e}") from e
+    return documents
+
+
+def _verify_document(filename: str, raw: bytes, analysis_mode: str, current_user: User | None) -> dict:
+    """Analyze one batch document and bill it; runs on a batch worker thread."""
+    tmpdir = Path(tempfile.mkdtemp(prefix="poliverai_verify_temp_"))
+    temp_file = tmpdir / (Path(filename).name or "upload.txt")
+    temp_file.write_bytes(raw)
+    try:
+        text = _extract_text(temp_file, Path(filename).suffix.lower(), raw)
+    finally:
+        try:
+            temp_file.unlink(missing_ok=True)
+            tmpdir.rmdir()
+        except Exception as e:
+            logging.warning(f"Failed to cleanup temp file: {e}")
+    if not text.strip():
+        raise ValueError("No text could be extracted from the document")
+
+    # Other requests may have spent the credits since the batch was accepted:
+    # fail the document before analyzing it, not after
+    charges = _analysis_charges(current_user, analysis_mode)
+    _ensure_user_balance(current_user, sum(c for _, c in charges))
+    result = analyze_policy(text, analysis_mode=analysis_mode)
+    # Bill only documents that completed
+    _apply_charges(current_user, charges)
+    if not charges and current_user:
+        _record_free_analysis(current_user, analysis_mode)
+    return _to_compliance_result(result).model_dump()
+
+
+def _get_batch_job(job_id: str, current_user: User | None):
+    job = _batch_queue().get(job_id)
+    # Jobs submitted by a signed-in user are only visible to that user
+    if job is None or (job.owner and (current_user is None or current_user.email != job.owner)):
+        raise HTTPException(status_code=404, detail="Batch job not found")
+    return job
+
+
+@router.post("/verify-batch", status_code=status.HTTP_202_ACCEPTED)
+async def verify_batch(
+    files: list[UploadFile],
+    analysis_mode: str | None = Form(
+        "fast", description="Analysis mode: 'fast', 'balanced', or 'detailed'"
+    ),
+    current_user: User | None = CURRENT_USER_OPTIONAL_DEPENDENCY,
+) -> dict:
+    """Queue many documents (files and/or .zip archives) for verification.
+
+    Returns a job id; poll ``/verify-batch/{job_id}`` or stream
+    ``/verify-batch/{job_id}/events`` for progress and per-document results.
+    Each document is billed like a /verify analysis when it completes.
+    """
+    s = get_settings()
+    effective_mode = _effective_mode(current_user, analysis_mode)
+    uploads: list[tuple[str, bytes]] = []
+    uploaded_bytes = 0
+    for i, f in enumerate(files):
+        raw = await f.read()
+        uploaded_bytes += len(raw)
+        if uploaded_bytes > s.batch_verification_max_total_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Submission too large; the limit is {s.batch_verification_max_total_bytes} bytes",
+            )
+        uploads.append((f.filename or f"document-{i}.txt", raw))
+    documents = await run_in_threadpool(
+        _expand_batch_uploads, uploads, s.batch_verification_max_documents, s.batch_verification_max_total_bytes
     )
+    if not documents:
+        raise HTTPException(status_code=400, detail="No documents found in the submission")
+
+    # Refuse up front when the whole batch can't be paid for
+    per_document = sum(c for _, c in _analysis_charges(current_user, effective_mode))
+    _ensure_user_balance(current_user, per_document * len(documents))
+
+    job = _batch_queue().submit(
+        [name for name, _ in documents],
+        lambda i: _verify_document(documents[i][0], documents[i][1], effective_mode, current_user),
+        owner=current_user.email if current_user else None,
+        meta={"mode": effective_mode},
+    )
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "total": len(documents),
+        "mode": effective_mode,
+        "status_url": f"/api/v1/verify-batch/{job.id}",
+        "events_url": f"/api/v1/verify-batch/{job.id}/events",
+    }
+
+
+@router.get("/verify-batch/{job_id}")
+async def verify_batch_status(
+    job_id: str,
+    include_results: bool = True,
+    current_user: User | None = CURRENT_USER_OPTIONAL_DEPENDENCY,
+) -> dict:
+    """Progress of a batch job plus the results of finished documents."""
+    return _get_batch_job(job_id, current_user).snapshot(include_results)
 
 
+@router.get("/verify-batch/{job_id}/events")
+async def verify_batch_events(
+    job_id: str,
+    current_user: User | None = CURRENT_USER_OPTIONAL_DEPENDENCY,
+) -> StreamingResponse:
+    """SSE stream of per-document results as they finish, ending with a completed event."""
+    job = _get_batch_job(job_id, current_user)
+
+    async def event_stream() -> AsyncGenerator[str, None]:
+        sent: set[int] = set()
+        while True:
+            for item in job.items:
+                if item.index in sent or item.status not in (COMPLETED, FAILED):
+                    continue
+                sent.add(item.index)
+                event = "document_completed" if item.status == COMPLETED else "document_failed"
+                data = {"index": item.index, "name": item.name, "result": item.result, "error": item.error}
+                yield f"data: {json.dumps({'event': event, 'data': data})}\n\n"
+                progress = {"processed": len(sent), "total": len(job.items)}
+                yield f"data: {json.dumps({'event': 'progress', 'data': progress})}\n\n"
+            if len(sent) == len(job.items):
+                summary = job.snapshot(include_results=False)
+                yield f"data: {json.dumps({'event': 'completed', 'data': summary})}\n\n"
+                return
+            await asyncio.sleep(BATCH_EVENTS_POLL_SECONDS)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 
 @router.post("/verify-stream")
 async def verify_stream(
@@ -368,6 +719,9 @@ async def verify_stream(
     ),
     ingest: bool = Form(False, description="If true, ingest the uploaded file into the RAG store after analysis"),
     generate_report: bool = Form(False, description="If true, generate a PDF report after analysis"),
+    deadline_seconds: float | None = Form(
+        None, gt=0, description="Time budget in seconds; the best verdict reached by then is returned"
+    ),
     current_user: User | None = CURRENT_USER_OPTIONAL_DEPENDENCY,
 ) -> StreamingResponse:
     """Stream policy verification with real-time progress updates."""
@@ -380,7 +734,7 @@ async def verify_stream(
         file_ext = Path(filename).suffix.lower()
         # Create temporary file with proper extension
         tmpdir = Path(tempfile.mkdtemp(prefix="poliverai_verify_temp_"))
-        temp_file = tmpdir / f"upload{file_ext}"
+        temp_file = tmpdir / (Path(filename).name or f"upload{file_ext}")
         temp_file.write_bytes(raw)
         try:
             # Extract text based on file type
@@ -520,7 +874,9 @@ async def verify_stream(
 
         # Start analysis in background and stream queue items
         task = asyncio.create_task(
-            analyze_policy_stream(text, analysis_mode=effective_mode, progress_cb=progress_cb)
+            analyze_policy_stream(
+                text, analysis_mode=effective_mode, progress_cb=progress_cb, deadline_seconds=deadline_seconds
+            )
         )
 
         # Finalizer watches the analysis task, applies charges and emits
@@ -544,9 +900,11 @@ async def verify_stream(
             if ingest:
                 try:
                     await q.put({"event": "ingest_started", "data": {}})
-                    from ....rag.service import ingest_paths
+                    from ....rag.service import ingest_paths, upload_source_id
 
-                    stats = ingest_paths([str(temp_file)])
+                    owner = current_user.id if current_user else None
+                    source = upload_source_id(owner, temp_file.name, raw)
+                    stats = ingest_paths([str(temp_file)], sources={str(temp_file): source})
                     await q.put({"event": "ingest_completed", "data": stats})
                 except Exception as e:
                     await q.put({"event": "ingest_failed", "data": {"message": str(e)}})
@@ -12,6 +12,17 @@ def main() -> None:
 
     ingest = sub.add_parser("ingest", help="Ingest one or more files into the RAG store")
     ingest.add_argument("paths", nargs="+", help="File paths to ingest (.txt/.md/.pdf/.docx/.html)")
+    ingest.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Pipeline extraction, batched embedding and bulk upserts across files",
+    )
+    ingest.add_argument(
+        "--workers", type=int, default=None, help="Extraction process pool size (parallel mode)"
+    )
+    ingest.add_argument(
+        "--force", action="store_true", help="Re-process files even if their content is unchanged"
+    )
 
     args = parser.parse_args()
 
@@ -23,7 +34,7 @@ def main() -> None:
         from ..rag.service import ingest_paths
 
         paths = [str(Path(p)) for p in args.paths]
-        stats = ingest_paths(paths)
+        stats = ingest_paths(paths, parallel=args.parallel, workers=args.workers, force=args.force)
         print(stats)
     else:
         parser.print_help()
@@ -112,3 +112,23 @@ def upload_chroma_on_shutdown() -> None:
             _gcs_upload_persist(gcs_bucket, gcs_object, settings.chroma_persist_dir)
     except Exception as e:
         logging.warning("Failed to upload chroma persist on shutdown: %s", e)
+
+
+@app.on_event("shutdown")
+async def close_llm_client() -> None:
+    try:
+        from ..rag.llm import aclose
+
+        await aclose()
+    except Exception as e:
+        logging.warning("Failed to close async OpenAI client: %s", e)
+
+
+@app.on_event("shutdown")
+def stop_shard_pool() -> None:
+    try:
+        from ..rag.verification import shutdown_shard_pool
+
+        shutdown_shard_pool()
+    except Exception as e:
+        logging.warning("Failed to stop full-analysis worker pool: %s", e)
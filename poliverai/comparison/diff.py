@@ -1,3 +1,121 @@
+"""Clause alignment between two versions of a policy.
+
+Identical clauses (ignoring case and whitespace) are paired by hash. The
+remaining clauses are paired by MinHash signatures over word shingles with
+LSH banding, so only clauses that share a band bucket are ever compared and
+alignment stays near-linear in the number of clauses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..preprocessing.segment import split_into_paragraphs
+
+NUM_PERM = 64
+BANDS = 16  # 4 rows per band: pairs above ~0.5 Jaccard almost always collide
+SHINGLE_SIZE = 3
+MODIFIED_THRESHOLD = 0.5  # Estimated Jaccard needed to call a clause "modified" rather than added/removed
+_PRIME = (1 << 31) - 1
+
+_rng = np.random.default_rng(20250101)
+_PERM_A = _rng.integers(1, _PRIME, NUM_PERM, dtype=np.int64)
+_PERM_B = _rng.integers(0, _PRIME, NUM_PERM, dtype=np.int64)
+
+
+@dataclass
+class ClauseAlignment:
+    """Index pairs into the draft/final clause lists."""
+
+    unchanged: list[tuple[int, int]] = field(default_factory=list)
+    modified: list[tuple[int, int, float]] = field(default_factory=list)  # (draft, final, similarity)
+    removed: list[int] = field(default_factory=list)  # draft-only
+    added: list[int] = field(default_factory=list)  # final-only
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _shingles(text: str) -> set[str]:
+    words = _normalize(text).split()
+    if len(words) < SHINGLE_SIZE:
+        return {" ".join(words)}
+    return {" ".join(words[i : i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """``NUM_PERM`` min-hashes of the clause's word shingles."""
+    values = np.array(
+        [int.from_bytes(hashlib.blake2b(sh.encode("utf-8"), digest_size=4).digest(), "little") for sh in _shingles(text)],
+        dtype=np.int64,
+    ) % _PRIME
+    # (a * x + b) mod p for every permutation and shingle; products stay below 2**62
+    return ((_PERM_A[:, None] * values[None, :] + _PERM_B[:, None]) % _PRIME).min(axis=1)
+
+
+def align_clauses(draft: list[str], final: list[str], threshold: float = MODIFIED_THRESHOLD) -> ClauseAlignment:
+    """Pair draft clauses with final clauses: exact matches first, then near-duplicates."""
+    out = ClauseAlignment()
+
+    # Exact matches by normalized hash (duplicates pair up in document order)
+    final_by_key: dict[str, list[int]] = {}
+    for j, clause in enumerate(final):
+        final_by_key.setdefault(_normalize(clause), []).append(j)
+    draft_left: list[int] = []
+    for i, clause in enumerate(draft):
+        slots = final_by_key.get(_normalize(clause))
+        if slots:
+            out.unchanged.append((i, slots.pop(0)))
+        else:
+            draft_left.append(i)
+    paired_final = {j for _, j in out.unchanged}
+    final_left = [j for j in range(len(final)) if j not in paired_final]
+
+    # Near-duplicates among the rest via LSH buckets
+    if draft_left and final_left:
+        draft_sigs = {i: minhash_signature(draft[i]) for i in draft_left}
+        final_sigs = {j: minhash_signature(final[j]) for j in final_left}
+        rows = NUM_PERM // BANDS
+        buckets: dict[tuple[int, bytes], list[int]] = {}
+        for j, sig in final_sigs.items():
+            for band in range(BANDS):
+                buckets.setdefault((band, sig[band * rows : (band + 1) * rows].tobytes()), []).append(j)
+        candidates: list[tuple[float, int, int]] = []
+        for i, sig in draft_sigs.items():
+            seen: set[int] = set()
+            for band in range(BANDS):
+                for j in buckets.get((band, sig[band * rows : (band + 1) * rows].tobytes()), ()):
+                    if j in seen:
+                        continue
+                    seen.add(j)
+                    similarity = float(np.mean(sig == final_sigs[j]))
+                    if similarity >= threshold:
+                        candidates.append((similarity, i, j))
+        # Greedy one-to-one assignment, most similar pairs first
+        used_draft: set[int] = set()
+        used_final: set[int] = set()
+        for similarity, i, j in sorted(candidates, key=lambda c: (-c[0], c[1], c[2])):
+            if i not in used_draft and j not in used_final:
+                used_draft.add(i)
+                used_final.add(j)
+                out.modified.append((i, j, round(similarity, 3)))
+        out.modified.sort()
+        draft_left = [i for i in draft_left if i not in used_draft]
+        final_left = [j for j in final_left if j not in used_final]
+
+    out.removed = draft_left
+    out.added = final_left
+    return out
+
+
 def side_by_side_diff(a: str, b: str) -> str:
-    # Placeholder diff summary
-    return "This is a placeholder diff summary."
+    """One-line summary of clause-level changes from ``a`` to ``b``."""
+    alignment = align_clauses([c.text for c in split_into_paragraphs(a)], [c.text for c in split_into_paragraphs(b)])
+    return (
+        f"{len(alignment.unchanged)} unchanged, {len(alignment.modified)} modified, "
+        f"{len(alignment.added)} added, {len(alignment.removed)} removed clauses."
+    )
@@ -1,4 +1,35 @@
+from typing import Any
+
+
 def compare_scores(a_score: int, b_score: int) -> str:
     if a_score == b_score:
         return "equal"
     return "a" if a_score > b_score else "b"
+
+
+def article_deltas(draft_articles: dict[str, Any], final_articles: dict[str, Any]) -> list[dict[str, Any]]:
+    """Per-article change from draft to final.
+
+    Inputs are the ``articles`` field of an analysis result
+    (``{"violations": {article: n}, "fulfills": {article: n}}``). An article's
+    net score is fulfills minus violations; ``delta`` > 0 means the final
+    version improved on it. Sorted by largest change first.
+    """
+    dv, df = draft_articles.get("violations", {}), draft_articles.get("fulfills", {})
+    fv, ff = final_articles.get("violations", {}), final_articles.get("fulfills", {})
+    out = []
+    for article in sorted({*dv, *df, *fv, *ff}):
+        draft_net = df.get(article, 0) - dv.get(article, 0)
+        final_net = ff.get(article, 0) - fv.get(article, 0)
+        out.append(
+            {
+                "article": article,
+                "draft_violations": dv.get(article, 0),
+                "final_violations": fv.get(article, 0),
+                "draft_fulfills": df.get(article, 0),
+                "final_fulfills": ff.get(article, 0),
+                "delta": final_net - draft_net,
+            }
+        )
+    out.sort(key=lambda d: -abs(d["delta"]))
+    return out
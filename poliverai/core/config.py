@@ -10,6 +10,9 @@ class Settings(BaseSettings):
     # RAG settings
     chroma_persist_dir: str = "data/chroma"
     chroma_collection: str = "poliverai"
+    # Vector store backend: "chroma", or "numpy"/"faiss" for the flat memory-mapped
+    # index stored under <chroma_persist_dir>/<chroma_collection>.vectors
+    vector_backend: str = "chroma"
 
     # OpenAI configuration (do not log values)
     openai_api_key: str | None = None
@@ -17,11 +20,89 @@ class Settings(BaseSettings):
     openai_chat_model: str = "gpt-4o-mini"
     openai_embedding_model: str = "text-embedding-3-small"
 
+    # Async OpenAI client used by the API routes: HTTP pool, timeouts and
+    # concurrency limits (global, and per route name: query/verify/reports/embeddings)
+    llm_max_connections: int = 100
+    llm_max_keepalive_connections: int = 20
+    llm_timeout_seconds: float = 60.0
+    llm_connect_timeout_seconds: float = 5.0
+    llm_max_retries: int = 2
+    llm_max_concurrency: int = 16
+    llm_route_concurrency: dict[str, int] = {"query": 8, "verify": 8, "reports": 2, "embeddings": 4}
+
+    # Clause judging in balanced/detailed verification: concurrent LLM calls
+    # and the wall-clock budget for each clause (retrieval + judgment)
+    verification_llm_concurrency: int = 5
+    verification_clause_timeout_seconds: float = 20.0
+    # Batched judging: many clauses per completion, split by prompt token budget.
+    # In detailed mode this judges every eligible clause, not just the top few.
+    verification_batch_judging: bool = False
+    verification_batch_max_clauses: int = 10
+    verification_batch_token_budget: int = 6000
+    # Judging cascade: cheaper chat models tried in order before openai_chat_model,
+    # each mapped to the confidence its judgments need to stand. Clauses judged to
+    # touch a critical article always escalate. Empty = openai_chat_model only.
+    verification_cascade_tiers: dict[str, float] = {}
+
+    # Persistent cache of LLM clause judgments, keyed on the normalized clause,
+    # chat model, judge prompt version and the retrieved context chunk ids
+    judgment_cache_enabled: bool = True
+    judgment_cache_path: str = "data/cache/judgments.sqlite3"
+    judgment_cache_max_entries: int = 100_000
+
+    # Whole-document verification results keyed by content hash, analysis mode
+    # and rules/prompt version; set a path to share them across workers
+    verification_cache_enabled: bool = True
+    verification_cache_ttl_seconds: float = 86_400.0
+    verification_cache_max_entries: int = 256
+    verification_cache_path: str | None = "data/cache/verification.sqlite3"
+
+    # Per-clause judgments of past analyses, reused by incremental re-verification
+    analysis_records_enabled: bool = True
+    analysis_records_path: str = "data/cache/analyses.sqlite3"
+    analysis_records_max_entries: int = 10_000
+
+    # Batch verification (/verify-batch): worker threads shared by all batch jobs,
+    # documents and total (uncompressed) bytes accepted per submission, and
+    # finished jobs kept for polling
+    batch_verification_workers: int = 4
+    batch_verification_max_documents: int = 500
+    batch_verification_max_total_bytes: int = 200 * 1024 * 1024
+    batch_verification_max_jobs: int = 100
+
+    # Full-coverage analysis of long documents (/verify full_coverage): clauses
+    # are split into shards of this many clauses, analyzed on a process pool
+    full_analysis_shard_clauses: int = 50
+    full_analysis_workers: int = 4
+
     # Chunking/retrieval
     chunk_size_tokens: int = 300
     chunk_overlap_tokens: int = 80
     top_k: int = 5
 
+    # Ingest pipeline (parallel mode)
+    ingest_workers: int = 4  # process pool size for text extraction
+    embedding_batch_size: int = 128  # max texts per embedding request
+    embedding_concurrency: int = 4  # max embedding requests in flight
+    upsert_batch_size: int = 1000  # max records per Chroma upsert
+
+    # Persistent embedding cache shared by all workers (kept outside the Chroma
+    # persist dir, which is replaced wholesale on GCS sync)
+    embedding_cache_enabled: bool = True
+    embedding_cache_path: str = "data/cache/embeddings.sqlite3"
+    embedding_cache_max_entries: int = 200_000
+
+    # Answer cache for /query: in-process LRU plus an optional SQLite file shared
+    # by all workers (set answer_cache_path to enable the shared layer)
+    answer_cache_enabled: bool = True
+    answer_cache_ttl_seconds: float = 3600.0
+    answer_cache_max_entries: int = 1024
+    answer_cache_path: str | None = None
+
+    # In-process LRU caches for retrieval (0 disables)
+    query_embedding_cache_size: int = 4096
+    retrieval_cache_size: int = 1024
+
     # GCS configuration (optional)
     gcs_bucket: str | None = None
     chroma_gcs_bucket: str | None = None
@@ -33,6 +114,9 @@ class Settings(BaseSettings):
     retrieval_vector_weight: float = 1.0
     retrieval_lexical_weight: float = 0.3
     retrieval_article_boost: float = 0.15
+    # BM25 lexical index (persisted next to the vector store) used for lexical
+    # scoring and as a sparse retriever fused with vector hits
+    bm25_enabled: bool = True
 
     # Ignore unknown keys in .env to remain compatible with older configs
     model_config = SettingsConfigDict(env_file=".env", env_prefix="POLIVERAI_", extra="ignore")
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from .readers.docx_reader import read_docx_text
+from .readers.html_reader import read_html_text
+from .readers.pdf_reader import read_pdf_text
+
+SUPPORTED_EXTENSIONS = {".txt", ".md", ".pdf", ".docx", ".html", ".htm"}
+
+
+def _read_text_file(path: str) -> str:
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+def extract_text(path: str) -> str:
+    """Extract plain text from a supported file based on its extension."""
+    ext = Path(path).suffix.lower()
+    if ext in {".txt", ".md"}:
+        return _read_text_file(path)
+    if ext == ".pdf":
+        return read_pdf_text(path)
+    if ext == ".docx":
+        return read_docx_text(path)
+    return read_html_text(path)
+
+
+def extract_text_task(path: str) -> tuple[str, str | None, str | None, float]:
+    """Process-pool friendly wrapper around extract_text.
+
+    Never raises; returns (path, text, error, elapsed_seconds) so a single bad
+    file cannot tear down the pool.
+    """
+    start = time.perf_counter()
+    try:
+        text = extract_text(path)
+    except Exception as e:
+        return path, None, f"error: {e}", time.perf_counter() - start
+    return path, text, None, time.perf_counter() - start
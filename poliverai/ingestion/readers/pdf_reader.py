@@ -1,11 +1,17 @@
+from collections.abc import Iterator
+
 import pdfplumber
 
 
-def read_pdf_text(path: str) -> str:
-    text_parts: list[str] = []
+def iter_pdf_pages(path: str) -> Iterator[str]:
+    """Text of each non-empty page, extracted one page at a time."""
     with pdfplumber.open(path) as pdf:
         for page in pdf.pages:
             txt: str | None = page.extract_text()  # type: ignore[assignment]
             if txt:
-                text_parts.append(txt)
-    return "\n".join(text_parts)
+                yield txt
+
+
+def read_pdf_text(path: str) -> str:
+    # Pages are joined with "\n"; preprocessing.segment.iter_clauses reads iter_pdf_pages the same way
+    return "\n".join(iter_pdf_pages(path))
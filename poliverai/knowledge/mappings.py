@@ -1,13 +1,22 @@
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
+
+# Placeholder keyword mapping: the first row with a keyword present wins
+REQUIREMENT_KEYWORDS: tuple[tuple[tuple[str, ...], tuple[str, ...]], ...] = (
+    (("retention",), ("Article 5(1)(e)",)),
+    (("erasure", "deletion"), ("Article 17",)),
+    (("lawful", "consent"), ("Article 6",)),
+)
+MAPPING_KEYWORDS: tuple[str, ...] = tuple(k for keywords, _ in REQUIREMENT_KEYWORDS for k in keywords)
+
+
+def articles_for_keywords(found: Collection[str]) -> list[str]:
+    """Articles for a set of lowercase keywords already found in a text."""
+    for keywords, articles in REQUIREMENT_KEYWORDS:
+        if any(k in found for k in keywords):
+            return list(articles)
+    return []
 
 
 def map_requirement_to_articles(requirement: str) -> Iterable[str]:
-    # Placeholder keyword mapping
     req = requirement.lower()
-    if "retention" in req:
-        return ["Article 5(1)(e)"]
-    if "erasure" in req or "deletion" in req:
-        return ["Article 17"]
-    if "lawful" in req or "consent" in req:
-        return ["Article 6"]
-    return []
+    return articles_for_keywords([k for k in MAPPING_KEYWORDS if k in req])
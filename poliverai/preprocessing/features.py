@@ -0,0 +1,107 @@
+"""Per-clause features computed once, right after segmentation.
+
+Every analysis mode needs the same facts about a clause: its word count,
+lowercase form, which sensitive-processing keywords it mentions, which
+articles its keywords map to, and a hash identifying it across documents.
+``extract_clause_features`` lowercases and splits each clause once and scans
+the lowercase form once for all keywords, so later stages never redo it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from ..knowledge.mappings import MAPPING_KEYWORDS, articles_for_keywords
+
+# Sensitive keywords that indicate clauses requiring detailed LLM analysis in balanced mode
+SENSITIVE_KEYWORDS = (
+    "collect",
+    "automatically",
+    "automatic",
+    "share",
+    "sharing",
+    "third-party",
+    "third party",
+    "retain",
+    "retention",
+    "store",
+    "storage",
+    "transfer",
+    "process",
+    "processing",
+    "consent",
+    "lawful basis",
+    "legal basis",
+    "children",
+    "minor",
+    "cookie",
+    "tracking",
+    "location",
+    "biometric",
+    "sensitive",
+    "special category",
+    "delete",
+    "deletion",
+    "erasure",
+    "right to be forgotten",
+    "profiling",
+    "automated decision",
+)
+_KEYWORDS = tuple(dict.fromkeys(SENSITIVE_KEYWORDS + MAPPING_KEYWORDS))
+_SENSITIVE = frozenset(SENSITIVE_KEYWORDS)
+
+
+@dataclass(frozen=True)
+class ClauseFeatures:
+    text: str
+    lower: str
+    word_count: int
+    hash: str  # sha256 of the case- and whitespace-normalized text
+    sensitive_terms: tuple[str, ...]
+    articles: tuple[str, ...]  # from the keyword mapping
+
+    @property
+    def sensitive(self) -> bool:
+        return bool(self.sensitive_terms)
+
+
+def clause_hash(text: str) -> str:
+    """Identity of a clause for caching and re-verification (ignores case and whitespace)."""
+    return _hash_words(text.lower().split())
+
+
+def _hash_words(words: list[str]) -> str:
+    return hashlib.sha256(" ".join(words).encode("utf-8")).hexdigest()
+
+
+def clause_features(text: str) -> ClauseFeatures:
+    lower = text.lower()
+    words = lower.split()
+    found = [k for k in _KEYWORDS if k in lower]
+    return ClauseFeatures(
+        text=text,
+        lower=lower,
+        word_count=len(words),
+        hash=_hash_words(words),
+        sensitive_terms=tuple(k for k in found if k in _SENSITIVE),
+        articles=tuple(articles_for_keywords(found)),
+    )
+
+
+def extract_clause_features(
+    texts: Iterable[str], min_words: int = 0, limit: int | None = None
+) -> list[ClauseFeatures]:
+    """Features for clauses of at least ``min_words`` words, keeping the first ``limit``."""
+    out: list[ClauseFeatures] = []
+    if limit is not None and limit <= 0:
+        return out
+    for text in texts:
+        features = clause_features(text)
+        if features.word_count >= min_words:
+            out.append(features)
+            # Stop pulling from a lazy source as soon as the budget is met
+            if limit is not None and len(out) >= limit:
+                break
+    return out
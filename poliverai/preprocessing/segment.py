@@ -1,5 +1,16 @@
+"""Split policy text into clauses.
+
+``iter_clauses`` is a streaming segmenter: it reads the text (or its pages)
+line by line and yields ``Clause`` objects with source offsets as soon as
+they are complete, so callers that only need the first N clauses stop
+reading early. Two layouts are recognised, as before: paragraphs separated
+by blank lines, and (for PDFs and other single-newline text) paragraphs
+rebuilt from sentence endings and header-like lines.
+"""
+
 import re
-from collections.abc import Iterable
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
 
 from ..domain.models import Clause
 
@@ -8,68 +19,174 @@ MAX_HEADER_LENGTH = 80
 MAX_CAPS_HEADER_LENGTH = 50
 MIN_MEANINGFUL_WORDS = 5
 MAX_SINGLE_PARAGRAPH_LENGTH = 500
+# Text read before the layout is known is held back; past this many characters
+# without a second blank-line paragraph the text is segmented by lines
+MAX_PENDING_CHARS = 64_000
+
+_SECTION_SPLIT = re.compile(r"(?<=\.) (?=[A-Z][a-zA-Z ]{10,})")
 
 
 def split_into_paragraphs(text: str) -> list[Clause]:
-    # First try standard double newline separation
-    if "\n\n" in text:
-        paragraphs: Iterable[str] = (p.strip() for p in text.split("\n\n"))
-        clauses = [Clause(text=p) for p in paragraphs if p]
-        if len(clauses) > 1:
-            return clauses
-
-    # For PDFs and other formats with single newlines, use smarter segmentation
-    lines = text.split("\n")
-    paragraphs = []
-    current_paragraph = []
-
-    for original_line in lines:
+    return list(iter_clauses(text, max_pending_chars=None))
+
+
+def iter_clauses(
+    source: str | Iterable[str], max_pending_chars: int | None = MAX_PENDING_CHARS
+) -> Iterator[Clause]:
+    """Yield clauses of ``source`` in document order.
+
+    ``source`` is the whole text or an iterable of pages, which are read as if
+    joined with "\\n" (as the PDF reader joins them); ``start``/``end`` index
+    into that joined text and span the clause's first to last character.
+    Without ``max_pending_chars`` the clauses are exactly those of reading the
+    whole text at once; with it, memory stays bounded by the largest paragraph.
+    """
+    blocks = _BlockSegmenter()
+    lines = _LineSegmenter()
+    layout: str | None = None  # "blocks" or "lines" once known
+    pending_chars = 0
+    block_held: list[Clause] = []  # blank-line clauses not yet yielded
+    held: list[Clause] = []  # line-layout clauses not yet yielded
+    streaming_lines = False
+
+    for offset, line in _iter_lines(source):
+        if layout != "lines":
+            block_held.extend(blocks.feed(offset, line))
+            if layout is None and blocks.started > 1:
+                layout = "blocks"
+                held.clear()
+            if layout == "blocks":
+                yield from block_held
+                block_held.clear()
+                continue
+            pending_chars += len(line) + 1
+            if max_pending_chars is not None and pending_chars > max_pending_chars:
+                layout = "lines"
+                blocks, block_held = _BlockSegmenter(), []  # drop the held-back paragraph
+        held.extend(lines.feed(offset, line))
+        # A lone paragraph may still be re-split at the end, so line-layout
+        # output starts once there are two of them
+        if layout == "lines" and (streaming_lines or len(held) > 1):
+            streaming_lines = True
+            yield from held
+            held.clear()
+
+    if layout == "blocks":
+        yield from block_held + blocks.finish()
+        return
+    held.extend(lines.finish())
+    if not streaming_lines and len(held) == 1 and len(held[0].text) > MAX_SINGLE_PARAGRAPH_LENGTH:
+        held = lines.split_sections(held[0])
+    yield from held
+
+
+def _iter_lines(source: str | Iterable[str]) -> Iterator[tuple[int, str]]:
+    """``(offset, line)`` for each "\\n"-separated line of the joined pages."""
+    pages = (source,) if isinstance(source, str) else source
+    rest, rest_start = "", 0
+    for page_no, page in enumerate(pages):
+        buf = rest + ("\n" if page_no else "") + page
+        pos = 0
+        while (nl := buf.find("\n", pos)) != -1:
+            yield rest_start + pos, buf[pos:nl]
+            pos = nl + 1
+        rest, rest_start = buf[pos:], rest_start + pos
+    yield rest_start, rest
+
+
+class _BlockSegmenter:
+    """Paragraphs separated by blank lines (an empty line, i.e. "\\n\\n")."""
+
+    def __init__(self) -> None:
+        self.started = 0  # non-empty paragraphs seen so far
+        self._lines: list[tuple[int, str]] = []
+        self._content = False
+
+    def feed(self, offset: int, line: str) -> list[Clause]:
+        if line == "":
+            return self.finish()
+        if not self._content and line.strip():
+            self._content = True
+            self.started += 1
+        self._lines.append((offset, line))
+        return []
+
+    def finish(self) -> list[Clause]:
+        lines, content = self._lines, self._content
+        self._lines, self._content = [], False
+        if not content:
+            return []
+        text = "\n".join(line for _, line in lines).strip()
+        first = next((off, line) for off, line in lines if line.strip())
+        last = next((off, line) for off, line in reversed(lines) if line.strip())
+        start = first[0] + len(first[1]) - len(first[1].lstrip())
+        return [Clause(text=text, start=start, end=last[0] + len(last[1].rstrip()))]
+
+
+class _LineSegmenter:
+    """Paragraphs rebuilt from single lines: sentence endings and headers close them."""
+
+    def __init__(self) -> None:
+        self._parts: list[tuple[int, str]] = []  # (source offset, stripped line)
+        self._last_parts: list[tuple[int, str]] = []  # lines of the last paragraph returned
+
+    def feed(self, offset: int, original_line: str) -> list[Clause]:
         line = original_line.strip()
         if not line:
             # Empty line - end current paragraph if it has content
-            if current_paragraph:
-                paragraphs.append(" ".join(current_paragraph))
-                current_paragraph = []
-        elif (
+            return self.finish()
+        start = offset + len(original_line) - len(original_line.lstrip())
+        if (
             # New paragraph indicators
-            line.endswith("?")
-            or line.endswith(".")
-            or line.endswith("!")
+            line.endswith(("?", ".", "!"))
             or
             # Headers or section titles (short lines)
-            (len(line) < MAX_HEADER_LENGTH and not current_paragraph)
+            (len(line) < MAX_HEADER_LENGTH and not self._parts)
             or
             # Lines that look like headers (all caps, short)
             (line.isupper() and len(line) < MAX_CAPS_HEADER_LENGTH)
         ):
-            current_paragraph.append(line)
+            self._parts.append((start, line))
             # End paragraph on sentence endings or headers
-            if line.endswith((".", "?", "!")) or (
-                line.isupper() and len(line) < MAX_CAPS_HEADER_LENGTH
-            ):
-                paragraphs.append(" ".join(current_paragraph))
-                current_paragraph = []
-        else:
-            current_paragraph.append(line)
-
-    # Add any remaining content
-    if current_paragraph:
-        paragraphs.append(" ".join(current_paragraph))
-
-    # Filter out very short paragraphs (less than 5 words) and create clauses
-    meaningful_paragraphs = [p for p in paragraphs if len(p.split()) >= MIN_MEANINGFUL_WORDS]
-
-    # If we still have just one large paragraph, try to split by sentence patterns
-    if (
-        len(meaningful_paragraphs) == 1
-        and len(meaningful_paragraphs[0]) > MAX_SINGLE_PARAGRAPH_LENGTH
-    ):
-        # Split by common section patterns in policies
-        text_to_split = meaningful_paragraphs[0]
-        sentence_splits = re.split(r"(?<=\.) (?=[A-Z][a-zA-Z ]{10,})", text_to_split)
-        if len(sentence_splits) > 1:
-            meaningful_paragraphs = [
-                s.strip() for s in sentence_splits if len(s.split()) >= MIN_MEANINGFUL_WORDS
-            ]
-
-    return [Clause(text=p) for p in meaningful_paragraphs if p]
+            if line.endswith((".", "?", "!")) or (line.isupper() and len(line) < MAX_CAPS_HEADER_LENGTH):
+                return self.finish()
+            return []
+        self._parts.append((start, line))
+        return []
+
+    def finish(self) -> list[Clause]:
+        parts, self._parts = self._parts, []
+        if not parts:
+            return []
+        text = " ".join(line for _, line in parts)
+        # Filter out very short paragraphs (less than 5 words)
+        if len(text.split()) < MIN_MEANINGFUL_WORDS:
+            return []
+        self._last_parts = parts
+        return [Clause(text=text, start=parts[0][0], end=parts[-1][0] + len(parts[-1][1]))]
+
+    def split_sections(self, clause: Clause) -> list[Clause]:
+        """Split the document's only paragraph by common section patterns in policies."""
+        pieces = _SECTION_SPLIT.split(clause.text)
+        if len(pieces) <= 1:
+            return [clause]
+        # Map offsets in the joined paragraph back to the source lines
+        parts = self._last_parts
+        joined_starts, pos = [], 0
+        for _, line in parts:
+            joined_starts.append(pos)
+            pos += len(line) + 1
+
+        def to_source(i: int) -> int:
+            k = bisect_right(joined_starts, i) - 1
+            return parts[k][0] + i - joined_starts[k]
+
+        out, pos = [], 0
+        for piece in pieces:
+            begin = clause.text.index(piece, pos)
+            pos = begin + len(piece)
+            text = piece.strip()
+            if len(text.split()) >= MIN_MEANINGFUL_WORDS:
+                begin += len(piece) - len(piece.lstrip())
+                out.append(Clause(text=text, start=to_source(begin), end=to_source(begin + len(text) - 1) + 1))
+        return out
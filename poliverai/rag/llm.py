@@ -0,0 +1,101 @@
+"""Async OpenAI client layer shared by the API routes.
+
+One ``AsyncOpenAI`` client per event loop, backed by an explicitly sized httpx
+connection pool, plus a global semaphore and one semaphore per route so a
+burst on one endpoint (e.g. /verify) cannot starve the others. Loop-bound
+objects are created lazily on first use inside the running loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from openai import AsyncOpenAI
+
+from ..core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _LoopState:
+    client: AsyncOpenAI
+    global_slots: asyncio.Semaphore
+    route_slots: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+_states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = weakref.WeakKeyDictionary()
+
+
+def _state() -> _LoopState:
+    loop = asyncio.get_running_loop()
+    state = _states.get(loop)
+    if state is None:
+        s = get_settings()
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=s.llm_max_connections,
+                max_keepalive_connections=s.llm_max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(s.llm_timeout_seconds, connect=s.llm_connect_timeout_seconds),
+        )
+        kwargs: dict[str, Any] = {"http_client": http_client, "max_retries": s.llm_max_retries}
+        if s.openai_api_key:
+            kwargs["api_key"] = s.openai_api_key
+        if s.openai_base_url:
+            kwargs["base_url"] = s.openai_base_url
+        state = _LoopState(
+            client=AsyncOpenAI(**kwargs),
+            global_slots=asyncio.Semaphore(max(1, s.llm_max_concurrency)),
+        )
+        _states[loop] = state
+    return state
+
+
+def async_client() -> AsyncOpenAI:
+    """The pooled async client for the running event loop."""
+    return _state().client
+
+
+@asynccontextmanager
+async def llm_slot(route: str) -> AsyncIterator[AsyncOpenAI]:
+    """Hold a global and a per-route concurrency slot for the duration of one call.
+
+    Routes without an entry in ``llm_route_concurrency`` share only the global limit.
+    """
+    state = _state()
+    route_slots = state.route_slots.get(route)
+    if route_slots is None:
+        limit = get_settings().llm_route_concurrency.get(route)
+        if limit:
+            route_slots = state.route_slots.setdefault(route, asyncio.Semaphore(max(1, limit)))
+    # Route slot first: calls queued behind a saturated route must not hold global slots
+    async with route_slots or nullcontext(), state.global_slots:
+        yield state.client
+
+
+async def chat_completion(route: str, **kwargs: Any) -> Any:
+    """``chat.completions.create`` under the route's concurrency limits."""
+    async with llm_slot(route) as client:
+        return await client.chat.completions.create(**kwargs)
+
+
+async def create_embeddings(route: str, **kwargs: Any) -> Any:
+    """``embeddings.create`` under the route's concurrency limits."""
+    async with llm_slot(route) as client:
+        return await client.embeddings.create(**kwargs)
+
+
+async def aclose() -> None:
+    """Close the client bound to the running loop (call on application shutdown)."""
+    loop = asyncio.get_running_loop()
+    state = _states.pop(loop, None)
+    if state is not None:
+        await state.client.close()
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
+import multiprocessing
 import os
 import re
+import time
+from array import array
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Optional
 import tiktoken
 
 # chromadb is optional at runtime; lazy-importing reduces build-time deps for dev
@@ -24,6 +39,7 @@ import shutil
 from typing import Optional
 
 import chromadb
+import numpy as np
 import tiktoken
 from chromadb.api.models.Collection import Collection
 from openai import OpenAI
@@ -35,13 +51,17 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     storage = None
 
-from ..core.config import get_settings
-from ..ingestion.readers.docx_reader import read_docx_text
-from ..ingestion.readers.html_reader import read_html_text
-from ..ingestion.readers.pdf_reader import read_pdf_text
+from ..core.config import Settings, get_settings
+from ..ingestion.extract import SUPPORTED_EXTENSIONS, extract_text, extract_text_task
 from ..knowledge.mappings import map_requirement_to_articles
+from ..retrieval.bm25 import BM25Index
+from ..services.cache import DiskLRUCache, MemoryLRUCache, TTLCache
+
+if TYPE_CHECKING:
+    from ..retrieval.vector_store import VectorCollection
 
 # Constants
+ENCODING_NAME = "cl100k_base"
 LARGE_DISTANCE_VALUE = 1e9
 MAX_LINE_LENGTH_FOR_TITLE = 150
 MAX_TITLE_LENGTH = 100
@@ -51,7 +71,7 @@ MAX_LINES_TO_CHECK_FOR_TITLE = 5
 
 @dataclass
 class RAGInit:
-    collection: Optional[Collection]
+    collection: Optional[Collection | VectorCollection]
     client: OpenAI
     enc_name: str
 
@@ -66,6 +86,20 @@ def _ensure_dirs(path: str) -> None:
 _rag_state: RAGInit | None = None
 
 
+def _open_collection(settings: Settings) -> Collection | VectorCollection:
+    """Open the configured vector store; both backends expose the same collection API."""
+    backend = settings.vector_backend.lower()
+    if backend in {"numpy", "faiss"}:
+        from ..retrieval.vector_store import NumpyVectorCollection
+
+        path = Path(settings.chroma_persist_dir) / f"{settings.chroma_collection}.vectors"
+        return NumpyVectorCollection(path, use_faiss=backend == "faiss")
+    if backend != "chroma":
+        logger.warning("Unknown vector backend %r; using chroma", settings.vector_backend)
+    client = chromadb.PersistentClient(path=settings.chroma_persist_dir)
+    return client.get_or_create_collection(name=settings.chroma_collection)
+
+
 def _init() -> RAGInit:
     # Access global state - this is necessary for singleton pattern
     global _rag_state  # noqa: PLW0603
@@ -93,8 +127,7 @@ def _init() -> RAGInit:
     elif gcs_bucket and storage is None:
         logger.warning("POLIVERAI_CHROMA_GCS_BUCKET set but google-cloud-storage not installed")
 
-    client = chromadb.PersistentClient(path=settings.chroma_persist_dir)
-    collection = client.get_or_create_collection(name=settings.chroma_collection)
+    collection = _open_collection(settings)
 
     # OpenAI client
     if not settings.openai_api_key:
@@ -108,20 +141,24 @@ def _init() -> RAGInit:
         oa_kwargs["base_url"] = settings.openai_base_url
     oa_client = OpenAI(**oa_kwargs)
 
-    # Tokenizer
-    enc_name = "cl100k_base"
-    _rag_state = RAGInit(collection=collection, client=oa_client, enc_name=enc_name)
+    _rag_state = RAGInit(collection=collection, client=oa_client, enc_name=ENCODING_NAME)
     return _rag_state
 
 
+@lru_cache(maxsize=1)
+def _encoder() -> tiktoken.Encoding:
+    """Resolve the tokenizer once; it does not depend on the Chroma/OpenAI state."""
+    return tiktoken.get_encoding(ENCODING_NAME)
+
+
 def _encode(text: str) -> list[int]:
-    enc = tiktoken.get_encoding(_init().enc_name)
-    return enc.encode(text)
+    # encode_ordinary skips special-token checks: faster, and never raises on
+    # documents that happen to contain strings like "<|endoftext|>"
+    return _encoder().encode_ordinary(text)
 
 
 def _decode(tokens: list[int]) -> str:
-    enc = tiktoken.get_encoding(_init().enc_name)
-    return enc.decode(tokens)
+    return _encoder().decode(tokens)
 
 
 def _max_embedding_tokens(model: str) -> int:
@@ -135,27 +172,48 @@ def _max_embedding_tokens(model: str) -> int:
     return 8192
 
 
+def _fit_tokens(text: str, limit: int, tokens: list[int] | None = None) -> str:
+    """Return text truncated to at most ``limit`` tokens.
+
+    Re-tokenization is skipped when ``tokens`` are already known, or when the
+    UTF-8 byte length alone proves the text fits (a token is never shorter
+    than one byte).
+    """
+    if tokens is None:
+        if len(text.encode("utf-8")) <= limit:
+            return text
+        tokens = _encode(text)
+    if len(tokens) <= limit:
+        return text
+    logger.warning("Truncating embedding input from %d to %d tokens", len(tokens), limit)
+    return _decode(tokens[:limit])
+
+
 def _truncate_for_embedding(text: str, model: str, safety_margin: int = 32) -> str:
     """Truncate input text so its tokenized length fits the embedding model limit."""
     max_tokens = max(1, _max_embedding_tokens(model) - max(0, safety_margin))
-    tokens = _encode(text)
-    if len(tokens) <= max_tokens:
-        return text
-    return _decode(tokens[:max_tokens])
+    return _fit_tokens(text, max_tokens)
+
+
+def chunk_tokens(text: str, chunk_size: int, overlap: int) -> list[tuple[str, list[int]]]:
+    """Split text into overlapping token windows, returning (chunk text, tokens) pairs.
+
+    The document is encoded once; the token windows travel with their text so
+    the embedding step can check limits without tokenizing again.
+    """
+    enc = _encoder()
+    tokens = enc.encode_ordinary(text)
+    if chunk_size <= 0:
+        return [(text, tokens)]
+    step = max(1, chunk_size - max(0, overlap))
+    windows = [tokens[start : start + chunk_size] for start in range(0, len(tokens), step)]
+    return list(zip(enc.decode_batch(windows), windows, strict=True))
 
 
 def chunk_by_tokens(text: str, chunk_size: int, overlap: int) -> list[str]:
     if chunk_size <= 0:
         return [text]
-    tokens = _encode(text)
-    chunks: list[str] = []
-    step = max(1, chunk_size - max(0, overlap))
-    for start in range(0, len(tokens), step):
-        window = tokens[start : start + chunk_size]
-        if not window:
-            break
-        chunks.append(_decode(window))
-    return chunks
+    return [chunk for chunk, _ in chunk_tokens(text, chunk_size, overlap)]
 
 
 def _hash_id(source: str, chunk_text: str, i: int) -> str:
@@ -163,11 +221,6 @@ def _hash_id(source: str, chunk_text: str, i: int) -> str:
     return hashlib.sha256(f"{source}::{i}::{chunk_text}".encode()).hexdigest()
 
 
-def _read_text_file(path: str) -> str:
-    with open(path, encoding="utf-8", errors="ignore") as f:
-        return f.read()
-
-
 def _detect_article_label(text: str) -> str | None:
     # Try to capture patterns like "Article 5", "Article 5(1)(e)", etc.
     m = re.search(r"Article\s+\d+(?:\([^)]*\))*", text, flags=re.IGNORECASE)
@@ -219,95 +272,518 @@ def _detect_document_title(text: str) -> str | None:
     return None
 
 
-def ingest_paths(paths: list[str]) -> dict[str, Any]:
-    """Ingest local file paths (txt/md/pdf/docx/html). Returns stats."""
-    s = get_settings()
-    _ = _init()
+class _StageStats:
+    """Accumulates item counts and busy time for one ingest stage."""
 
-    supported_ext = {".txt", ".md", ".pdf", ".docx", ".html", ".htm"}
-    files_ingested = 0
-    chunks_ingested = 0
-    skipped: list[tuple[str, str]] = []
+    def __init__(self, unit: str) -> None:
+        self.unit = unit
+        self.items = 0
+        self.calls = 0
+        self.busy_seconds = 0.0
+
+    def add(self, items: int, seconds: float) -> None:
+        self.items += items
+        self.calls += 1
+        self.busy_seconds += seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        rate = self.items / self.busy_seconds if self.busy_seconds > 0 else 0.0
+        return {
+            self.unit: self.items,
+            "calls": self.calls,
+            "busy_seconds": round(self.busy_seconds, 3),
+            # Per-worker rate: divide the target throughput by this to size a pool
+            f"{self.unit}_per_second": round(rate, 2),
+        }
+
+
+@dataclass
+class _ChunkBatch:
+    """Chunks of one source with their ids, metadata and token windows."""
+
+    texts: list[str]
+    ids: list[str]
+    metadatas: list[dict[str, Any]]
+    tokens: list[list[int]]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def select(self, keep: list[int]) -> _ChunkBatch:
+        return _ChunkBatch(
+            texts=[self.texts[i] for i in keep],
+            ids=[self.ids[i] for i in keep],
+            metadatas=[self.metadatas[i] for i in keep],
+            tokens=[self.tokens[i] for i in keep],
+        )
+
+
+def _prepare_chunks(path: str, text: str, s: Any, source_id: str | None = None) -> _ChunkBatch:
+    """Chunk extracted text and build the ids/metadatas stored alongside each chunk.
+
+    ``source_id`` is the identity chunk ids and replacement are keyed on; it
+    defaults to the file name, which is also what ``source`` shows to users.
+    """
+    pairs = chunk_tokens(text, s.chunk_size_tokens, s.chunk_overlap_tokens)
+    chunks = [c for c, _ in pairs]
+    if not chunks:
+        return _ChunkBatch([], [], [], [])
+
+    # Detect document title from the full text
+    doc_title = _detect_document_title(text)
+    source = os.path.basename(path)
+    source_id = source_id or source
+    ids = [_hash_id(source_id, c, i) for i, c in enumerate(chunks)]
+    metadatas = []
+    for i, c in enumerate(chunks):
+        md: dict[str, Any] = {"source": source, "source_id": source_id, "chunk": i}
+        if doc_title:
+            md["title"] = doc_title
+        art = _detect_article_label(c)
+        if art:
+            md["article"] = art
+        metadatas.append(md)
+    return _ChunkBatch(chunks, ids, metadatas, [t for _, t in pairs])
+
+
+def _embed_batched(
+    texts: list[str], batch_size: int, tokens: list[list[int]] | None = None
+) -> list[list[float]]:
+    """Embed texts in bounded-size requests instead of one unbounded call."""
+    size = max(1, batch_size)
+    out: list[list[float]] = []
+    for start in range(0, len(texts), size):
+        end = start + size
+        out.extend(_embed_texts(texts[start:end], tokens[start:end] if tokens else None))
+    return out
+
+
+def _upsert_bulk(
+    ids: list[str],
+    documents: list[str],
+    metadatas: list[dict[str, Any]],
+    embeddings: list[list[float]],
+    batch_size: int,
+) -> None:
+    """Upsert records with precomputed embeddings, split into Chroma-sized batches."""
+    size = max(1, batch_size)
+    collection = _init().collection
+    for start in range(0, len(ids), size):
+        end = start + size
+        # Store with precomputed embeddings to ensure search works
+        # without a separate embedding function
+        collection.upsert(
+            documents=documents[start:end],
+            metadatas=metadatas[start:end],
+            ids=ids[start:end],
+            embeddings=embeddings[start:end],
+        )
+        _bump_collection_version()
+    lexical = _bm25_index()
+    if lexical is not None:
+        for cid, doc in zip(ids, documents, strict=True):
+            lexical.add(cid, _lexical_terms(doc))
+
+
+def _file_sha(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(8192), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _manifest_path(cache_dir: Path, source: str) -> Path:
+    return cache_dir / "sources" / f"{hashlib.sha256(source.encode('utf-8')).hexdigest()}.json"
+
+
+def _load_manifest(cache_dir: Path, source: str) -> dict[str, Any] | None:
+    """Return the last recorded {source, sha, ids} for a source id, if any."""
+    try:
+        return json.loads(_manifest_path(cache_dir, source).read_text())
+    except Exception:
+        return None
+
+
+def _is_unchanged(cache_dir: Path, source: str, sha: str) -> bool:
+    """True when this exact content was already ingested under the same source id."""
+    manifest = _load_manifest(cache_dir, source)
+    if manifest is not None:
+        return manifest.get("sha") == sha
+    # Markers written before per-source manifests existed: "<name>\n<sha>\n"
+    marker = cache_dir / sha
+    try:
+        return marker.read_text().split("\n", 1)[0] == source
+    except OSError:
+        return False
 
-    # Ensure small cache directory exists to track previously-ingested file SHA hashes
-    cache_dir = Path(s.chroma_persist_dir) / '.ingest_cache'
-    cache_dir.mkdir(parents=True, exist_ok=True)
 
+def upload_source_id(owner_id: str | None, name: str, data: bytes) -> str:
+    """Source id for an uploaded file.
+
+    Scoped by owner, so users uploading files with the same name never replace
+    each other's chunks. Anonymous uploads are keyed by their content hash.
+    """
+    if owner_id:
+        return f"user:{owner_id}/{name}"
+    return f"sha256:{hashlib.sha256(data).hexdigest()}/{name}"
+
+
+class _IngestRun:
+    """Per-call state for incremental ingest.
+
+    Tracks content hashes, which chunk ids each source already has in the
+    collection, and the orphaned ids to delete once a source's new chunks
+    have been upserted successfully.
+    """
+
+    def __init__(
+        self, settings: Any, cache_dir: Path, force: bool, sources: dict[str, str] | None = None
+    ) -> None:
+        self.settings = settings
+        self.cache_dir = cache_dir
+        self.force = force
+        self.sources = sources or {}
+        self.stages = {
+            "extract": _StageStats("files"),
+            "embed": _StageStats("chunks"),
+            "upsert": _StageStats("chunks"),
+        }
+        self.skipped: list[tuple[str, str]] = []
+        self.shas: dict[str, str] = {}
+        self.unchanged = 0
+        self.chunks_reused = 0
+        self.chunks_deleted = 0
+        self._ids: dict[str, list[str]] = {}
+        self._orphans: dict[str, list[str]] = {}
+        self._previous_sha: dict[str, str | None] = {}
+
+    def source(self, path: str) -> str:
+        return self.sources.get(path) or os.path.basename(path)
+
+    def needs_ingest(self, path: str) -> bool:
+        """Hash the file and skip it before extraction if its content is unchanged."""
+        try:
+            sha = _file_sha(path)
+        except Exception as e:
+            self.skipped.append((path, f"error: {e}"))
+            return False
+        self.shas[path] = sha
+        if not self.force and _is_unchanged(self.cache_dir, self.source(path), sha):
+            self.unchanged += 1
+            self.skipped.append((path, "unchanged"))
+            return False
+        return True
+
+    def _existing_ids(self, path: str) -> tuple[set[str], str | None]:
+        source = self.source(path)
+        manifest = _load_manifest(self.cache_dir, source)
+        if manifest is not None:
+            return set(manifest.get("ids") or []), manifest.get("sha")
+        # No manifest yet (ingested by an older version): ask the collection.
+        # Chunks written before source ids existed only carry the file name.
+        where = {"source": source} if source == os.path.basename(path) else {"source_id": source}
+        try:
+            res = _init().collection.get(where=where, include=[])
+            return set(res.get("ids") or []), None
+        except Exception as e:
+            logger.warning("Could not list existing chunks for %s: %s", source, e)
+            return set(), None
+
+    def plan(self, path: str, text: str) -> _ChunkBatch | None:
+        """Chunk a changed file and keep only chunks the collection does not already hold.
+
+        Returns None (and records a skip) if the file produced nothing to index.
+        """
+        if not text.strip():
+            self.skipped.append((path, "empty file"))
+            return None
+        batch = _prepare_chunks(path, text, self.settings, self.source(path))
+        if not len(batch):
+            self.skipped.append((path, "no chunks produced"))
+            return None
+
+        existing, previous_sha = self._existing_ids(path)
+        self._ids[path] = batch.ids
+        self._orphans[path] = sorted(existing.difference(batch.ids))
+        self._previous_sha[path] = previous_sha
+        keep = [i for i, cid in enumerate(batch.ids) if cid not in existing]
+        self.chunks_reused += len(batch) - len(keep)
+        return batch.select(keep)
+
+    def commit(self, path: str) -> None:
+        """Record a successfully upserted file: markers now, orphan deletion in finish()."""
+        source = self.source(path)
+        sha = self.shas.get(path) or _file_sha(path)
+        try:
+            previous = self._previous_sha.get(path)
+            if previous and previous != sha:
+                (self.cache_dir / previous).unlink(missing_ok=True)
+            # Record sha cache so future identical files are skipped
+            (self.cache_dir / sha).write_text(f"{source}\n{sha}\n")
+            manifest = _manifest_path(self.cache_dir, source)
+            manifest.parent.mkdir(parents=True, exist_ok=True)
+            manifest.write_text(
+                json.dumps({"source": source, "sha": sha, "ids": self._ids.get(path, [])})
+            )
+        except Exception:
+            # best-effort cache write; ignore failures
+            pass
+
+    def finish(self, committed: list[str]) -> None:
+        """Delete chunks that no longer belong to any committed source, in bulk."""
+        orphans = [cid for p in committed for cid in self._orphans.get(p, [])]
+        if not orphans:
+            return
+        size = max(1, self.settings.upsert_batch_size)
+        collection = _init().collection
+        for start in range(0, len(orphans), size):
+            collection.delete(ids=orphans[start : start + size])
+            _bump_collection_version()
+        lexical = _bm25_index()
+        if lexical is not None:
+            lexical.remove(orphans)
+        self.chunks_deleted += len(orphans)
+
+
+def _ingest_serial(paths: list[str], run: _IngestRun) -> tuple[int, int]:
+    s = run.settings
+    stages = run.stages
+    committed: list[str] = []
+    chunks_ingested = 0
     for p in paths:
-        ext = Path(p).suffix.lower()
-        if ext not in supported_ext:
-            skipped.append((p, f"unsupported extension: {ext}"))
-            continue
         try:
-            if ext in {".txt", ".md"}:
-                text = _read_text_file(p)
-            elif ext == ".pdf":
-                text = read_pdf_text(p)
-            elif ext == ".docx":
-                text = read_docx_text(p)
-            else:  # .html / .htm
-                text = read_html_text(p)
-
-            if not text.strip():
-                skipped.append((p, "empty file"))
+            t0 = time.perf_counter()
+            text = extract_text(p)
+            stages["extract"].add(1, time.perf_counter() - t0)
+
+            batch = run.plan(p, text)
+            if batch is None:
                 continue
 
-            chunks = chunk_by_tokens(text, s.chunk_size_tokens, s.chunk_overlap_tokens)
-            if not chunks:
-                skipped.append((p, "no chunks produced"))
+            if len(batch):
+                t0 = time.perf_counter()
+                embeddings = _embed_batched(batch.texts, s.embedding_batch_size, batch.tokens)
+                stages["embed"].add(len(batch), time.perf_counter() - t0)
+
+                t0 = time.perf_counter()
+                _upsert_bulk(
+                    batch.ids, batch.texts, batch.metadatas, embeddings, s.upsert_batch_size
+                )
+                stages["upsert"].add(len(batch), time.perf_counter() - t0)
+
+            chunks_ingested += len(batch)
+            run.commit(p)
+            committed.append(p)
+        except Exception as e:
+            run.skipped.append((p, f"error: {e}"))
+            continue
+    run.finish(committed)
+    return len(committed), chunks_ingested
+
+
+def _timed_embed(
+    texts: list[str], tokens: list[list[int]]
+) -> tuple[list[list[float]], float]:
+    t0 = time.perf_counter()
+    embeddings = _embed_texts(texts, tokens)
+    return embeddings, time.perf_counter() - t0
+
+
+def _ingest_parallel(paths: list[str], run: _IngestRun, workers: int) -> tuple[int, int]:
+    """Pipelined ingest: pooled extraction -> cross-file embedding batches -> bulk upserts.
+
+    Extraction runs in a process pool and feeds chunks into a shared queue as
+    files finish. The queue is cut into ``embedding_batch_size`` requests with
+    at most ``embedding_concurrency`` in flight, and embedded records are
+    flushed to Chroma every ``upsert_batch_size`` records.
+    """
+    s = run.settings
+    stages = run.stages
+    batch_size = max(1, s.embedding_batch_size)
+    concurrency = max(1, s.embedding_concurrency)
+    upsert_size = max(1, s.upsert_batch_size)
+
+    # (owner path, id, document, metadata, tokens) awaiting an embedding request
+    pending: list[tuple[str, str, str, dict[str, Any], list[int]]] = []
+    # Embedded records awaiting a bulk upsert
+    ready: list[tuple[str, str, str, dict[str, Any], list[float]]] = []
+    file_chunks: dict[str, int] = {}
+    failed: dict[str, str] = {}
+    in_flight: dict[Future, list[tuple[str, str, str, dict[str, Any], list[int]]]] = {}
+
+    def flush_ready() -> None:
+        if not ready:
+            return
+        batch = list(ready)
+        ready.clear()
+        t0 = time.perf_counter()
+        try:
+            _upsert_bulk(
+                [r[1] for r in batch],
+                [r[2] for r in batch],
+                [r[3] for r in batch],
+                [r[4] for r in batch],
+                upsert_size,
+            )
+        except Exception as e:
+            for owner in {r[0] for r in batch}:
+                failed.setdefault(owner, f"error: {e}")
+            return
+        stages["upsert"].add(len(batch), time.perf_counter() - t0)
+
+    def collect(done: set[Future]) -> None:
+        for fut in done:
+            batch = in_flight.pop(fut)
+            try:
+                embeddings, elapsed = fut.result()
+            except Exception as e:
+                for owner in {r[0] for r in batch}:
+                    failed.setdefault(owner, f"error: {e}")
+                continue
+            stages["embed"].add(len(batch), elapsed)
+            ready.extend((*rec[:4], emb) for rec, emb in zip(batch, embeddings, strict=False))
+        if len(ready) >= upsert_size:
+            flush_ready()
+
+    def submit(
+        embed_pool: ThreadPoolExecutor,
+        batch: list[tuple[str, str, str, dict[str, Any], list[int]]],
+    ) -> None:
+        # Bound the number of outstanding requests so memory stays flat
+        while len(in_flight) >= concurrency:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            collect(done)
+        fut = embed_pool.submit(_timed_embed, [r[2] for r in batch], [r[4] for r in batch])
+        in_flight[fut] = batch
+
+    # Spawn keeps the extraction workers free of the parent's Chroma/OpenAI threads
+    mp_context = multiprocessing.get_context("spawn")
+    with (
+        ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as extract_pool,
+        ThreadPoolExecutor(max_workers=concurrency) as embed_pool,
+    ):
+        futures = [extract_pool.submit(extract_text_task, p) for p in paths]
+        for fut in as_completed(futures):
+            path, text, error, elapsed = fut.result()
+            stages["extract"].add(1, elapsed)
+            if error is not None or text is None:
+                run.skipped.append((path, error or "error: extraction failed"))
+                continue
+            try:
+                chunk_batch = run.plan(path, text)
+            except Exception as e:
+                run.skipped.append((path, f"error: {e}"))
+                continue
+            if chunk_batch is None:
                 continue
 
-            # Detect document title from the full text
-            doc_title = _detect_document_title(text)
-
-            embeddings = _embed_texts(chunks)
-            ids = [_hash_id(os.path.basename(p), c, i) for i, c in enumerate(chunks)]
-            metadatas = []
-            for i, c in enumerate(chunks):
-                md: dict[str, Any] = {"source": os.path.basename(p), "chunk": i}
-                if doc_title:
-                    md["title"] = doc_title
-                art = _detect_article_label(c)
-                if art:
-                    md["article"] = art
-                metadatas.append(md)
-
-            # Store with precomputed embeddings to ensure search works
-            # without a separate embedding function
-            _init().collection.upsert(
-                documents=chunks,
-                metadatas=metadatas,
-                ids=ids,
-                embeddings=embeddings,
+            file_chunks[path] = len(chunk_batch)
+            pending.extend(
+                zip(
+                    [path] * len(chunk_batch),
+                    chunk_batch.ids,
+                    chunk_batch.texts,
+                    chunk_batch.metadatas,
+                    chunk_batch.tokens,
+                    strict=True,
+                )
             )
+            while len(pending) >= batch_size:
+                submit(embed_pool, pending[:batch_size])
+                del pending[:batch_size]
+
+        if pending:
+            submit(embed_pool, list(pending))
+            pending.clear()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            collect(done)
+    flush_ready()
+
+    committed: list[str] = []
+    chunks_ingested = 0
+    for path, count in file_chunks.items():
+        if path in failed:
+            run.skipped.append((path, failed[path]))
+            continue
+        chunks_ingested += count
+        run.commit(path)
+        committed.append(path)
+    run.finish(committed)
+    return len(committed), chunks_ingested
+
+
+def ingest_paths(
+    paths: list[str],
+    parallel: bool = False,
+    workers: int | None = None,
+    force: bool = False,
+    sources: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Ingest local file paths (txt/md/pdf/docx/html). Returns stats.
+
+    Ingest is incremental: files whose content hash matches the last ingest
+    of the same source are skipped before extraction, only chunks the
+    collection does not already hold are embedded, and chunks left over from
+    a previous version of a source are deleted. A source is identified by
+    ``sources[path]`` when given (see ``upload_source_id``), else by the file
+    name. ``force=True`` re-processes every file (unchanged chunk ids are
+    still not re-embedded).
+
+    With ``parallel=True`` extraction, embedding and upserts are pipelined
+    across files (see ``_ingest_parallel``); ``workers`` overrides the
+    ``ingest_workers`` setting. Both modes report per-stage throughput
+    under ``stages``.
+    """
+    s = get_settings()
+    _ = _init()
+    started = time.perf_counter()
 
-            files_ingested += 1
-            chunks_ingested += len(chunks)
-            # Record sha cache so future identical files are skipped
-            try:
-                # compute sha of the original file path
-                import hashlib
-
-                def _file_sha(path: str) -> str:
-                    h = hashlib.sha256()
-                    with open(path, 'rb') as fh:
-                        for chunk in iter(lambda: fh.read(8192), b''):
-                            h.update(chunk)
-                    return h.hexdigest()
-
-                sha = _file_sha(p)
-                (cache_dir / sha).write_text(f"{Path(p).name}\n{sha}\n")
-            except Exception:
-                # best-effort cache write; ignore failures
-                pass
-        except Exception as e:
-            skipped.append((p, f"error: {e}"))
+    # Small cache directory tracking previously-ingested file SHA hashes and chunk ids
+    cache_dir = Path(s.chroma_persist_dir) / ".ingest_cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    run = _IngestRun(s, cache_dir, force, sources)
+
+    to_ingest: list[str] = []
+    for p in paths:
+        ext = Path(p).suffix.lower()
+        if ext not in SUPPORTED_EXTENSIONS:
+            run.skipped.append((p, f"unsupported extension: {ext}"))
             continue
+        if run.needs_ingest(p):
+            to_ingest.append(p)
+
+    pool_size = max(1, workers if workers is not None else s.ingest_workers)
+    if parallel and len(to_ingest) > 1:
+        files_ingested, chunks_ingested = _ingest_parallel(
+            to_ingest, run, min(pool_size, len(to_ingest))
+        )
+    else:
+        files_ingested, chunks_ingested = _ingest_serial(to_ingest, run)
+
+    _save_bm25_index()
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "Ingested %d files / %d chunks (%d unchanged files, %d chunks deleted) in %.2fs (parallel=%s)",
+        files_ingested,
+        chunks_ingested,
+        run.unchanged,
+        run.chunks_deleted,
+        elapsed,
+        parallel,
+    )
 
     result = {
         "files": files_ingested,
         "chunks": chunks_ingested,
-        "skipped": [{"path": p, "reason": r} for p, r in skipped],
+        "skipped": [{"path": p, "reason": r} for p, r in run.skipped],
+        "unchanged": run.unchanged,
+        "chunks_reused": run.chunks_reused,
+        "chunks_deleted": run.chunks_deleted,
+        "stages": {name: st.as_dict() for name, st in run.stages.items()},
+        "elapsed_seconds": round(elapsed, 3),
     }
 
     # If GCS is configured, attempt to upload the updated persist dir.
@@ -418,102 +894,347 @@ def _gcs_upload_persist(bucket_name: str, object_name: str | None, src_dir: str)
 
 
 
-def _embed_texts(texts: list[str]) -> list[list[float]]:
+_embedding_cache_state: DiskLRUCache | None = None
+
+
+def _embedding_cache() -> DiskLRUCache | None:
+    """Return the shared on-disk embedding cache, or None when disabled."""
+    global _embedding_cache_state  # noqa: PLW0603
     s = get_settings()
-    init = _init()
+    if not s.embedding_cache_enabled:
+        return None
+    if _embedding_cache_state is None:
+        try:
+            _embedding_cache_state = DiskLRUCache(
+                s.embedding_cache_path, s.embedding_cache_max_entries
+            )
+        except Exception as e:
+            logger.warning("Embedding cache unavailable at %s: %s", s.embedding_cache_path, e)
+            return None
+    return _embedding_cache_state
+
+
+def embedding_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters for the embedding cache (per process) plus its size."""
+    cache = _embedding_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+def _embedding_cache_key(model: str, text: str) -> str:
+    return f"{model}|{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+def _pack_vector(vec: list[float]) -> bytes:
+    return array("f", vec).tobytes()
+
+
+def _unpack_vector(raw: bytes) -> list[float]:
+    arr = array("f")
+    arr.frombytes(raw)
+    return arr.tolist()
+
+
+def _local_embedder(model: str) -> Any | None:
+    """Load (once) the sentence-transformers model named by ``model``; None if unavailable."""
+    # Lazy import to avoid requiring sentence-transformers unless used
+    try:
+        from sentence_transformers import SentenceTransformer
+    except Exception as e:  # pragma: no cover - optional dependency
+        logger.warning(
+            "sentence-transformers not available: %s. Falling back to OpenAI embeddings if configured.",
+            str(e),
+        )
+        return None
+
+    # Simple cache to avoid reloading the model repeatedly
+    if not hasattr(_embed_texts, "_local_cache"):
+        setattr(_embed_texts, "_local_cache", {})
+    cache = getattr(_embed_texts, "_local_cache")
+    if model not in cache:
+        # model string: 'sentence-transformers/all-MiniLM-L6-v2' -> use 'all-MiniLM-L6-v2'
+        _, local_name = model.split("/", 1)
+        cache[model] = SentenceTransformer(local_name)
+    return cache[model]
+
+
+def _embed_texts(
+    texts: list[str], tokens: list[list[int]] | None = None
+) -> list[list[float]]:
+    """Embed texts with the configured model, via the shared embedding cache.
+
+    ``tokens`` optionally carries each text's token array (e.g. from
+    ``chunk_tokens``) so the limit check does not tokenize again.
+    """
+    s = get_settings()
+    processed, model, embedder = _embedding_plan(texts, tokens, s)
+
+    def compute(batch: list[str]) -> list[list[float]]:
+        if embedder is not None:
+            return _encode_local(embedder, batch)
+        try:
+            resp = _init().client.embeddings.create(model=model, input=batch)
+        except Exception as oe:
+            if s.openai_embedding_model != model:
+                raise RuntimeError("Failed to compute OpenAI embeddings as fallback: %s" % oe) from oe
+            raise
+        return [d.embedding for d in resp.data]
+
+    cache = _embedding_cache()
+    if cache is None:
+        return compute(processed)
+
+    keys, found, missing = _cached_embeddings(cache, model, processed)
+    if missing:
+        _store_embeddings(cache, found, missing, compute(list(missing.values())))
+    return [found[k] for k in keys]
+
+
+async def _embed_texts_async(
+    texts: list[str], tokens: list[list[int]] | None = None
+) -> list[list[float]]:
+    """Async variant of ``_embed_texts`` using the pooled async client.
+
+    Local sentence-transformers models run in a worker thread.
+    """
+    from .llm import create_embeddings
+
+    s = get_settings()
+    processed, model, embedder = _embedding_plan(texts, tokens, s)
+
+    async def compute(batch: list[str]) -> list[list[float]]:
+        if embedder is not None:
+            return await asyncio.to_thread(_encode_local, embedder, batch)
+        try:
+            resp = await create_embeddings("embeddings", model=model, input=batch)
+        except Exception as oe:
+            if s.openai_embedding_model != model:
+                raise RuntimeError("Failed to compute OpenAI embeddings as fallback: %s" % oe) from oe
+            raise
+        return [d.embedding for d in resp.data]
+
+    cache = _embedding_cache()
+    if cache is None:
+        return await compute(processed)
+
+    keys, found, missing = _cached_embeddings(cache, model, processed)
+    if missing:
+        _store_embeddings(cache, found, missing, await compute(list(missing.values())))
+    return [found[k] for k in keys]
+
+
+def _embedding_plan(
+    texts: list[str], tokens: list[list[int]] | None, s: Settings
+) -> tuple[list[str], str, Any]:
+    """Truncate texts to the model limit and resolve the model that will embed them.
+
+    Returns ``(processed_texts, model, local_embedder_or_None)``.
+    """
     model = s.openai_embedding_model
 
     # Preprocess to respect maximum tokens per model (best-effort)
-    processed: list[str] = []
     try:
         max_tokens = _max_embedding_tokens(model)
     except Exception:
         max_tokens = 8192
     limit = max(1, max_tokens - 32)  # safety margin
-    for original_text in texts:
-        tokens = _encode(original_text)
-        if len(tokens) > limit:
-            try:
-                logger.warning(
-                    "Truncating embedding input from %d to %d tokens for model %s",
-                    len(tokens),
-                    limit,
-                    model,
-                )
-            except Exception as e:
-                logging.warning(f"Failed to truncate embedding input: {e}")
-            processed_text = _decode(tokens[:limit])
-        else:
-            processed_text = original_text
-        processed.append(processed_text)
+    processed = [
+        _fit_tokens(t, limit, tokens[i] if tokens is not None else None)
+        for i, t in enumerate(texts)
+    ]
 
     # If the configured model is a local sentence-transformers model (prefix)
+    embedder = None
     if isinstance(model, str) and model.startswith("sentence-transformers/"):
-        # Lazy import to avoid requiring sentence-transformers unless used
-        try:
-            from sentence_transformers import SentenceTransformer
-        except Exception as e:  # pragma: no cover - optional dependency
+        embedder = _local_embedder(model)
+        if embedder is None:
             # If sentence-transformers isn't installed, try to fall back to OpenAI
             # embeddings if an API key is configured. This prevents a hard failure
             # in streaming/ingest when local embeddings aren't available.
-            logger.warning(
-                "sentence-transformers not available: %s. Falling back to OpenAI embeddings if configured.",
-                str(e),
-            )
-            s = get_settings()
-            if s.openai_api_key:
-                # Use OpenAI embeddings for the processed texts
-                init = _init()
-                # If the configured embedding model points to a sentence-transformers path,
-                # replace it with a valid OpenAI embedding model for the fallback case.
-                model_to_use = s.openai_embedding_model
-                if isinstance(model_to_use, str) and model_to_use.startswith("sentence-transformers/"):
-                    logger.warning(
-                        "Configured POLIVERAI_OPENAI_EMBEDDING_MODEL appears to reference a local sentence-transformers model (%s). Using default OpenAI embedding 'text-embedding-3-small' as fallback.",
-                        model_to_use,
-                    )
-                    model_to_use = "text-embedding-3-small"
-                try:
-                    resp = init.client.embeddings.create(model=model_to_use, input=processed)
-                    return [d.embedding for d in resp.data]
-                except Exception as oe:
-                    raise RuntimeError("Failed to compute OpenAI embeddings as fallback: %s" % oe) from oe
-            else:
+            if not s.openai_api_key:
                 raise RuntimeError(
                     "sentence-transformers is not installed and OpenAI API key is not configured. Install sentence-transformers or set POLIVERAI_OPENAI_API_KEY."
-                ) from e
-
-        # Simple cache to avoid reloading the model repeatedly
-        if not hasattr(_embed_texts, "_local_cache"):
-            setattr(_embed_texts, "_local_cache", {})
-        cache = getattr(_embed_texts, "_local_cache")
-        model_key = model
-        if model_key not in cache:
-            # model string: 'sentence-transformers/all-MiniLM-L6-v2' -> use 'all-MiniLM-L6-v2'
-            _, local_name = model.split("/", 1)
-            cache[model_key] = SentenceTransformer(local_name)
-
-        embedder = cache[model_key]
-        # sentence-transformers returns numpy arrays by default; convert to lists
-        emb = embedder.encode(processed, show_progress_bar=False)
-        return [list(map(float, e)) for e in emb]
-
-    # Otherwise, fall back to OpenAI embeddings via the OpenAI client
-    if not s.openai_api_key:
+                )
+            # If the configured embedding model points to a sentence-transformers path,
+            # replace it with a valid OpenAI embedding model for the fallback case.
+            logger.warning(
+                "Configured POLIVERAI_OPENAI_EMBEDDING_MODEL appears to reference a local sentence-transformers model (%s). Using default OpenAI embedding 'text-embedding-3-small' as fallback.",
+                model,
+            )
+            model = "text-embedding-3-small"
+    elif not s.openai_api_key:
+        # Otherwise, fall back to OpenAI embeddings via the OpenAI client
         raise RuntimeError(
             "OpenAI API key not set. Please export POLIVERAI_OPENAI_API_KEY or set it in .env."
         )
+    return processed, model, embedder
+
+
+def _encode_local(embedder: Any, batch: list[str]) -> list[list[float]]:
+    # sentence-transformers returns numpy arrays by default; convert to lists
+    emb = embedder.encode(batch, show_progress_bar=False)
+    return [list(map(float, e)) for e in emb]
+
+
+def _cached_embeddings(
+    cache: DiskLRUCache, model: str, processed: list[str]
+) -> tuple[list[str], dict[str, list[float]], dict[str, str]]:
+    # Content-addressed lookup keyed by the model that actually produces the vectors
+    keys = [_embedding_cache_key(model, t) for t in processed]
+    found = {k: _unpack_vector(v) for k, v in cache.get_many(keys).items()}
+    missing = {k: t for k, t in zip(keys, processed, strict=True) if k not in found}
+    return keys, found, missing
+
+
+def _store_embeddings(
+    cache: DiskLRUCache,
+    found: dict[str, list[float]],
+    missing: dict[str, str],
+    vectors: list[list[float]],
+) -> None:
+    fresh = dict(zip(missing.keys(), vectors, strict=True))
+    cache.set_many({k: _pack_vector(v) for k, v in fresh.items()})
+    found.update(fresh)
+
+
+# Collection version used to invalidate the in-process retrieval caches. The
+# local counter covers this process; the stamp file in the persist dir lets
+# other workers notice ingests (and GCS restores) without asking Chroma.
+_COLLECTION_VERSION_FILE = ".collection_version"
+_collection_version_local = 0
+_query_embedding_cache_state: MemoryLRUCache | None = None
+_retrieval_cache_state: MemoryLRUCache | None = None
+
+
+def _bump_collection_version() -> None:
+    global _collection_version_local  # noqa: PLW0603
+    _collection_version_local += 1
+    path = Path(get_settings().chroma_persist_dir) / _COLLECTION_VERSION_FILE
+    try:
+        path.write_text(str(time.time_ns()), encoding="utf-8")
+    except OSError as e:
+        logger.warning("Could not write collection version stamp %s: %s", path, e)
+
+
+def _collection_stamp(s: Settings) -> int:
+    """Version of the collection as seen by every process sharing the persist dir."""
+    try:
+        return os.stat(Path(s.chroma_persist_dir) / _COLLECTION_VERSION_FILE).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _collection_version(s: Settings) -> tuple[int, int]:
+    return _collection_version_local, _collection_stamp(s)
+
+
+def _query_embedding_cache() -> MemoryLRUCache:
+    global _query_embedding_cache_state  # noqa: PLW0603
+    if _query_embedding_cache_state is None:
+        _query_embedding_cache_state = MemoryLRUCache(get_settings().query_embedding_cache_size)
+    return _query_embedding_cache_state
+
+
+def _retrieval_cache() -> MemoryLRUCache:
+    global _retrieval_cache_state  # noqa: PLW0603
+    if _retrieval_cache_state is None:
+        _retrieval_cache_state = MemoryLRUCache(get_settings().retrieval_cache_size)
+    return _retrieval_cache_state
+
+
+_answer_cache_state: TTLCache | None = None
+
+
+def _answer_cache() -> TTLCache | None:
+    global _answer_cache_state  # noqa: PLW0603
+    s = get_settings()
+    if not s.answer_cache_enabled:
+        return None
+    if _answer_cache_state is None:
+        _answer_cache_state = TTLCache(
+            s.answer_cache_max_entries, s.answer_cache_ttl_seconds, s.answer_cache_path
+        )
+    return _answer_cache_state
+
 
-    resp = init.client.embeddings.create(model=model, input=processed)
-    return [d.embedding for d in resp.data]
+def _answer_cache_key(question: str, s: Settings) -> str:
+    # Case, whitespace and trailing punctuation don't change the question
+    normalized = " ".join(question.lower().split()).rstrip("?!. ")
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return f"answer|{s.chroma_collection}|{s.openai_chat_model}|{_collection_stamp(s)}|{digest}"
+
+
+def answer_cache_stats() -> dict[str, Any]:
+    cache = _answer_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+def retrieval_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters for the in-process query embedding and retrieval caches."""
+    return {
+        "query_embeddings": _query_embedding_cache().stats(),
+        "results": _retrieval_cache().stats(),
+    }
+
+
+def _embed_queries(queries: list[str]) -> list[list[float]]:
+    """Embed query texts, serving repeats from the in-process cache."""
+    model, vectors, missing = _cached_query_vectors(queries)
+    if missing:
+        return _fill_query_vectors(model, queries, vectors, missing, _embed_texts(missing))
+    return vectors  # type: ignore[return-value]
+
+
+async def _embed_queries_async(queries: list[str]) -> list[list[float]]:
+    model, vectors, missing = _cached_query_vectors(queries)
+    if missing:
+        return _fill_query_vectors(model, queries, vectors, missing, await _embed_texts_async(missing))
+    return vectors  # type: ignore[return-value]
+
+
+def _cached_query_vectors(
+    queries: list[str],
+) -> tuple[str, list[list[float] | None], list[str]]:
+    model = get_settings().openai_embedding_model
+    cache = _query_embedding_cache()
+    vectors: list[list[float] | None] = [cache.get((model, q)) for q in queries]
+    missing = list(dict.fromkeys(q for q, v in zip(queries, vectors, strict=True) if v is None))
+    return model, vectors, missing
+
+
+def _fill_query_vectors(
+    model: str,
+    queries: list[str],
+    vectors: list[list[float] | None],
+    missing: list[str],
+    embedded: list[list[float]],
+) -> list[list[float]]:
+    cache = _query_embedding_cache()
+    fresh = dict(zip(missing, embedded, strict=True))
+    for q, v in fresh.items():
+        cache.set((model, q), v)
+    return [v if v is not None else fresh[q] for q, v in zip(queries, vectors, strict=True)]
 
 
 def _query_collection(query: str, k: int) -> dict[str, Any]:
+    return _query_collection_many([query], k)
+
+
+def _query_collection_many(
+    queries: list[str], k: int, query_vectors: list[list[float]] | None = None
+) -> dict[str, Any]:
+    """Embed all queries in one request and run them as one multi-embedding Chroma query.
+
+    The result has one row per query in each of documents/metadatas/distances/ids.
+    """
     init = _init()
-    qv = _embed_texts([query])[0]
+    qvs = query_vectors if query_vectors is not None else _embed_queries(queries)
     # Note: older/newer Chroma versions don't accept "ids" in include; ids are returned by default.
     return init.collection.query(
-        query_embeddings=[qv],
+        query_embeddings=qvs,
         n_results=k,
         include=["documents", "metadatas", "distances"],
     )  # type: ignore[arg-type]
@@ -567,6 +1288,125 @@ def _lexical_overlap_score(q: str, d: str) -> float:
     return inter / union
 
 
+def _lexical_terms(text: str) -> list[str]:
+    return [t for t in _tokenize(text) if t not in _STOP]
+
+
+# BM25 index over chunk texts, kept next to the vector store and maintained by
+# ingest. Readers in other processes reload it when the file is replaced; an
+# index with unsaved changes is kept until saved, which merges those changes
+# into the file under a lock (see ``BM25Index.save``).
+_bm25_state: BM25Index | None = None
+_bm25_stamp: tuple[int, int] | None = None
+
+
+def _bm25_path(s: Settings) -> Path:
+    return Path(s.chroma_persist_dir) / f"{s.chroma_collection}.bm25.json"
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+
+def _bm25_index() -> BM25Index | None:
+    """Return the lexical index, loading or (for pre-existing stores) building it on first use."""
+    global _bm25_state, _bm25_stamp  # noqa: PLW0603
+    s = get_settings()
+    if not s.bm25_enabled:
+        return None
+    path = _bm25_path(s)
+    stamp = _file_stamp(path)
+    if _bm25_state is not None and (stamp == _bm25_stamp or _bm25_state.dirty):
+        return _bm25_state
+    if stamp is not None:
+        try:
+            _bm25_state = BM25Index.load(path)
+            _bm25_stamp = stamp
+            return _bm25_state
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to load BM25 index from %s: %s; rebuilding", path, e)
+    # No index on disk yet: build it once from the documents already in the collection
+    index = BM25Index()
+    try:
+        res = _init().collection.get(include=["documents"])
+        for cid, doc in zip(res.get("ids") or [], res.get("documents") or [], strict=False):
+            index.add(cid, _lexical_terms(doc or ""))
+    except Exception as e:
+        logger.warning("Could not build BM25 index from the collection: %s", e)
+        return None
+    # Persist even an empty index so later calls load it instead of rescanning the collection
+    index.dirty = True
+    _bm25_state = index
+    _save_bm25_index()
+    return _bm25_state
+
+
+def _save_bm25_index() -> None:
+    global _bm25_stamp  # noqa: PLW0603
+    if _bm25_state is None or not _bm25_state.dirty:
+        return
+    path = _bm25_path(get_settings())
+    try:
+        _bm25_state.save(path)
+        _bm25_stamp = _file_stamp(path)
+    except OSError as e:
+        logger.warning("Failed to persist BM25 index to %s: %s", path, e)
+
+
+def _min_squared_l2(query_vectors: list[list[float]], embeddings: list[Any]) -> list[float]:
+    """Smallest squared L2 distance from each embedding to any query vector."""
+    if not query_vectors or not embeddings:
+        return [1e9] * len(embeddings)
+    q = np.asarray(query_vectors, dtype=np.float32)
+    x = np.asarray(embeddings, dtype=np.float32)
+    # Same expansion as NumpyVectorCollection.query: |q|^2 + |x|^2 - 2 q.x
+    dist = np.einsum("ij,ij->i", q, q)[:, None] + np.einsum("ij,ij->i", x, x)[None, :] - 2.0 * (q @ x.T)
+    return np.maximum(dist, 0.0).min(axis=0).tolist()
+
+
+def _sparse_candidates(
+    terms: list[str],
+    k: int,
+    known: set[str],
+    query_vectors: list[list[float]],
+) -> list[dict[str, Any]]:
+    """BM25 top-k hits the vector search missed, with their best distance to any query vector.
+
+    Distances are computed locally from stored embeddings so sparse-only hits
+    are scored on the same footing as vector hits.
+    """
+    lexical = _bm25_index()
+    if lexical is None or not terms:
+        return []
+    extra = [cid for cid, _ in lexical.search(terms, k) if cid not in known]
+    if not extra:
+        return []
+    res = _init().collection.get(ids=extra, include=["documents", "metadatas", "embeddings"])
+    embs = res.get("embeddings")
+    if embs is None:
+        embs = []
+    ids = res.get("ids") or []
+    have = [i for i in range(len(ids)) if i < len(embs) and embs[i] is not None and len(embs[i])]
+    dists = [1e9] * len(ids)
+    for i, dist in zip(have, _min_squared_l2(query_vectors, [embs[i] for i in have]), strict=True):
+        dists[i] = dist
+    out = []
+    for i, cid in enumerate(ids):
+        out.append(
+            {
+                "id": cid,
+                "doc": (res.get("documents") or [""])[i],
+                "meta": (res.get("metadatas") or [{}])[i] or {},
+                "distance": dists[i],
+            }
+        )
+    return out
+
+
 def _expand_queries(question: str) -> list[str]:
     arts = list(map_requirement_to_articles(question))
     queries: list[str] = [question]
@@ -585,7 +1425,46 @@ def _expand_queries(question: str) -> list[str]:
     return out
 
 
-def retrieve(query: str, k: int | None = None) -> list[dict[str, Any]]:
+def _retrieval_cache_key(query: str, k: int, s: Settings) -> tuple[Any, ...]:
+    return (
+        s.chroma_collection,
+        s.openai_embedding_model,
+        query,
+        k,
+        s.top_k,
+        s.retrieval_vector_weight,
+        s.retrieval_lexical_weight,
+        s.retrieval_article_boost,
+        s.bm25_enabled,
+        _collection_version(s),
+    )
+
+
+async def retrieve_async(query: str, k: int | None = None) -> list[dict[str, Any]]:
+    """Async ``retrieve``: embeds via the async client, runs the store query in a thread.
+
+    The retrieval cache is checked first, so a hit costs no embedding.
+    """
+    s = get_settings()
+    k = k or s.top_k
+    if not s.openai_api_key:
+        return []
+    cache_key = _retrieval_cache_key(query, k, s)
+    cached = _retrieval_cache().get(cache_key)
+    if cached is not None:
+        return [dict(r) for r in cached]
+    # Repeats are served from the query embedding cache without a request
+    query_vectors = await _embed_queries_async(_expand_queries(query))
+    return await asyncio.to_thread(_retrieve_uncached, query, k, query_vectors, cache_key, s)
+
+
+def retrieve(
+    query: str, k: int | None = None, query_vectors: list[list[float]] | None = None
+) -> list[dict[str, Any]]:
+    """Hybrid retrieval over the expanded queries.
+
+    ``query_vectors`` (one per ``_expand_queries(query)`` entry) skips embedding.
+    """
     s = get_settings()
     k = k or s.top_k
 
@@ -593,17 +1472,35 @@ def retrieve(query: str, k: int | None = None) -> list[dict[str, Any]]:
     if not s.openai_api_key:
         return []
 
+    cache_key = _retrieval_cache_key(query, k, s)
+    cached = _retrieval_cache().get(cache_key)
+    if cached is not None:
+        return [dict(r) for r in cached]
+    return _retrieve_uncached(query, k, query_vectors, cache_key, s)
+
+
+def _retrieve_uncached(
+    query: str, k: int, query_vectors: list[list[float]] | None, cache_key: tuple[Any, ...], s: Settings
+) -> list[dict[str, Any]]:
+    # The retrieval itself, after a cache miss; the result is cached under ``cache_key``
     queries = _expand_queries(query)
+    if query_vectors is None:
+        query_vectors = _embed_queries(queries)
+
+    # One embedding request and one Chroma query for every expanded query
+    res = _query_collection_many(queries, max(k, s.top_k), query_vectors)
+    docs_rows = res.get("documents") or []
+    metas_rows = res.get("metadatas") or []
+    dists_rows = res.get("distances") or []
+    ids_rows = res.get("ids") or []
 
     # Aggregate results across expanded queries, keeping best (lowest) distance per id
     by_id: dict[str, dict[str, Any]] = {}
-    for q in queries:
-        res = _query_collection(q, max(k, s.top_k))
-        docs = (res.get("documents") or [[]])[0]
-        metas = (res.get("metadatas") or [[]])[0]
-        dists = (res.get("distances") or [[]])[0]
-        ids_outer = res.get("ids") or [[]]
-        ids = ids_outer[0] if ids_outer and len(ids_outer) > 0 else None
+    for row in range(len(queries)):
+        docs = docs_rows[row] if row < len(docs_rows) else []
+        metas = metas_rows[row] if row < len(metas_rows) else []
+        dists = dists_rows[row] if row < len(dists_rows) else []
+        ids = ids_rows[row] if row < len(ids_rows) else None
         for idx, (d, m, dist) in enumerate(zip(docs, metas, dists, strict=False)):
             # Use Chroma id if present, else synthesize a stable id from content + metadata
             if ids is not None and idx < len(ids):
@@ -627,50 +1524,226 @@ def retrieve(query: str, k: int | None = None) -> list[dict[str, Any]]:
             if prev is None or score < prev.get("distance", 1e9):
                 by_id[_id] = {"id": _id, "doc": d, "meta": m or {}, "distance": score}
 
+    # Fuse in BM25 hits the vector search missed, then score lexically from the
+    # index (max-normalized to [0, 1]) instead of re-tokenizing every candidate
+    terms = _lexical_terms(query)
+    lexical = _bm25_index()
+    if lexical is not None and len(lexical):
+        try:
+            for rec in _sparse_candidates(terms, max(k, s.top_k), set(by_id), query_vectors):
+                by_id[rec["id"]] = rec
+        except Exception as e:
+            logger.warning("BM25 candidate retrieval failed: %s", e)
+        bm25 = lexical.score(terms, by_id)
+        top = max(bm25.values(), default=0.0)
+        lex_scores = {cid: (v / top if top > 0 else 0.0) for cid, v in bm25.items()}
+    else:
+        lex_scores = {cid: _lexical_overlap_score(query, rec.get("doc", "")) for cid, rec in by_id.items()}
+
     # Compute hybrid score
     vw = s.retrieval_vector_weight
     lw = s.retrieval_lexical_weight
     ab = s.retrieval_article_boost
 
+    query_articles = list(map_requirement_to_articles(query))
     for rec in by_id.values():
         dist = rec.get("distance", 1e9)
         vec_sim = 1.0 / (1.0 + float(dist)) if dist < LARGE_DISTANCE_VALUE else 0.0
-        lex = _lexical_overlap_score(query, rec.get("doc", ""))
+        lex = lex_scores.get(rec["id"], 0.0)
         art = (rec.get("meta") or {}).get("article")
         art_hit = False
-        for a in map_requirement_to_articles(query):
+        for a in query_articles:
             if art and a.lower() in art.lower():
                 art_hit = True
                 break
         rec["score"] = vw * vec_sim + lw * lex + (ab if art_hit else 0.0)
 
     merged = sorted(by_id.values(), key=lambda r: r.get("score", 0.0), reverse=True)[:k]
-    return merged
+    _retrieval_cache().set(cache_key, merged)
+    return [dict(r) for r in merged]
 
 
 def answer_question(question: str) -> dict[str, Any]:
+    """Answer a question from retrieved context.
+
+    Generated answers are cached per normalized question, chat model and
+    collection version; the result's ``cache`` field is "hit", "miss" or
+    "bypass" (not cacheable, e.g. no context or no API key).
+    """
     s = get_settings()
     if not question.strip():
-        return {"answer": "Please provide a question.", "sources": []}
+        return {"answer": "Please provide a question.", "sources": [], "cache": "bypass"}
 
-    context_items = []
-    sources: list[dict[str, Any]] = []
+    cache = _answer_cache() if s.openai_api_key else None
+    cache_key = _answer_cache_key(question, s) if cache is not None else ""
+    if cache is not None:
+        hit = cache.get(cache_key)
+        if hit is not None:
+            value, age = hit
+            return {**value, "cache": "hit", "cache_age": int(age)}
+
+    sources, prompt, fallback = _prepare_answer(question, s)
+    if fallback is not None:
+        return {**fallback, "cache": "bypass"}
+
+    chat = _init().client.chat.completions.create(
+        model=s.openai_chat_model,
+        messages=_answer_messages(prompt),
+        temperature=0.2,
+    )
+    answer = _finalize_answer((chat.choices[0].message.content or "").strip(), sources)
+    result = {"answer": answer, "sources": sources}
+    if cache is not None:
+        cache.set(cache_key, result)
+        return {**result, "cache": "miss"}
+    return {**result, "cache": "bypass"}
+
+
+async def answer_question_async(question: str) -> dict[str, Any]:
+    """Async ``answer_question`` for the API routes.
+
+    Embeddings and the chat completion go through the pooled async client
+    under the "query" concurrency limit; the vector store query runs in a
+    worker thread.
+    """
+    from .llm import chat_completion
+
+    s = get_settings()
+    if not question.strip():
+        return {"answer": "Please provide a question.", "sources": [], "cache": "bypass"}
 
+    cache = _answer_cache() if s.openai_api_key else None
+    cache_key = _answer_cache_key(question, s) if cache is not None else ""
+    if cache is not None:
+        hit = cache.get(cache_key)
+        if hit is not None:
+            value, age = hit
+            return {**value, "cache": "hit", "cache_age": int(age)}
+
+    try:
+        items = await retrieve_async(question, k=_answer_k(s))
+    except Exception as e:
+        return {**_vector_store_error(e), "cache": "bypass"}
+    sources, prompt, fallback = _answer_context(question, s, items)
+    if fallback is not None:
+        return {**fallback, "cache": "bypass"}
+
+    chat = await chat_completion(
+        "query",
+        model=s.openai_chat_model,
+        messages=_answer_messages(prompt),
+        temperature=0.2,
+    )
+    answer = _finalize_answer((chat.choices[0].message.content or "").strip(), sources)
+    result = {"answer": answer, "sources": sources}
+    if cache is not None:
+        cache.set(cache_key, result)
+        return {**result, "cache": "miss"}
+    return {**result, "cache": "bypass"}
+
+
+def answer_question_stream(question: str) -> Iterator[dict[str, Any]]:
+    """Streaming variant of ``answer_question``.
+
+    Yields ``{"event", "data"}`` dicts: ``sources`` as soon as retrieval is
+    done, one ``token`` per completion delta, then ``completed`` with the
+    final answer (which may differ from the streamed text when the refusal
+    safeguard applies), sources and cache status. Cache hits replay the
+    stored answer as a single token.
+    """
+    s = get_settings()
+    if not question.strip():
+        yield {"event": "completed", "data": {"answer": "Please provide a question.", "sources": [], "cache": "bypass"}}
+        return
+
+    cache = _answer_cache() if s.openai_api_key else None
+    cache_key = _answer_cache_key(question, s) if cache is not None else ""
+    if cache is not None:
+        hit = cache.get(cache_key)
+        if hit is not None:
+            value, age = hit
+            yield {"event": "sources", "data": {"sources": value.get("sources", [])}}
+            yield {"event": "token", "data": {"text": value.get("answer", "")}}
+            yield {"event": "completed", "data": {**value, "cache": "hit", "cache_age": int(age)}}
+            return
+
+    sources, prompt, fallback = _prepare_answer(question, s)
+    yield {"event": "sources", "data": {"sources": sources}}
+    if fallback is not None:
+        yield {"event": "token", "data": {"text": fallback["answer"]}}
+        yield {"event": "completed", "data": {**fallback, "cache": "bypass"}}
+        return
+
+    stream = _init().client.chat.completions.create(
+        model=s.openai_chat_model,
+        messages=_answer_messages(prompt),
+        temperature=0.2,
+        stream=True,
+    )
+    parts: list[str] = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            yield {"event": "token", "data": {"text": delta}}
+
+    answer = _finalize_answer("".join(parts).strip(), sources)
+    result = {"answer": answer, "sources": sources}
+    status = "bypass"
+    if cache is not None:
+        cache.set(cache_key, result)
+        status = "miss"
+    yield {"event": "completed", "data": {**result, "cache": status}}
+
+
+def _answer_messages(prompt: str) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": "You are PoliverAI, a careful compliance assistant."},
+        {"role": "user", "content": prompt},
+    ]
+
+
+def _prepare_answer(
+    question: str, s: Settings
+) -> tuple[list[dict[str, Any]], str, dict[str, Any] | None]:
+    """Retrieve context and build the chat prompt.
+
+    Returns ``(sources, prompt, fallback)``; ``fallback`` is a finished result
+    (no context, vector store error, no API key) when no chat call should be made.
+    """
     # Use hybrid retrieval and allow more context
     try:
-        items = retrieve(question, k=max(s.top_k * 2, 8))
+        items = retrieve(question, k=_answer_k(s))
     except Exception as e:
-        return {
-            "answer": (
-                "I couldn't access the vector store. Try ingesting documents first "
-                "or check the server logs.\n"
-                f"Details: {e}"
-            ),
-            "sources": [],
-        }
+        return [], "", _vector_store_error(e)
+    return _answer_context(question, s, items)
+
+
+def _answer_k(s: Settings) -> int:
+    return max(s.top_k * 2, 8)
+
+
+def _vector_store_error(e: Exception) -> dict[str, Any]:
+    return {
+        "answer": (
+            "I couldn't access the vector store. Try ingesting documents first "
+            "or check the server logs.\n"
+            f"Details: {e}"
+        ),
+        "sources": [],
+    }
+
+
+def _answer_context(
+    question: str, s: Settings, items: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], str, dict[str, Any] | None]:
+    context_items = []
+    sources: list[dict[str, Any]] = []
 
     if not items:
-        return {
+        return sources, "", {
             "answer": "I don't have any context ingested yet. "
             "Please upload some documents on the Ingest tab.",
             "sources": [],
@@ -702,30 +1775,20 @@ def answer_question(question: str) -> dict[str, Any]:
         f"Question: {question}\n\nContext:\n{context}\n\nAnswer (cite articles when possible):"
     )
 
-    init = _init()
     if not s.openai_api_key:
         # If no key set, return a brief summary from top snippets
-        if not sources:
-            return {"answer": "No context available. Please ingest documents first.", "sources": []}
         joined = "\n\n".join([x["snippet"] for x in sources[:5]])
-        return {
+        return sources, prompt, {
             "answer": (
                 "OpenAI key not configured. Based on the retrieved excerpts, "
                 "here are relevant snippets:\n\n" + joined
             ),
             "sources": sources,
         }
+    return sources, prompt, None
 
-    chat = init.client.chat.completions.create(
-        model=s.openai_chat_model,
-        messages=[
-            {"role": "system", "content": "You are PoliverAI, a careful compliance assistant."},
-            {"role": "user", "content": prompt},
-        ],
-        temperature=0.2,
-    )
-    answer = (chat.choices[0].message.content or "").strip()
 
+def _finalize_answer(answer: str, sources: list[dict[str, Any]]) -> str:
     # Final safeguard: if the model still refuses, provide a sources-based guidance
     lowered = answer.lower()
     if ("don't know" in lowered or "do not know" in lowered) and sources:
@@ -737,5 +1800,4 @@ def answer_question(question: str) -> dict[str, Any]:
             + " If this doesn't answer your question, try asking with "
             + "specific article names or terms."
         )
-
-    return {"answer": answer, "sources": sources}
+    return answer
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import multiprocessing
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from typing import Any
 
 from ..core.config import get_settings
 from ..knowledge.gdpr_articles import get_article_with_title
-from ..knowledge.mappings import map_requirement_to_articles
-from ..preprocessing.segment import split_into_paragraphs
-from .service import _init, retrieve
+from ..preprocessing.features import ClauseFeatures, clause_features, clause_hash, extract_clause_features
+from ..preprocessing.segment import iter_clauses
+from ..services.cache import DiskLRUCache, TTLCache
+from ..verification.rules.engine import RuleEngine
+from ..verification.rules.gdpr_rules import GDPR_DOCUMENT_RULES
+from .llm import chat_completion
+from .service import _collection_stamp, _encode, _init, retrieve, retrieve_async
 
 # Constants for verification
 MIN_MEANINGFUL_WORDS = 5
@@ -23,6 +35,14 @@ LARGE_DISTANCE_VALUE = 1e9
 # Performance optimization constants
 MAX_LLM_CLAUSES = 5  # Limit expensive LLM processing to most important clauses
 LLM_TIMEOUT_SECONDS = 10  # Timeout for LLM calls
+LLM_BATCH_TIMEOUT_SECONDS = 45  # Timeout for multi-clause LLM calls
+BATCH_PROMPT_OVERHEAD_TOKENS = 400  # System prompt + framing per batched request
+# Bump when a judge prompt changes so cached judgments from the old prompt are not reused
+JUDGE_PROMPT_VERSION = "judge-v1"
+BATCH_JUDGE_PROMPT_VERSION = "judge-batch-v1"
+# Bump when heuristics or scoring change; invalidates cached verification results
+# (edits to the rule catalogue are picked up through the engine's fingerprint)
+VERIFICATION_RULES_VERSION = "rules-v1"
 FAST_MODE_SCORE_THRESHOLD = 60  # Skip expensive processing if rule-based score is already good
 
 # Additional constants
@@ -44,11 +64,451 @@ MAX_VIOLATIONS_FOR_COMPLIANT = 1
 MAX_VIOLATIONS_FOR_PARTIAL = 3
 MAX_CRITICAL_FOR_PARTIAL = 2
 
+# Articles whose violations weigh most on the verdict; clauses judged to touch
+# them always escalate to the configured chat model in the judging cascade
+CRITICAL_ARTICLES = ("Article 6(1)", "Article 13", "Article 5(1)(e)")
+# "Article 6(1)(a) Lawfulness", "Art. 13" -> number and paragraph/point references
+_ARTICLE_REF = re.compile(r"\bart(?:icle|\.)?\s*(\d+)((?:\s*\(\w+\))*)", re.IGNORECASE)
 
-def _llm_judge_clause(clause: str, context_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+
+class Deadline:
+    """Wall-clock budget for one analysis; every LLM and retrieval timeout is capped by what is left."""
+
+    def __init__(self, seconds: float) -> None:
+        self.at = time.monotonic() + max(0.0, seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+def _timeout(deadline: Deadline | None, seconds: float) -> float:
+    # A fixed timeout, shortened to the time left before the deadline
+    return seconds if deadline is None else min(seconds, deadline.remaining())
+
+
+class JudgmentCacheCounter:
+    """Per-analysis judging counts (safe to share across threads).
+
+    Hit/miss counts for the judgment cache, plus, when the judging cascade is
+    configured, how many clauses a cheaper tier settled and how many escalated
+    to the chat model.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.settled = 0
+        self.escalated = 0
+        self._lock = threading.Lock()
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def record_cascade(self, escalated: bool) -> None:
+        with self._lock:
+            if escalated:
+                self.escalated += 1
+            else:
+                self.settled += 1
+
+    def as_metrics(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        metrics = {
+            "judgment_cache_hits": self.hits,
+            "judgment_cache_misses": self.misses,
+            "judgment_cache_hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+        if self.settled or self.escalated:
+            metrics.update(cascade_settled=self.settled, cascade_escalated=self.escalated)
+        return metrics
+
+
+_judgment_cache_state: DiskLRUCache | None = None
+
+
+def _judgment_cache() -> DiskLRUCache | None:
+    """Shared on-disk cache of LLM clause judgments, or None when disabled."""
+    global _judgment_cache_state  # noqa: PLW0603
+    s = get_settings()
+    if not s.judgment_cache_enabled:
+        return None
+    if _judgment_cache_state is None:
+        try:
+            _judgment_cache_state = DiskLRUCache(s.judgment_cache_path, s.judgment_cache_max_entries)
+        except Exception as e:
+            logging.warning("Judgment cache unavailable at %s: %s", s.judgment_cache_path, e)
+            return None
+    return _judgment_cache_state
+
+
+def judgment_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters for the clause judgment cache (per process) plus its size."""
+    cache = _judgment_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+def _judgment_cache_key(
+    clause: str, context_items: list[dict[str, Any]], prompt_version: str, model: str | None = None
+) -> str:
+    # Same clause text (modulo case/whitespace) + same model, prompt and context => same judgment
     s = get_settings()
+    ctx_ids = "\n".join(_context_key(c) for c in context_items[: s.top_k])
+    return "|".join(
+        [
+            model or s.openai_chat_model,
+            prompt_version,
+            clause_hash(clause),
+            hashlib.sha256(ctx_ids.encode("utf-8")).hexdigest(),
+        ]
+    )
+
+
+def _cached_judgments(key: str, counter: JudgmentCacheCounter | None) -> list[dict[str, Any]] | None:
+    cache = _judgment_cache()
+    if cache is None:
+        return None
+    raw = cache.get(key)
+    if counter is not None:
+        counter.record(raw is not None)
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def _store_judgments(key: str, judgments: list[dict[str, Any]]) -> None:
+    cache = _judgment_cache()
+    # Empty results may be parse failures; don't pin them
+    if cache is not None and judgments:
+        cache.set(key, json.dumps(judgments).encode("utf-8"))
+
+
+_rule_engine_state: RuleEngine | None = None
+
+
+def _rule_engine() -> RuleEngine:
+    global _rule_engine_state  # noqa: PLW0603
+    if _rule_engine_state is None:
+        _rule_engine_state = RuleEngine(GDPR_DOCUMENT_RULES)
+    return _rule_engine_state
+
+
+_result_cache_state: TTLCache | None = None
+
+
+def _result_cache() -> TTLCache | None:
+    """Whole-document verification results, shared across workers when a disk path is set."""
+    global _result_cache_state  # noqa: PLW0603
+    s = get_settings()
+    if not s.verification_cache_enabled:
+        return None
+    if _result_cache_state is None:
+        _result_cache_state = TTLCache(
+            s.verification_cache_max_entries, s.verification_cache_ttl_seconds, s.verification_cache_path
+        )
+    return _result_cache_state
+
+
+def _result_cache_key(text: str, analysis_mode: str, variant: str) -> str:
+    s = get_settings()
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    parts = [variant, VERIFICATION_RULES_VERSION, _rule_engine().fingerprint, analysis_mode]
+    if analysis_mode in {"balanced", "detailed"}:
+        # LLM modes also depend on the model, judge prompt and the indexed corpus
+        prompt = BATCH_JUDGE_PROMPT_VERSION if s.verification_batch_judging else JUDGE_PROMPT_VERSION
+        model = _judge_models(s) if s.openai_api_key else "heuristic"
+        parts += [model, prompt, s.chroma_collection, str(_collection_stamp(s))]
+    return "|".join([*parts, digest])
+
+
+def _cached_result(text: str, analysis_mode: str, variant: str = "verify") -> dict[str, Any] | None:
+    cache = _result_cache()
+    if cache is None:
+        return None
+    hit = cache.get(_result_cache_key(text, analysis_mode, variant))
+    if hit is None:
+        return None
+    value, age = hit
+    return {**value, "cache": "hit", "cache_age": int(age)}
+
+
+def _store_result(
+    text: str, analysis_mode: str, result: dict[str, Any], variant: str = "verify"
+) -> dict[str, Any]:
+    cache = _result_cache()
+    if cache is None:
+        return {**result, "cache": "bypass"}
+    cache.set(_result_cache_key(text, analysis_mode, variant), result)
+    return {**result, "cache": "miss"}
+
+
+def verification_cache_stats() -> dict[str, Any]:
+    cache = _result_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+def clear_verification_cache() -> None:
+    """Drop every cached verification result (e.g. after editing rules without bumping the version)."""
+    cache = _result_cache()
+    if cache is not None:
+        cache.clear()
+
+
+_analysis_records_state: DiskLRUCache | None = None
+
+
+def _analysis_records() -> DiskLRUCache | None:
+    """Per-clause judgments of past analyses, used by ``reanalyze_policy``."""
+    global _analysis_records_state  # noqa: PLW0603
+    s = get_settings()
+    if not s.analysis_records_enabled:
+        return None
+    if _analysis_records_state is None:
+        try:
+            _analysis_records_state = DiskLRUCache(s.analysis_records_path, s.analysis_records_max_entries)
+        except Exception as e:
+            logging.warning("Analysis records unavailable at %s: %s", s.analysis_records_path, e)
+            return None
+    return _analysis_records_state
+
+
+def _analysis_id(text: str, analysis_mode: str) -> str:
+    # Deterministic, so a caller holding only the previous text can still find its record
+    return hashlib.sha256(f"{analysis_mode}\n{text}".encode()).hexdigest()[:32]
+
+
+def _judge_models(s) -> str:
+    # The chat model, preceded by any cascade tiers; judgments depend on all of them
+    tiers = [f"{model}@{threshold}" for model, threshold in s.verification_cascade_tiers.items()]
+    return ">".join([*tiers, s.openai_chat_model])
+
+
+def _judge_signature(analysis_mode: str, have_key: bool) -> str:
+    # Judgments are only reusable when produced the same way
+    s = get_settings()
+    if analysis_mode == "fast" or not have_key:
+        return f"heuristic|{analysis_mode}"
+    prompt = BATCH_JUDGE_PROMPT_VERSION if s.verification_batch_judging else JUDGE_PROMPT_VERSION
+    return f"{_judge_models(s)}|{prompt}|{analysis_mode}"
+
+
+def _save_analysis_record(
+    analysis_id: str,
+    analysis_mode: str,
+    have_key: bool,
+    clauses: list[ClauseFeatures],
+    clause_judgments: dict[str, list[dict[str, Any]]],
+    llm_judged: set[str] | None = None,
+) -> None:
+    records = _analysis_records()
+    if records is None:
+        return
+    # Clauses the analysis skipped are stored as None; only the LLM judgments
+    # listed in "llm_judged" are reused by re-verification (heuristics are recomputed)
+    record = {
+        "mode": analysis_mode,
+        "signature": _judge_signature(analysis_mode, have_key),
+        "clauses": {c.hash: clause_judgments.get(c.hash) for c in clauses},
+        "llm_judged": sorted(llm_judged or ()),
+    }
+    try:
+        records.set(analysis_id, json.dumps(record).encode("utf-8"))
+    except Exception as e:
+        logging.warning("Failed to save analysis record %s: %s", analysis_id, e)
+
+
+def _load_analysis_record(analysis_id: str) -> dict[str, Any] | None:
+    records = _analysis_records()
+    raw = records.get(analysis_id) if records is not None else None
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def _llm_judge_clause(
+    clause: str,
+    context_items: list[dict[str, Any]],
+    counter: JudgmentCacheCounter | None = None,
+    deadline: Deadline | None = None,
+    model: str | None = None,
+) -> list[dict[str, Any]]:
+    s = get_settings()
+    key = _judgment_cache_key(clause, context_items, JUDGE_PROMPT_VERSION, model)
+    cached = _cached_judgments(key, counter)
+    if cached is not None:
+        return cached
     init = _init()
 
+    # Add timeout to OpenAI API call for better performance
+    resp = init.client.chat.completions.create(
+        model=model or s.openai_chat_model,
+        messages=_judge_messages(clause, context_items),
+        temperature=0.0,  # Make completely deterministic
+        seed=42,  # Ensure consistent results
+        timeout=_timeout(deadline, LLM_TIMEOUT_SECONDS),  # Add timeout for performance
+    )
+    judgments = _parse_judgments((resp.choices[0].message.content or "").strip())
+    _store_judgments(key, judgments)
+    return judgments
+
+
+async def _llm_judge_clause_async(
+    clause: str,
+    context_items: list[dict[str, Any]],
+    counter: JudgmentCacheCounter | None = None,
+    deadline: Deadline | None = None,
+    model: str | None = None,
+) -> list[dict[str, Any]]:
+    """Async ``_llm_judge_clause`` on the pooled client, under the "verify" concurrency limit."""
+    s = get_settings()
+    key = _judgment_cache_key(clause, context_items, JUDGE_PROMPT_VERSION, model)
+    cached = _cached_judgments(key, counter)
+    if cached is not None:
+        return cached
+    resp = await chat_completion(
+        "verify",
+        model=model or s.openai_chat_model,
+        messages=_judge_messages(clause, context_items),
+        temperature=0.0,
+        seed=42,
+        timeout=_timeout(deadline, LLM_TIMEOUT_SECONDS),
+    )
+    judgments = _parse_judgments((resp.choices[0].message.content or "").strip())
+    _store_judgments(key, judgments)
+    return judgments
+
+
+def _article_ref(article: str) -> tuple[str, ...] | None:
+    """("6", "1", "a") for "Article 6(1)(a) Lawfulness of processing"; None without an article number."""
+    m = _ARTICLE_REF.search(article)
+    if m is None:
+        return None
+    return (m.group(1), *re.findall(r"\((\w+)\)", m.group(2).lower()))
+
+
+_CRITICAL_REFS = [ref for ref in map(_article_ref, CRITICAL_ARTICLES) if ref is not None]
+
+
+def _is_critical_article(article: str) -> bool:
+    # A reference at or below a critical one counts: 6(1)(a) falls under 6(1)
+    ref = _article_ref(article)
+    return ref is not None and any(ref[: len(c)] == c for c in _CRITICAL_REFS)
+
+
+def _settles(judgments: list[dict[str, Any]] | None, threshold: float, clause_articles: tuple[str, ...] = ()) -> bool:
+    """Whether a cheaper cascade tier's judgments stand without escalation.
+
+    They do when there is at least one, each is at least ``threshold``
+    confident and none concerns a critical article, and the clause itself
+    (``clause_articles``, from its keywords) maps to no critical article. An
+    empty answer (nothing found, or unparseable output) escalates.
+    """
+    if not judgments or any(_is_critical_article(a) for a in clause_articles):
+        return False
+    for j in judgments:
+        if float(j.get("confidence", 0.0)) < threshold:
+            return False
+        if _is_critical_article(str(j.get("article", ""))):
+            return False
+    return True
+
+
+def _record_clause_lookups(counter: JudgmentCacheCounter | None, lookups: JudgmentCacheCounter) -> None:
+    # One hit or miss per clause however many tiers it went through: a hit when none needed a request
+    if counter is not None and (lookups.hits or lookups.misses):
+        counter.record(lookups.misses == 0)
+
+
+def _cascade_judge(
+    clause: str,
+    context_items: list[dict[str, Any]],
+    counter: JudgmentCacheCounter | None = None,
+    deadline: Deadline | None = None,
+) -> list[dict[str, Any]]:
+    """Judge a clause through the cascade: cheaper tiers first, the chat model only when they are unsure.
+
+    Without ``verification_cascade_tiers`` this is ``_llm_judge_clause``. When
+    the deadline passes mid-cascade the last tier's judgments are returned.
+    """
+    tiers = get_settings().verification_cascade_tiers
+    if not tiers:
+        return _llm_judge_clause(clause, context_items, counter, deadline)
+    articles = clause_features(clause).articles
+    lookups = JudgmentCacheCounter()
+    try:
+        judgments = None
+        for model, threshold in tiers.items():
+            try:
+                judgments = _llm_judge_clause(clause, context_items, lookups, deadline, model)
+            except Exception as e:
+                logging.warning("Cascade tier %s failed, escalating: %s", model, e)
+                continue
+            if _settles(judgments, threshold, articles):
+                if counter is not None:
+                    counter.record_cascade(escalated=False)
+                return judgments
+            if judgments and deadline is not None and deadline.expired:
+                return judgments
+        if counter is not None:
+            counter.record_cascade(escalated=True)
+        return _llm_judge_clause(clause, context_items, lookups, deadline)
+    finally:
+        _record_clause_lookups(counter, lookups)
+
+
+async def _cascade_judge_async(
+    clause: str,
+    context_items: list[dict[str, Any]],
+    counter: JudgmentCacheCounter | None = None,
+    deadline: Deadline | None = None,
+) -> list[dict[str, Any]]:
+    """Async ``_cascade_judge``."""
+    tiers = get_settings().verification_cascade_tiers
+    if not tiers:
+        return await _llm_judge_clause_async(clause, context_items, counter, deadline)
+    articles = clause_features(clause).articles
+    lookups = JudgmentCacheCounter()
+    try:
+        judgments = None
+        for model, threshold in tiers.items():
+            try:
+                judgments = await _llm_judge_clause_async(clause, context_items, lookups, deadline, model)
+            except Exception as e:
+                logging.warning("Cascade tier %s failed, escalating: %s", model, e)
+                continue
+            if _settles(judgments, threshold, articles):
+                if counter is not None:
+                    counter.record_cascade(escalated=False)
+                return judgments
+            if judgments and deadline is not None and deadline.expired:
+                return judgments
+        if counter is not None:
+            counter.record_cascade(escalated=True)
+        return await _llm_judge_clause_async(clause, context_items, lookups, deadline)
+    finally:
+        _record_clause_lookups(counter, lookups)
+
+
+def _judge_messages(clause: str, context_items: list[dict[str, Any]]) -> list[dict[str, str]]:
+    s = get_settings()
+
     # Build compact context with article labels if available
     parts: list[str] = []
     for item in context_items[: s.top_k]:
@@ -87,42 +547,15 @@ def _llm_judge_clause(clause: str, context_items: list[dict[str, Any]]) -> list[
             ),
         },
     ]
+    return messages
 
-    # Add timeout to OpenAI API call for better performance
-    resp = init.client.chat.completions.create(
-        model=s.openai_chat_model,
-        messages=messages,
-        temperature=0.0,  # Make completely deterministic
-        seed=42,  # Ensure consistent results
-        timeout=LLM_TIMEOUT_SECONDS,  # Add timeout for performance
-    )
-    content = (resp.choices[0].message.content or "").strip()
+
+def _parse_judgments(content: str) -> list[dict[str, Any]]:
     try:
         data = json.loads(content)
         judg = data.get("judgments", [])
         if isinstance(judg, list):
-            # Normalize
-            out: list[dict[str, Any]] = []
-            for j in judg:
-                article = str(j.get("article", "")).strip()
-                verdict = str(j.get("verdict", "unclear")).strip().lower()
-                rationale = str(j.get("rationale", "")).strip()
-                excerpt = str(j.get("policy_excerpt", "")).strip()
-                try:
-                    conf = float(j.get("confidence", 0.5))
-                except Exception:
-                    conf = 0.5
-                if article:
-                    out.append(
-                        {
-                            "article": article,
-                            "verdict": verdict,
-                            "rationale": rationale,
-                            "policy_excerpt": excerpt,
-                            "confidence": conf,
-                        }
-                    )
-            return out
+            return _normalize_judgments(judg)
     except Exception as e:
         logging.warning(f"Failed to parse LLM judgment response: {e}")
 
@@ -130,20 +563,43 @@ def _llm_judge_clause(clause: str, context_items: list[dict[str, Any]]) -> list[
     return []
 
 
-def _heuristic_judge_clause(
-    clause: str, context_items: list[dict[str, Any]]
-) -> list[dict[str, Any]]:
-    # Map simple keywords to articles as a fallback
-    arts = list(map_requirement_to_articles(clause))
+def _normalize_judgments(judg: list[Any]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for j in judg:
+        if not isinstance(j, dict):
+            continue
+        article = str(j.get("article", "")).strip()
+        verdict = str(j.get("verdict", "unclear")).strip().lower()
+        rationale = str(j.get("rationale", "")).strip()
+        excerpt = str(j.get("policy_excerpt", "")).strip()
+        try:
+            conf = float(j.get("confidence", 0.5))
+        except Exception:
+            conf = 0.5
+        if article:
+            out.append(
+                {
+                    "article": article,
+                    "verdict": verdict,
+                    "rationale": rationale,
+                    "policy_excerpt": excerpt,
+                    "confidence": conf,
+                }
+            )
+    return out
+
+
+def _heuristic_judgments(clause: ClauseFeatures) -> list[dict[str, Any]]:
+    # Map simple keywords to articles as a fallback (keyword hits come from feature extraction)
     out: list[dict[str, Any]] = []
-    for a in arts:
+    for a in clause.articles:
         out.append(
             {
                 "article": a,
                 "verdict": "unclear",
                 "rationale": "Heuristic mapping only; provide an OpenAI API key "
                 "for precise judgment.",
-                "policy_excerpt": clause[:160],
+                "policy_excerpt": clause.text[:160],
                 "confidence": 0.5,
             }
         )
@@ -151,123 +607,11 @@ def _heuristic_judge_clause(
 
 
 def _rule_based_compliance_check(text: str) -> dict[str, Any]:
-    """Apply deterministic rule-based compliance checks for common GDPR requirements."""
-    text_lower = text.lower()
-
-    violations = []
-    fulfills = []
-
-    # Article 6 - Lawful basis
-    lawful_basis_terms = ["lawful basis", "consent", "contract", "legal obligation"]
-    if not any(term in text_lower for term in lawful_basis_terms):
-        violations.append(
-            {
-                "article": "Article 6(1)",
-                "reason": "No clear lawful basis for processing stated",
-                "severity": "high",
-            }
-        )
-
-    # Article 13 - Information to be provided
-    required_info = ["purpose", "data controller", "contact"]
-    missing_info = [info for info in required_info if info not in text_lower]
-    if missing_info:
-        violations.append(
-            {
-                "article": "Article 13",
-                "reason": f"Missing required information: {', '.join(missing_info)}",
-                "severity": "medium",
-            }
-        )
+    """Apply deterministic rule-based compliance checks for common GDPR requirements.
 
-    # Article 17 - Right to erasure
-    erasure_terms = ["delete", "erasure", "remove data", "right to be forgotten"]
-    if not any(term in text_lower for term in erasure_terms):
-        violations.append(
-            {
-                "article": "Article 17",
-                "reason": "No mention of data deletion or right to erasure",
-                "severity": "medium",
-            }
-        )
-
-    # Article 5(1)(e) - Storage limitation
-    retention_terms = ["retention", "how long", "storage period", "delete after"]
-    if not any(term in text_lower for term in retention_terms):
-        violations.append(
-            {
-                "article": "Article 5(1)(e)",
-                "reason": "No data retention period specified",
-                "severity": "medium",
-            }
-        )
-
-    # Enhanced detection for automatic data collection (Article 13/14 - Information requirements)
-    auto_collect_terms = [
-        "automatically collect",
-        "automatic collection",
-        "may collect automatically",
-        "collect automatically",
-        "automatically obtained",
-        "automatic information",
-    ]
-    if any(term in text_lower for term in auto_collect_terms):
-        # Check if there's proper notice about automatic collection
-        disclosure_terms = [
-            "automatically collected information includes",
-            "types of information automatically collected",
-            "automatically collect the following",
-            "information collected automatically",
-        ]
-        if not any(term in text_lower for term in disclosure_terms):
-            violations.append(
-                {
-                    "article": "Article 13(1)(c)",
-                    "reason": (
-                        "Automatic data collection mentioned but insufficient "
-                        "disclosure of what data is collected"
-                    ),
-                    "severity": "high",
-                }
-            )
-
-    # Enhanced detection for data sharing without proper basis
-    sharing_terms = ["share", "sharing", "disclose", "third party", "third-party"]
-    if any(term in text_lower for term in sharing_terms):
-        # Check for proper lawful basis for sharing
-        basis_terms = ["lawful basis", "consent", "legitimate interest", "legal obligation"]
-        if not any(term in text_lower for term in basis_terms):
-            violations.append(
-                {
-                    "article": "Article 6(1)",
-                    "reason": "Data sharing mentioned without clear lawful basis",
-                    "severity": "high",
-                }
-            )
-
-    # Enhanced positive checks
-    if "gdpr" in text_lower or "data protection regulation" in text_lower:
-        fulfills.append({"article": "General Compliance", "reason": "Acknowledges GDPR compliance"})
-
-    # Check for specific article fulfillments
-    if any(term in text_lower for term in ["consent", "lawful basis", "article 6"]):
-        fulfills.append({"article": "Article 6(1)", "reason": "Mentions lawful basis or consent"})
-
-    if any(term in text_lower for term in ["data controller", "controller"]):
-        fulfills.append({"article": "Article 13", "reason": "Identifies data controller"})
-
-    if any(term in text_lower for term in ["contact", "email", "phone"]):
-        fulfills.append({"article": "Article 13", "reason": "Provides contact information"})
-
-    if any(term in text_lower for term in ["retention", "delete", "deletion", "remove"]):
-        fulfills.append(
-            {"article": "Article 5(1)(e)", "reason": "Addresses data retention/deletion"}
-        )
-
-    if "erasure" in text_lower or "right to be forgotten" in text_lower:
-        fulfills.append({"article": "Article 17", "reason": "Mentions right to erasure"})
-
-    return {"violations": violations, "fulfills": fulfills}
+    The rules live in ``GDPR_DOCUMENT_RULES`` and are evaluated in one pass over the text.
+    """
+    return _rule_engine().evaluate(text)
 
 
 def _add_rule_based_evidence(
@@ -321,70 +665,391 @@ def _add_rule_based_evidence(
     return article_severity_map
 
 
-def _process_clauses(
-    clauses: list[str],
-    have_key: bool,
-    s,
-    collections: dict[str, Any],
-) -> None:
-    """Process clauses with optimized LLM or heuristic judgment."""
-    all_evidence = collections["all_evidence"]
-    article_violations = collections["article_violations"]
-    article_fulfills = collections["article_fulfills"]
+def _retrieve_and_judge(
+    clause: str, k: int, counter: JudgmentCacheCounter | None = None, deadline: Deadline | None = None
+) -> list[dict[str, Any]] | None:
+    """LLM judgments for one clause, or None when retrieval finds no context (or time ran out)."""
+    ctx = retrieve(clause, k=k)
+    if not ctx or (deadline is not None and deadline.expired):
+        return None
+    return _cascade_judge(clause, ctx, counter, deadline)
 
-    # Performance optimization: prioritize longer, more substantial clauses for LLM processing
-    sorted_clauses = sorted(clauses, key=lambda x: -len(x.split()))
-    llm_processed_count = 0
 
-    for clause in sorted_clauses:
+class _SharedJudge:
+    """``_retrieve_and_judge`` that runs once per clause hash across concurrent walks.
+
+    A walk asking for a clause another walk is already judging waits for that
+    answer instead of making its own call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+
+    def __call__(
+        self, clause: str, k: int, counter: JudgmentCacheCounter | None = None, deadline: Deadline | None = None
+    ) -> list[dict[str, Any]] | None:
+        key = clause_hash(clause)
+        with self._lock:
+            fut = self._futures.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._futures[key] = Future()
+        if not owner:
+            return fut.result()
         try:
-            # Smart LLM usage: only process the most substantial clauses with LLM
-            should_use_llm = (
-                have_key
-                and len(clause.split()) > MIN_WORDS_FOR_LLM_PROCESSING
-                and llm_processed_count < MAX_LLM_CLAUSES
-            )
+            judgments = _retrieve_and_judge(clause, k, counter, deadline)
+        except Exception as e:
+            fut.set_exception(e)
+            raise
+        fut.set_result(judgments)
+        return judgments
 
-            if should_use_llm:
-                try:
-                    ctx = retrieve(clause, k=s.top_k)
-                    if ctx:
-                        judgments = _llm_judge_clause(clause, ctx)
-                        llm_processed_count += 1
-                    else:
-                        judgments = _heuristic_judge_clause(clause, [])
-                except Exception as e:
-                    # Fallback to heuristic if LLM fails
-                    logging.warning(f"LLM processing failed, using heuristic: {e}")
-                    judgments = _heuristic_judge_clause(clause, [])
-            else:
-                judgments = _heuristic_judge_clause(clause, [])
 
-        except Exception:
-            judgments = _heuristic_judge_clause(clause, [])
+def _judge_clauses_concurrently(
+    clauses: list[str],
+    candidates: list[int],
+    max_judged: int,
+    s,
+    counter: JudgmentCacheCounter | None = None,
+    deadline: Deadline | None = None,
+    known: dict[int, list[dict[str, Any]]] | None = None,
+    no_context: set[int] | None = None,
+    judge=None,
+) -> dict[int, list[dict[str, Any]]]:
+    """Run retrieval + LLM judging for ``candidates`` (indices into ``clauses``) on a thread pool.
+
+    Candidates are taken in order and at most ``max_judged`` of them end up
+    LLM-judged: when one fails, times out or has no context, the next
+    candidate is started, which picks the same clauses as a serial walk
+    would. Candidates in ``known`` (judgments from an earlier analysis) count
+    as judged without a call. At most ``verification_llm_concurrency`` calls
+    run at once and each gets ``verification_clause_timeout_seconds``, cut
+    short by ``deadline``, after which no new call starts. Returns judgments
+    by clause index; callers fall back to heuristics for the rest. Candidates
+    retrieval finds no context for are added to ``no_context``. ``judge``
+    replaces ``_retrieve_and_judge`` (see ``_SharedJudge``).
+    """
+    results: dict[int, list[dict[str, Any]]] = {}
+    if not candidates or max_judged <= 0:
+        return results
+    fan_out = max(1, min(s.verification_llm_concurrency, max_judged))
+    timeout = s.verification_clause_timeout_seconds
+    judge = judge or _retrieve_and_judge
+    queue = list(candidates)
+    running: dict[Future, tuple[int, float]] = {}  # future -> (clause index, give-up time)
+    pool = ThreadPoolExecutor(max_workers=fan_out, thread_name_prefix="clause-judge")
+    try:
+        while queue or running:
+            while queue and len(running) < fan_out and len(results) + len(running) < max_judged:
+                if deadline is not None and deadline.expired:
+                    queue.clear()
+                    break
+                idx = queue.pop(0)
+                if known and idx in known:
+                    results[idx] = known[idx]
+                    continue
+                running[pool.submit(judge, clauses[idx], s.top_k, counter, deadline)] = (
+                    idx,
+                    time.monotonic() + _timeout(deadline, timeout),
+                )
+            if not running:
+                break
+            next_expiry = min(expires for _, expires in running.values())
+            done, _ = wait(running, timeout=max(0.0, next_expiry - time.monotonic()), return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for fut in list(running):
+                idx, expires = running[fut]
+                if fut in done:
+                    del running[fut]
+                    try:
+                        judgments = fut.result()
+                    except Exception as e:
+                        # Fallback to heuristic if LLM fails
+                        logging.warning(f"LLM processing failed, using heuristic: {e}")
+                        continue
+                    if judgments is not None:
+                        results[idx] = judgments
+                    elif no_context is not None and not (deadline is not None and deadline.expired):
+                        no_context.add(idx)
+                elif now >= expires:
+                    # Threads can't be interrupted; abandon the call and move on
+                    del running[fut]
+                    logging.warning("LLM clause judgment timed out, using heuristic")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def _run_bounded(
+    fn, args_list: list[tuple], fan_out: int, timeout: float, deadline: Deadline | None = None
+) -> list[Any]:
+    """Call ``fn(*args)`` for each entry on a bounded thread pool.
+
+    Results come back in input order; a call that raises or exceeds ``timeout``
+    seconds (measured from when it starts), or is still pending at
+    ``deadline``, yields None.
+    """
+    results: list[Any] = [None] * len(args_list)
+    if not args_list:
+        return results
+    fan_out = max(1, min(fan_out, len(args_list)))
+    pending = list(range(len(args_list)))
+    running: dict[Future, tuple[int, float]] = {}  # future -> (index, give-up time)
+    pool = ThreadPoolExecutor(max_workers=fan_out, thread_name_prefix="clause-judge")
+    try:
+        while pending or running:
+            while pending and len(running) < fan_out:
+                if deadline is not None and deadline.expired:
+                    pending.clear()
+                    break
+                i = pending.pop(0)
+                running[pool.submit(fn, *args_list[i])] = (i, time.monotonic() + _timeout(deadline, timeout))
+            if not running:
+                break
+            next_expiry = min(expires for _, expires in running.values())
+            done, _ = wait(running, timeout=max(0.0, next_expiry - time.monotonic()), return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for fut in list(running):
+                i, expires = running[fut]
+                if fut in done:
+                    del running[fut]
+                    try:
+                        results[i] = fut.result()
+                    except Exception as e:
+                        logging.warning("Clause judging call failed: %s", e)
+                elif now >= expires:
+                    del running[fut]
+                    logging.warning("Clause judging call timed out")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def _context_key(item: dict[str, Any]) -> str:
+    meta = item.get("meta", {}) or {}
+    return str(item.get("id") or f"{meta.get('source', '')}|{meta.get('chunk', '')}|{(item.get('doc') or '')[:80]}")
+
+
+def _pack_judge_batches(
+    entries: list[tuple[int, str, list[dict[str, Any]]]], s
+) -> list[list[tuple[int, str, list[dict[str, Any]]]]]:
+    """Split (index, clause, context) entries into batches under the prompt token budget.
+
+    Context excerpts shared by several clauses are only counted (and later
+    sent) once per batch.
+    """
+    budget = s.verification_batch_token_budget - BATCH_PROMPT_OVERHEAD_TOKENS
+    batches: list[list[tuple[int, str, list[dict[str, Any]]]]] = []
+    current: list[tuple[int, str, list[dict[str, Any]]]] = []
+    seen: set[str] = set()
+    used = 0
+
+    def cost(clause: str, ctx: list[dict[str, Any]]) -> tuple[int, set[str]]:
+        new_ctx = {_context_key(c): c for c in ctx[: s.top_k] if _context_key(c) not in seen}
+        # ~16 tokens per excerpt label/reference
+        tokens = len(_encode(clause)) + sum(
+            len(_encode((c.get("doc") or "")[:800])) + 16 for c in new_ctx.values()
+        )
+        return tokens, set(new_ctx)
+
+    for entry in entries:
+        _, clause, ctx = entry
+        tokens, keys = cost(clause, ctx)
+        if current and (used + tokens > budget or len(current) >= s.verification_batch_max_clauses):
+            batches.append(current)
+            current, used = [], 0
+            seen.clear()
+            tokens, keys = cost(clause, ctx)
+        current.append(entry)
+        seen.update(keys)
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _batch_judge_messages(batch: list[tuple[int, str, list[dict[str, Any]]]], top_k: int) -> list[dict[str, str]]:
+    # Number each distinct excerpt once; clauses reference excerpts by label
+    labels: dict[str, str] = {}
+    excerpts: list[str] = []
+    clause_blocks: list[str] = []
+    for idx, clause, ctx in batch:
+        refs: list[str] = []
+        for item in ctx[:top_k]:
+            key = _context_key(item)
+            if key not in labels:
+                labels[key] = f"E{len(labels) + 1}"
+                meta = item.get("meta", {}) or {}
+                label = f"[{labels[key]} | {meta.get('article', '') or 'Unknown'} | {meta.get('source', '')}]"
+                excerpts.append(f"{label}\n{(item.get('doc') or '')[:800]}")
+            refs.append(labels[key])
+        clause_blocks.append(f'<clause id="{idx}" excerpts="{",".join(refs)}">\n{clause}\n</clause>')
 
-        for j in judgments:
-            art = j.get("article", "")
-            verdict = j.get("verdict", "unclear")
-            conf = float(j.get("confidence", 0.5))
-            excerpt = j.get("policy_excerpt") or clause[:200]
+    prompt = (
+        "You are PoliverAI, a GDPR compliance assistant.\n"
+        "You will receive numbered excerpts from GDPR and several policy clauses, each with an id "
+        "and the excerpts relevant to it. Judge every clause independently: determine which GDPR "
+        "articles it addresses, and whether it fulfills or violates them.\n"
+        "Respond strictly in JSON with this schema: {\n"
+        '  "results": [ {\n'
+        '    "clause_id": string,\n'
+        '    "judgments": [ {\n'
+        "      \"article\": string,              # e.g., 'Article 5(1)(e)'\n"
+        '      "verdict": "fulfills|violates|unclear",\n'
+        '      "rationale": string,\n'
+        '      "policy_excerpt": string,      # short quote from clause if applicable\n'
+        '      "confidence": number            # 0-1\n'
+        "    } ]\n"
+        "  } ]\n"
+        "}\n"
+        "Include one result per clause id. Only reference articles that are supported by the "
+        "excerpts listed for that clause."
+    )
+    return [
+        {"role": "system", "content": prompt},
+        {
+            "role": "user",
+            "content": (
+                "GDPR excerpts:\n" + "\n\n".join(excerpts) + "\n\n"
+                "Policy clauses:\n" + "\n\n".join(clause_blocks) + "\n\n"
+                "Return JSON now."
+            ),
+        },
+    ]
 
-            # Format article with title for better display
-            article_with_title = get_article_with_title(art)
 
-            all_evidence.append(
-                {
-                    "article": article_with_title,  # Now includes full title
-                    "policy_excerpt": excerpt,
-                    "score": round(max(0.0, min(1.0, conf)), 2),
-                    "verdict": verdict,
-                    "rationale": j.get("rationale", ""),
-                }
-            )
-            if verdict == "violates":
-                article_violations[art] = article_violations.get(art, 0) + 1
-            elif verdict == "fulfills":
-                article_fulfills[art] = article_fulfills.get(art, 0) + 1
+def _llm_judge_clauses_batch(
+    batch: list[tuple[int, str, list[dict[str, Any]]]],
+    deadline: Deadline | None = None,
+    model: str | None = None,
+) -> dict[int, list[dict[str, Any]]]:
+    """Judge several clauses in one completion; returns judgments keyed by clause index.
+
+    Clauses missing from the response are left out (callers fall back to heuristics).
+    """
+    s = get_settings()
+    resp = _init().client.chat.completions.create(
+        model=model or s.openai_chat_model,
+        messages=_batch_judge_messages(batch, s.top_k),
+        temperature=0.0,
+        seed=42,
+        timeout=_timeout(deadline, LLM_BATCH_TIMEOUT_SECONDS),
+    )
+    content = (resp.choices[0].message.content or "").strip()
+    wanted = {str(idx): (idx, clause, ctx) for idx, clause, ctx in batch}
+    out: dict[int, list[dict[str, Any]]] = {}
+    try:
+        data = json.loads(content)
+        for result in data.get("results", []) or []:
+            entry = wanted.get(str(result.get("clause_id", "")).strip())
+            if entry is not None and isinstance(result.get("judgments"), list):
+                idx, clause, ctx = entry
+                out[idx] = _normalize_judgments(result["judgments"])
+                _store_judgments(_judgment_cache_key(clause, ctx, BATCH_JUDGE_PROMPT_VERSION, model), out[idx])
+    except Exception as e:
+        logging.warning(f"Failed to parse batched LLM judgment response: {e}")
+    return out
+
+
+def _judge_clauses_batched(
+    clauses: list[str],
+    candidates: list[int],
+    s,
+    counter: JudgmentCacheCounter | None = None,
+    deadline: Deadline | None = None,
+    no_context: set[int] | None = None,
+) -> dict[int, list[dict[str, Any]]]:
+    """Batched counterpart of ``_judge_clauses_concurrently`` covering every candidate (time permitting).
+
+    Context is retrieved for all candidates concurrently, clauses are packed
+    into token-budgeted batches with shared excerpts de-duplicated, and the
+    batches are judged concurrently. With cascade tiers configured, each tier
+    judges in batches the clauses the previous tiers left unsettled.
+    """
+    if not candidates:
+        return {}
+    fan_out = s.verification_llm_concurrency
+    contexts = _run_bounded(
+        retrieve,
+        [(clauses[i], s.top_k) for i in candidates],
+        fan_out,
+        s.verification_clause_timeout_seconds,
+        deadline,
+    )
+    results: dict[int, list[dict[str, Any]]] = {}
+    pending = [(i, clauses[i], ctx) for i, ctx in zip(candidates, contexts, strict=True) if ctx]
+    if no_context is not None:
+        # None is a failed or timed-out retrieval, [] an empty one
+        no_context.update(i for i, ctx in zip(candidates, contexts, strict=True) if ctx == [])
+    tiers: list[tuple[str | None, float | None]] = [*s.verification_cascade_tiers.items(), (None, None)]
+    # Cache lookups per clause across tiers, recorded once per clause at the end
+    lookups = {entry[0]: JudgmentCacheCounter() for entry in pending}
+    articles = {i: clause_features(clause).articles for i, clause, _ in pending}
+    for model, threshold in tiers:
+        if not pending or (model is not None and deadline is not None and deadline.expired):
+            break
+        if model is None and len(tiers) > 1 and counter is not None:
+            for _ in pending:
+                counter.record_cascade(escalated=True)
+        judged = _judge_entries_batched(pending, model, s, lookups, deadline)
+        if threshold is None:
+            results.update(judged)
+            break
+        unsettled = []
+        for entry in pending:
+            judgments = judged.get(entry[0])
+            if _settles(judgments, threshold, articles[entry[0]]):
+                if counter is not None:
+                    counter.record_cascade(escalated=False)
+            else:
+                unsettled.append(entry)
+            if judgments:
+                # Best available until a stronger tier answers
+                results[entry[0]] = judgments
+        pending = unsettled
+    for clause_lookups in lookups.values():
+        _record_clause_lookups(counter, clause_lookups)
+    return results
+
+
+def _judge_entries_batched(
+    entries: list[tuple[int, str, list[dict[str, Any]]]],
+    model: str | None,
+    s,
+    lookups: dict[int, JudgmentCacheCounter],
+    deadline: Deadline | None = None,
+) -> dict[int, list[dict[str, Any]]]:
+    # (index, clause, context) entries judged by ``model`` in packed batches, cache first
+    results: dict[int, list[dict[str, Any]]] = {}
+    uncached = []
+    for entry in entries:
+        i, clause, ctx = entry
+        key = _judgment_cache_key(clause, ctx, BATCH_JUDGE_PROMPT_VERSION, model)
+        cached = _cached_judgments(key, lookups.get(i))
+        if cached is not None:
+            results[i] = cached
+        else:
+            uncached.append(entry)
+    batches = _pack_judge_batches(uncached, s)
+    judged = _run_bounded(
+        _llm_judge_clauses_batch,
+        [(b, deadline, model) for b in batches],
+        s.verification_llm_concurrency,
+        max(s.verification_clause_timeout_seconds, LLM_BATCH_TIMEOUT_SECONDS),
+        deadline,
+    )
+    for part in judged:
+        if part:
+            results.update(part)
+    logging.info(
+        "Batched judging (%s): %d clauses in %d requests (%d judged)",
+        model or s.openai_chat_model,
+        len(uncached),
+        len(batches),
+        len(results),
+    )
+    return results
 
 
 def _get_compliance_summary(
@@ -466,60 +1131,15 @@ def _generate_findings_and_recommendations(
     return findings, recommendations
 
 
-# Sensitive keywords that indicate clauses requiring detailed LLM analysis in balanced mode
-SENSITIVE_KEYWORDS = [
-    "collect",
-    "automatically",
-    "automatic",
-    "share",
-    "sharing",
-    "third-party",
-    "third party",
-    "retain",
-    "retention",
-    "store",
-    "storage",
-    "transfer",
-    "process",
-    "processing",
-    "consent",
-    "lawful basis",
-    "legal basis",
-    "children",
-    "minor",
-    "cookie",
-    "tracking",
-    "location",
-    "biometric",
-    "sensitive",
-    "special category",
-    "delete",
-    "deletion",
-    "erasure",
-    "right to be forgotten",
-    "profiling",
-    "automated decision",
-]
-
-
-def _is_sensitive_clause(clause: str) -> bool:
-    """Check if a clause contains sensitive keywords requiring detailed analysis."""
-    clause_lower = clause.lower()
-    return any(keyword in clause_lower for keyword in SENSITIVE_KEYWORDS)
-
-
 def _should_skip_expensive_processing_balanced(
-    clauses: list[str], rule_based_score: int, have_key: bool
+    clauses: list[ClauseFeatures], rule_based_score: int, have_key: bool
 ) -> bool:
     """Determine if expensive processing should be skipped in balanced mode."""
     if not have_key:
         return True  # Can't do LLM processing without API key
 
-    # Count sensitive clauses
-    sensitive_clauses = [clause for clause in clauses if _is_sensitive_clause(clause)]
-
     # If we have sensitive clauses, don't skip expensive processing
-    if sensitive_clauses:
+    if any(clause.sensitive for clause in clauses):
         return False
 
     # If rule-based score is already very high, skip expensive processing
@@ -530,61 +1150,221 @@ def _should_skip_expensive_processing_balanced(
     return True
 
 
-def _process_clauses_balanced(
-    clauses: list[str],
-    have_key: bool,
+@dataclass
+class _JudgingPlan:
+    """The clauses one analysis judges, in evidence order, and which may go to the LLM."""
+
+    clauses: list[ClauseFeatures]
+    candidates: list[int]  # indices into ``clauses``, in LLM priority order
+    max_judged: int  # LLM judgments wanted (batched judging takes every candidate)
+    skip_expensive_processing: bool  # heuristic-only fast processing
+
+
+def _plan_judging(
+    clauses: list[ClauseFeatures], analysis_mode: str, have_key: bool, rule_based_score: int
+) -> _JudgingPlan:
+    """Per-mode clause budget: fast = top 10 clauses by heuristics, balanced = the longest
+    ``MAX_LLM_CLAUSES`` sensitive clauses to the LLM (unless the rules already settle it),
+    detailed = the longest ``MAX_LLM_CLAUSES`` substantial clauses to the LLM."""
+    if analysis_mode == "detailed":
+        skip_expensive_processing = False  # Full LLM processing on all substantial clauses
+    elif analysis_mode == "balanced":
+        # Intelligent selective processing based on content sensitivity
+        skip_expensive_processing = _should_skip_expensive_processing_balanced(
+            clauses, rule_based_score, have_key
+        )
+    else:
+        # Fast, and the default for unknown modes
+        skip_expensive_processing = True
+    if skip_expensive_processing:
+        return _JudgingPlan(clauses[:10], [], 0, True)  # Limit to top 10 clauses for speed
+
+    if analysis_mode == "balanced":
+        # Longer sensitive clauses get priority for the LLM; non-sensitive ones only get heuristics
+        sensitive = sorted((c for c in clauses if c.sensitive), key=lambda c: -c.word_count)
+        ordered = sensitive + [c for c in clauses if not c.sensitive][:20]
+        candidates = [
+            i
+            for i, clause in enumerate(sensitive[:MAX_LLM_CLAUSES])
+            if have_key and clause.word_count > MIN_WORDS_FOR_LLM_PROCESSING
+        ]
+        return _JudgingPlan(ordered, candidates, len(candidates), False)
+
+    # Smart LLM usage: only the most substantial clauses go to the LLM
+    ordered = sorted(clauses, key=lambda c: -c.word_count)
+    candidates = [
+        i for i, clause in enumerate(ordered) if have_key and clause.word_count > MIN_WORDS_FOR_LLM_PROCESSING
+    ]
+    return _JudgingPlan(ordered, candidates, MAX_LLM_CLAUSES, False)
+
+
+def _judge_plan(
+    plan: _JudgingPlan,
     s,
-    collections: dict[str, Any],
+    counter: JudgmentCacheCounter | None = None,
+    known: dict[int, list[dict[str, Any]]] | None = None,
+    judge=None,
+) -> dict[int, list[dict[str, Any]]]:
+    """LLM judgments for the plan's candidates by clause index, reusing ``known`` ones."""
+    if not plan.candidates:
+        return {}
+    texts = [c.text for c in plan.clauses]
+    if not s.verification_batch_judging:
+        return _judge_clauses_concurrently(
+            texts, plan.candidates, plan.max_judged, s, counter, known=known, judge=judge
+        )
+    # Batched prompts are cheap enough to cover every candidate
+    known = known or {}
+    results = {i: known[i] for i in plan.candidates if i in known}
+    results.update(_judge_clauses_batched(texts, [i for i in plan.candidates if i not in known], s, counter))
+    return results
+
+
+def _judge_plans_together(
+    plans: list[_JudgingPlan], s, counter: JudgmentCacheCounter | None = None
+) -> list[dict[int, list[dict[str, Any]]]]:
+    """``_judge_plan`` for several plans at once, judging a clause they share (by hash) only once.
+
+    Batched judging covers every candidate, so the distinct candidates of all
+    plans go through one batched pass. The one-by-one walks run side by side,
+    each picking exactly what it would alone, and share in-flight judgments.
+    """
+    if s.verification_batch_judging:
+        texts: list[str] = []
+        slot: dict[str, int] = {}  # clause hash -> index into texts
+        for plan in plans:
+            for i in plan.candidates:
+                if plan.clauses[i].hash not in slot:
+                    slot[plan.clauses[i].hash] = len(texts)
+                    texts.append(plan.clauses[i].text)
+        judged = _judge_clauses_batched(texts, list(range(len(texts))), s, counter)
+        return [
+            {i: judged[slot[plan.clauses[i].hash]] for i in plan.candidates if slot[plan.clauses[i].hash] in judged}
+            for plan in plans
+        ]
+    judge = _SharedJudge()
+    with ThreadPoolExecutor(max_workers=max(1, len(plans)), thread_name_prefix="plan-judge") as pool:
+        futures = [pool.submit(_judge_plan, plan, s, counter, None, judge) for plan in plans]
+        return [f.result() for f in futures]
+
+
+def _apply_plan(
+    plan: _JudgingPlan, llm_judgments: dict[int, list[dict[str, Any]]], collections: dict[str, Any]
 ) -> None:
-    """Process clauses with balanced approach - LLM only on sensitive content."""
+    # Evidence in plan order; clauses without an LLM judgment get heuristic ones
+    for i, clause in enumerate(plan.clauses):
+        judgments = llm_judgments.get(i)
+        if judgments is None:
+            judgments = _heuristic_judgments(clause)
+        else:
+            collections["llm_judged"].add(clause.hash)
+        if plan.skip_expensive_processing:
+            _add_fast_judgments(judgments, clause, collections)
+        else:
+            _add_judgments_to_collections(judgments, clause, collections)
 
-    # Separate sensitive and non-sensitive clauses
-    sensitive_clauses = [
-        (i, clause) for i, clause in enumerate(clauses) if _is_sensitive_clause(clause)
-    ]
-    non_sensitive_clauses = [
-        (i, clause) for i, clause in enumerate(clauses) if not _is_sensitive_clause(clause)
-    ]
 
-    # Sort sensitive clauses by length (longer clauses get priority for LLM processing)
-    sensitive_clauses.sort(key=lambda x: -len(x[1].split()))
+def _add_fast_judgments(
+    judgments: list[dict[str, Any]], clause: ClauseFeatures, collections: dict[str, Any]
+) -> None:
+    # Fast processing keeps bare article ids in its evidence
+    _record_clause_judgments(collections, clause, judgments)
+    for j in judgments:
+        art = j.get("article", "")
+        verdict = j.get("verdict", "unclear")
+        conf = float(j.get("confidence", 0.5))
+        excerpt = j.get("policy_excerpt") or clause.text[:200]
 
-    llm_processed_count = 0
-    max_llm_for_balanced = min(MAX_LLM_CLAUSES, len(sensitive_clauses))  # Limit LLM processing
+        collections["all_evidence"].append(
+            {
+                "article": art,
+                "policy_excerpt": excerpt,
+                "score": round(max(0.0, min(1.0, conf)), 2),
+                "verdict": verdict,
+                "rationale": j.get("rationale", ""),
+            }
+        )
+        if verdict == "violates":
+            collections["article_violations"][art] = collections["article_violations"].get(art, 0) + 1
+        elif verdict == "fulfills":
+            collections["article_fulfills"][art] = collections["article_fulfills"].get(art, 0) + 1
 
-    # Process sensitive clauses with LLM (up to limit)
-    for _, clause in sensitive_clauses[:max_llm_for_balanced]:
-        try:
-            if have_key and len(clause.split()) > MIN_WORDS_FOR_LLM_PROCESSING:
-                ctx = retrieve(clause, k=s.top_k)
-                if ctx:
-                    judgments = _llm_judge_clause(clause, ctx)
-                    llm_processed_count += 1
-                else:
-                    judgments = _heuristic_judge_clause(clause, [])
-            else:
-                judgments = _heuristic_judge_clause(clause, [])
-        except Exception as e:
-            logging.warning(f"LLM processing failed for sensitive clause, using heuristic: {e}")
-            judgments = _heuristic_judge_clause(clause, [])
 
-        _add_judgments_to_collections(judgments, clause, collections)
+def _by_priority(clauses: list[ClauseFeatures], rule_based: dict[str, Any]) -> list[int]:
+    """Clause indices, most worth an LLM call first: sensitive, touching an article the rules flag, longest."""
+    gaps = {v["article"].split("(")[0] for v in rule_based["violations"]}
+
+    def key(i: int) -> tuple[bool, bool, int]:
+        clause = clauses[i]
+        return (
+            not clause.sensitive,
+            not any(a.split("(")[0] in gaps for a in clause.articles),
+            -clause.word_count,
+        )
+
+    return sorted(range(len(clauses)), key=key)
 
-    # Process remaining sensitive clauses with heuristics
-    for _, clause in sensitive_clauses[max_llm_for_balanced:]:
-        judgments = _heuristic_judge_clause(clause, [])
-        _add_judgments_to_collections(judgments, clause, collections)
 
-    # Process non-sensitive clauses with heuristics only
-    for _, clause in non_sensitive_clauses[:20]:  # Limit total clauses processed
-        judgments = _heuristic_judge_clause(clause, [])
-        _add_judgments_to_collections(judgments, clause, collections)
+def _coverage_metrics(judged: int, planned: int) -> dict[str, Any]:
+    # Share of the planned LLM judgments that finished before the deadline
+    return {
+        "coverage": round(judged / planned, 2) if planned else 1.0,
+        "clauses_judged": judged,
+        "clauses_planned": planned,
+    }
+
+
+def _process_clauses_anytime(
+    plan: _JudgingPlan,
+    rule_based: dict[str, Any],
+    s,
+    collections: dict[str, Any],
+    deadline: Deadline,
+) -> dict[str, Any]:
+    """Deadline-bound counterpart of ``_judge_plan``/``_apply_plan``.
+
+    Judges the same candidates as ``_judge_plan`` while time remains and folds
+    the evidence with ``_apply_plan``, so a run that finishes in time gives the
+    plain run's result. Batched judging covers every candidate, so it starts
+    with the most important ones (``_by_priority``); the one-by-one walk keeps
+    the plan's order, which decides what it picks. Returns the coverage metrics,
+    which leave out clauses retrieval found no context for: those never reach
+    the judge, deadline or not.
+    """
+    texts = [c.text for c in plan.clauses]
+    counter = collections.get("judgment_cache")
+    no_context: set[int] = set()
+    if not plan.candidates:
+        llm_judgments: dict[int, list[dict[str, Any]]] = {}
+        planned = 0
+    elif s.verification_batch_judging:
+        rank = {i: r for r, i in enumerate(_by_priority(plan.clauses, rule_based))}
+        ordered = sorted(plan.candidates, key=rank.__getitem__)
+        llm_judgments = _judge_clauses_batched(texts, ordered, s, counter, deadline, no_context)
+        planned = len(plan.candidates) - len(no_context)
+    else:
+        llm_judgments = _judge_clauses_concurrently(
+            texts, plan.candidates, plan.max_judged, s, counter, deadline, no_context=no_context
+        )
+        planned = min(plan.max_judged, len(plan.candidates) - len(no_context))
+    _apply_plan(plan, llm_judgments, collections)
+    return _coverage_metrics(len(llm_judgments), planned)
+
+
+def _record_clause_judgments(
+    collections: dict[str, Any], clause: ClauseFeatures, judgments: list[dict[str, Any]]
+) -> None:
+    # Per-clause judgments kept for incremental re-verification (first occurrence wins)
+    record = collections.get("clause_judgments")
+    if record is not None:
+        record.setdefault(clause.hash, list(judgments))
 
 
 def _add_judgments_to_collections(
-    judgments: list[dict[str, Any]], clause: str, collections: dict[str, Any]
+    judgments: list[dict[str, Any]], clause: ClauseFeatures, collections: dict[str, Any]
 ) -> None:
     """Add judgments to evidence collections."""
+    _record_clause_judgments(collections, clause, judgments)
     all_evidence = collections["all_evidence"]
     article_violations = collections["article_violations"]
     article_fulfills = collections["article_fulfills"]
@@ -593,7 +1373,7 @@ def _add_judgments_to_collections(
         art = j.get("article", "")
         verdict = j.get("verdict", "unclear")
         conf = float(j.get("confidence", 0.5))
-        excerpt = j.get("policy_excerpt") or clause[:200]
+        excerpt = j.get("policy_excerpt") or clause.text[:200]
 
         # Format article with title for better display
         article_with_title = get_article_with_title(art)
@@ -617,7 +1397,7 @@ def _calculate_analysis_confidence(
     analysis_mode: str,
     have_key: bool,
     all_evidence: list[dict[str, Any]],
-    clauses: list[str],
+    total_content: int,
     skip_expensive_processing: bool,
 ) -> float:
     """Calculate confidence score based on analysis quality and completeness."""
@@ -646,7 +1426,6 @@ def _calculate_analysis_confidence(
         evidence_factor = -0.05  # Lower confidence with little evidence
 
     # Document length factor (longer documents analyzed = higher confidence)
-    total_content = sum(len(clause.split()) for clause in clauses)
     if total_content >= DOCUMENT_LENGTH_SUBSTANTIAL:
         length_factor = 0.10  # Substantial document
     elif total_content >= DOCUMENT_LENGTH_MODERATE:
@@ -693,8 +1472,7 @@ def _calculate_score_and_verdict(
     total_fulfills = sum(article_fulfills.values())
 
     # Critical articles that must be addressed
-    critical_articles = ["Article 6(1)", "Article 13", "Article 5(1)(e)"]
-    critical_violations = sum(1 for art in critical_articles if art in article_violations)
+    critical_violations = sum(1 for art in CRITICAL_ARTICLES if art in article_violations)
 
     # Enhanced base score calculation
     if critical_violations >= CRITICAL_VIOLATIONS_MAJOR:
@@ -743,88 +1521,31 @@ def _calculate_score_and_verdict(
     return score, verdict
 
 
-def analyze_policy(text: str, analysis_mode: str = "fast") -> dict[str, Any]:
-    """Analyze a policy text for GDPR compliance.
-
-    Args:
-        text: Policy text to analyze
-        analysis_mode: Analysis depth - 'fast', 'balanced', or 'detailed'
-                      - fast: heuristic-only processing (fastest)
-                      - balanced: selective LLM processing on sensitive clauses (recommended)
-                      - detailed: full LLM processing on all substantial clauses "
-                      "(slowest but most thorough)
-    """
-    s = get_settings()
-    clauses = [c.text for c in split_into_paragraphs(text)]
-    clauses = [c for c in clauses if len(c.split()) >= MIN_MEANINGFUL_WORDS][
-        :MAX_CLAUSES_TO_PROCESS
-    ]
-
-    # First apply rule-based checks for deterministic baseline
-    rule_based = _rule_based_compliance_check(text)
-
-    all_evidence: list[dict[str, Any]] = []
-    article_violations: dict[str, int] = {}
-    article_fulfills: dict[str, int] = {}
-
-    # Add rule-based evidence and preserve severity mapping
-    article_severity_map = _add_rule_based_evidence(
-        rule_based, all_evidence, article_violations, article_fulfills
+def _meaningful_clauses(text: str) -> list[ClauseFeatures]:
+    # Feature records are computed once here and shared by every mode and the stream;
+    # segmentation is lazy, so text past the clause budget is never split
+    return extract_clause_features(
+        (c.text for c in iter_clauses(text)), MIN_MEANINGFUL_WORDS, MAX_CLAUSES_TO_PROCESS
     )
 
-    # PERFORMANCE OPTIMIZATION: Check if rule-based analysis is already sufficient
-    rule_based_score, _ = _calculate_score_and_verdict(article_violations, article_fulfills)
-
-    # Process clauses with smart optimization
-    have_key = bool(s.openai_api_key)
-    collections = {
-        "all_evidence": all_evidence,
-        "article_violations": article_violations,
-        "article_fulfills": article_fulfills,
-    }
 
-    # Analysis mode-based processing strategy
-    if analysis_mode == "fast":
-        skip_expensive_processing = True  # Pure heuristic processing
-    elif analysis_mode == "detailed":
-        skip_expensive_processing = False  # Full LLM processing on all substantial clauses
-    elif analysis_mode == "balanced":
-        # Intelligent selective processing based on content sensitivity
-        skip_expensive_processing = _should_skip_expensive_processing_balanced(
-            clauses, rule_based_score, have_key
-        )
-    else:
-        # Default to fast mode for unknown modes
-        skip_expensive_processing = True
+def _build_analysis_result(
+    analysis_mode: str,
+    have_key: bool,
+    clauses: list[ClauseFeatures],
+    collections: dict[str, Any],
+    article_severity_map: dict[str, str],
+    skip_expensive_processing: bool,
+    total_words: int | None = None,
+) -> dict[str, Any]:
+    """Score, findings, evidence and metrics from the filled evidence collections.
 
-    if not skip_expensive_processing:
-        if analysis_mode == "balanced":
-            _process_clauses_balanced(clauses, have_key, s, collections)
-        else:
-            _process_clauses(clauses, have_key, s, collections)
-    else:
-        # Use fast heuristic-only processing
-        for clause in clauses[:10]:  # Limit to top 10 clauses for speed
-            judgments = _heuristic_judge_clause(clause, [])
-            for j in judgments:
-                art = j.get("article", "")
-                verdict = j.get("verdict", "unclear")
-                conf = float(j.get("confidence", 0.5))
-                excerpt = j.get("policy_excerpt") or clause[:200]
-
-                all_evidence.append(
-                    {
-                        "article": art,
-                        "policy_excerpt": excerpt,
-                        "score": round(max(0.0, min(1.0, conf)), 2),
-                        "verdict": verdict,
-                        "rationale": j.get("rationale", ""),
-                    }
-                )
-                if verdict == "violates":
-                    article_violations[art] = article_violations.get(art, 0) + 1
-                elif verdict == "fulfills":
-                    article_fulfills[art] = article_fulfills.get(art, 0) + 1
+    ``total_words`` overrides the word count of ``clauses`` (for callers that never hold them).
+    """
+    all_evidence = collections["all_evidence"]
+    article_violations = collections["article_violations"]
+    article_fulfills = collections["article_fulfills"]
+    judgment_cache = collections.get("judgment_cache") or JudgmentCacheCounter()
 
     # Generate findings and recommendations with preserved severity
     findings, recommendations = _generate_findings_and_recommendations(
@@ -837,8 +1558,7 @@ def analyze_policy(text: str, analysis_mode: str = "fast") -> dict[str, Any]:
     # Calculate additional metrics for analysis
     total_violations = sum(article_violations.values())
     total_fulfills = sum(article_fulfills.values())
-    critical_articles = ["Article 6(1)", "Article 13", "Article 5(1)(e)"]
-    critical_violations = sum(1 for art in critical_articles if art in article_violations)
+    critical_violations = sum(1 for art in CRITICAL_ARTICLES if art in article_violations)
 
     # Generate compliance summary
     compliance_summary = _get_compliance_summary(
@@ -857,8 +1577,10 @@ def analyze_policy(text: str, analysis_mode: str = "fast") -> dict[str, Any]:
     ]
 
     # Calculate dynamic confidence score based on analysis quality
+    if total_words is None:
+        total_words = sum(clause.word_count for clause in clauses)
     confidence = _calculate_analysis_confidence(
-        analysis_mode, have_key, all_evidence, clauses, skip_expensive_processing
+        analysis_mode, have_key, all_evidence, total_words, skip_expensive_processing
     )
 
     return {
@@ -873,83 +1595,527 @@ def analyze_policy(text: str, analysis_mode: str = "fast") -> dict[str, Any]:
             "total_violations": total_violations,
             "total_fulfills": total_fulfills,
             "critical_violations": critical_violations,
+            **judgment_cache.as_metrics(),
         },
+        # Per-article counts behind the score (used for draft/final comparison)
+        "articles": {"violations": dict(article_violations), "fulfills": dict(article_fulfills)},
+    }
+
+
+def analyze_policy(
+    text: str, analysis_mode: str = "fast", deadline_seconds: float | None = None
+) -> dict[str, Any]:
+    """Analyze a policy text for GDPR compliance.
+
+    Args:
+        text: Policy text to analyze
+        analysis_mode: Analysis depth - 'fast', 'balanced', or 'detailed'
+                      - fast: heuristic-only processing (fastest)
+                      - balanced: selective LLM processing on sensitive clauses (recommended)
+                      - detailed: full LLM processing on all substantial clauses "
+                      "(slowest but most thorough)
+        deadline_seconds: Optional time budget. The mode's clauses are then
+                      LLM-judged until it runs out (retrieval and LLM timeouts
+                      are capped by what is left) and the best verdict so far is
+                      returned, with ``coverage``/``clauses_judged``/``clauses_planned``
+                      metrics. A run that finishes in time matches one without
+                      a deadline.
+
+    Results are cached by content hash, mode and rules/prompt version; the
+    returned ``cache`` field is "hit", "miss" or "bypass". A result cut short by
+    the deadline is neither cached nor kept for re-verification.
+    """
+    deadline = Deadline(deadline_seconds) if deadline_seconds is not None else None
+    cached = _cached_result(text, analysis_mode)
+    if cached is not None:
+        return cached
+
+    s = get_settings()
+    result, _ = _analyze_clauses(
+        text, _meaningful_clauses(text), analysis_mode, bool(s.openai_api_key), s, JudgmentCacheCounter(), deadline=deadline
+    )
+    coverage = result["metrics"]
+    if deadline is not None and coverage["clauses_judged"] < coverage["clauses_planned"]:
+        return {**result, "cache": "bypass"}
+    return _store_result(text, analysis_mode, result)
+
+
+@dataclass
+class _Analysis:
+    """One document between planning and its result: the plan plus the evidence gathered so far."""
+
+    text: str
+    clauses: list[ClauseFeatures]
+    analysis_mode: str
+    have_key: bool
+    rule_based: dict[str, Any]
+    collections: dict[str, Any]
+    article_severity_map: dict[str, str]
+    plan: _JudgingPlan
+
+
+def _prepare_analysis(
+    text: str,
+    clauses: list[ClauseFeatures],
+    analysis_mode: str,
+    have_key: bool,
+    judgment_cache: JudgmentCacheCounter,
+) -> _Analysis:
+    # First apply rule-based checks for deterministic baseline
+    rule_based = _rule_based_compliance_check(text)
+    collections: dict[str, Any] = {
+        "all_evidence": [],
+        "article_violations": {},
+        "article_fulfills": {},
+        "judgment_cache": judgment_cache,
+        "clause_judgments": {},
+        "llm_judged": set(),
     }
 
+    # Add rule-based evidence and preserve severity mapping
+    article_severity_map = _add_rule_based_evidence(
+        rule_based, collections["all_evidence"], collections["article_violations"], collections["article_fulfills"]
+    )
+
+    # PERFORMANCE OPTIMIZATION: Check if rule-based analysis is already sufficient
+    rule_based_score, _ = _calculate_score_and_verdict(
+        collections["article_violations"], collections["article_fulfills"]
+    )
+    plan = _plan_judging(clauses, analysis_mode, have_key, rule_based_score)
+    return _Analysis(
+        text, clauses, analysis_mode, have_key, rule_based, collections, article_severity_map, plan
+    )
+
+
+def _finish_analysis(analysis: _Analysis, coverage: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Build the result of a judged analysis; save its record unless ``coverage`` shows it was cut short."""
+    collections = analysis.collections
+    result = _build_analysis_result(
+        analysis.analysis_mode,
+        analysis.have_key,
+        analysis.clauses,
+        collections,
+        analysis.article_severity_map,
+        analysis.plan.skip_expensive_processing,
+    )
+    result["analysis_id"] = _analysis_id(analysis.text, analysis.analysis_mode)
+    if coverage is not None:
+        result["metrics"].update(coverage)
+    if coverage is None or coverage["clauses_judged"] >= coverage["clauses_planned"]:
+        _save_analysis_record(
+            result["analysis_id"],
+            analysis.analysis_mode,
+            analysis.have_key,
+            analysis.clauses,
+            collections["clause_judgments"],
+            collections["llm_judged"],
+        )
+    return result
+
 
-async def analyze_policy_stream(text: str, analysis_mode: str = "fast", progress_cb=None) -> dict[str, Any]:
+def _analyze_clauses(
+    text: str,
+    clauses: list[ClauseFeatures],
+    analysis_mode: str,
+    have_key: bool,
+    s,
+    judgment_cache: JudgmentCacheCounter,
+    known: dict[str, list[dict[str, Any]]] | None = None,
+    deadline: Deadline | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """``analyze_policy``'s result for ``text`` (uncached) and the evidence collections behind it.
+
+    LLM judgments in ``known`` (by clause hash) are reused for planned clauses
+    instead of being judged again. The analysis record is saved unless the
+    deadline cut the analysis short.
+    """
+    analysis = _prepare_analysis(text, clauses, analysis_mode, have_key, judgment_cache)
+    plan = analysis.plan
+    if deadline is not None:
+        coverage = _coverage_metrics(0, 0)
+        if not plan.skip_expensive_processing:
+            coverage = _process_clauses_anytime(plan, analysis.rule_based, s, analysis.collections, deadline)
+        else:
+            _apply_plan(plan, {}, analysis.collections)
+        return _finish_analysis(analysis, coverage), analysis.collections
+
+    known_by_index = {
+        i: known[plan.clauses[i].hash] for i in plan.candidates if known and plan.clauses[i].hash in known
+    }
+    _apply_plan(plan, _judge_plan(plan, s, judgment_cache, known_by_index), analysis.collections)
+    return _finish_analysis(analysis), analysis.collections
+
+
+def reanalyze_policy(
+    text: str,
+    analysis_mode: str = "fast",
+    previous_analysis_id: str | None = None,
+    previous_text: str | None = None,
+) -> dict[str, Any]:
+    """Re-verify a revised policy, judging only clauses that changed since a previous analysis.
+
+    The previous analysis is found by id or recomputed from its text. Clauses
+    are selected exactly as ``analyze_policy`` selects them; unchanged clauses
+    reuse their stored LLM judgments, new or edited ones are judged, and the
+    score is recomputed over the whole document, so the result is that of a
+    full run. Without a usable previous record this is a full ``analyze_policy``.
+    The result's ``incremental`` field reports reused/judged/removed clause counts.
+    """
+    s = get_settings()
+    have_key = bool(s.openai_api_key)
+    if previous_analysis_id is None and previous_text is not None:
+        previous_analysis_id = _analysis_id(previous_text, analysis_mode)
+    record = _load_analysis_record(previous_analysis_id) if previous_analysis_id else None
+    if record is None or record.get("signature") != _judge_signature(analysis_mode, have_key):
+        result = analyze_policy(text, analysis_mode=analysis_mode)
+        judged = len(_meaningful_clauses(text))
+        return {**result, "incremental": {"baseline": False, "reused": 0, "judged": judged, "removed": 0}}
+
+    previous: dict[str, Any] = record.get("clauses") or {}
+    known = {h: previous[h] for h in record.get("llm_judged") or () if previous.get(h) is not None}
+    clauses = _meaningful_clauses(text)
+    result, collections = _analyze_clauses(text, clauses, analysis_mode, have_key, s, JudgmentCacheCounter(), known)
+    hashes = {c.hash for c in clauses}
+    judged = collections["clause_judgments"]
+    result["incremental"] = {
+        "baseline": True,
+        "reused": sum(1 for c in clauses if c.hash in judged and c.hash in previous),
+        "judged": sum(1 for h in judged if h not in previous),
+        "removed": sum(1 for h in previous if h not in hashes),
+    }
+    return result
+
+
+def compare_policies(
+    draft: str,
+    final: str,
+    analysis_mode: str = "fast",
+    draft_clauses: list[ClauseFeatures] | None = None,
+    final_clauses: list[ClauseFeatures] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Analyze two versions of a policy together, judging clauses they share only once.
+
+    Each document gets exactly ``analyze_policy``'s clause selection, so its
+    result matches a /verify of it. Both documents are planned first and
+    judged concurrently (``_judge_plans_together``), so a clause in both
+    versions costs one judgment. Pass the ``_meaningful_clauses`` of either
+    text if the caller already has them. Returns ``(draft_result, final_result)``.
+    """
+    s = get_settings()
+    have_key = bool(s.openai_api_key)
+    judgment_cache = JudgmentCacheCounter()
+    if draft_clauses is None:
+        draft_clauses = _meaningful_clauses(draft)
+    if final_clauses is None:
+        final_clauses = _meaningful_clauses(final)
+    analyses = [
+        _prepare_analysis(text, clauses, analysis_mode, have_key, judgment_cache)
+        for text, clauses in ((draft, draft_clauses), (final, final_clauses))
+    ]
+    judged = _judge_plans_together([a.plan for a in analyses], s, judgment_cache)
+    for analysis, llm_judgments in zip(analyses, judged, strict=True):
+        _apply_plan(analysis.plan, llm_judgments, analysis.collections)
+    draft_result, final_result = (_finish_analysis(a) for a in analyses)
+    return draft_result, final_result
+
+
+_shard_pool_state: ProcessPoolExecutor | None = None
+_shard_pool_lock = threading.Lock()
+
+
+def _shard_pool(workers: int) -> ProcessPoolExecutor:
+    global _shard_pool_state  # noqa: PLW0603
+    with _shard_pool_lock:
+        if _shard_pool_state is None:
+            # Spawn keeps the workers free of the parent's Chroma/OpenAI threads
+            _shard_pool_state = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _shard_pool_state
+
+
+def shutdown_shard_pool() -> None:
+    """Stop the full-analysis worker processes (a new pool starts on next use)."""
+    global _shard_pool_state  # noqa: PLW0603
+    with _shard_pool_lock:
+        pool, _shard_pool_state = _shard_pool_state, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _analyze_shard(
+    segments: list[str], span: str, span_start: int, llm_budget: int, analysis_mode: str
+) -> dict[str, Any]:
+    """Rule term hits, evidence and article counters for one shard (runs in a worker process).
+
+    ``span`` is the shard's slice of the document (starting at ``span_start``),
+    scanned for rule terms. Every meaningful clause gets heuristic judgments;
+    in balanced/detailed mode up to ``llm_budget`` of the longest eligible
+    clauses are LLM-judged.
+    """
+    s = get_settings()
+    have_key = bool(s.openai_api_key)
+    clauses = extract_clause_features(segments, MIN_MEANINGFUL_WORDS)
+    counter = JudgmentCacheCounter()
+    collections: dict[str, Any] = {"all_evidence": [], "article_violations": {}, "article_fulfills": {}}
+    ranked = sorted(
+        (
+            i
+            for i, clause in enumerate(clauses)
+            if have_key
+            and llm_budget > 0
+            and analysis_mode in {"balanced", "detailed"}
+            and clause.word_count > MIN_WORDS_FOR_LLM_PROCESSING
+            and (analysis_mode == "detailed" or clause.sensitive)
+        ),
+        key=lambda i: -clauses[i].word_count,
+    )
+    texts = [c.text for c in clauses]
+    if not ranked:
+        llm_judgments: dict[int, list[dict[str, Any]]] = {}
+    elif s.verification_batch_judging:
+        llm_judgments = _judge_clauses_batched(texts, ranked[:llm_budget], s, counter)
+    else:
+        llm_judgments = _judge_clauses_concurrently(texts, ranked, llm_budget, s, counter)
+    for i, clause in enumerate(clauses):
+        _add_judgments_to_collections(llm_judgments.get(i) or _heuristic_judgments(clause), clause, collections)
+    term_hits = {t: [o + span_start for o in offsets] for t, offsets in _rule_engine().matcher.find(span).items()}
+    return {
+        **collections,
+        "term_hits": term_hits,
+        "clauses": len(clauses),
+        "words": sum(c.word_count for c in clauses),
+        "judgment_cache_hits": counter.hits,
+        "judgment_cache_misses": counter.misses,
+        "cascade_settled": counter.settled,
+        "cascade_escalated": counter.escalated,
+    }
+
+
+def _submit_shards(shards: list[tuple[list[str], str, int, int]], analysis_mode: str, s) -> list[Future] | None:
+    """Start the shards on the process pool; None when they should run in-process."""
+    if len(shards) < 2 or s.full_analysis_workers < 2:
+        return None
+    try:
+        pool = _shard_pool(s.full_analysis_workers)
+        return [pool.submit(_analyze_shard, *shard, analysis_mode) for shard in shards]
+    except Exception as e:
+        logging.warning("Shard pool unavailable, analyzing shards in-process: %s", e)
+        shutdown_shard_pool()
+        return None
+
+
+def _gather_shards(
+    futures: list[Future] | None, shards: list[tuple[list[str], str, int, int]], analysis_mode: str
+) -> list[dict[str, Any]]:
+    if futures is not None:
+        try:
+            return [f.result() for f in futures]
+        except Exception as e:
+            logging.warning("Shard pool failed, analyzing shards in-process: %s", e)
+            shutdown_shard_pool()
+    return [_analyze_shard(*shard, analysis_mode) for shard in shards]
+
+
+def analyze_policy_full(text: str, analysis_mode: str = "fast") -> dict[str, Any]:
+    """Analyze every clause of a long policy instead of the first ``MAX_CLAUSES_TO_PROCESS``.
+
+    The segmented text is split into shards of ``full_analysis_shard_clauses``
+    clauses. Each shard is scanned for rule terms and judged in parallel on a
+    process pool; the term hits are merged so the document-level rules are
+    decided exactly as over the whole text, and the per-shard article
+    counters are summed and scored once. The document's ``MAX_LLM_CLAUSES``
+    LLM budget is spread evenly over the shards, so LLM cost does not grow
+    with the document's length. ``metrics`` also reports ``clauses_analyzed``
+    and ``shards``.
+    """
+    cached = _cached_result(text, analysis_mode, "verify-full")
+    if cached is not None:
+        return cached
+
+    s = get_settings()
+    have_key = bool(s.openai_api_key)
+    segments = list(iter_clauses(text))
+    size = max(1, s.full_analysis_shard_clauses)
+    # Shard spans cut the text at line starts, which no rule term crosses
+    bounds = [0] + [text.rfind("\n", 0, segments[i].start or 0) + 1 for i in range(size, len(segments), size)]
+    bounds.append(len(text))
+    starts = range(0, len(segments), size)
+    # Shard k gets the budget's k-th 1/n share, with the remainder spread across the document
+    budgets = [
+        (k + 1) * MAX_LLM_CLAUSES // len(starts) - k * MAX_LLM_CLAUSES // len(starts) for k in range(len(starts))
+    ]
+    shards = [
+        ([c.text for c in segments[i : i + size]], text[bounds[k] : bounds[k + 1]], bounds[k], budgets[k])
+        for k, i in enumerate(starts)
+    ] or [([], text, 0, 0)]
+    futures = _submit_shards(shards, analysis_mode, s)
+
+    judgment_cache = JudgmentCacheCounter()
+    collections: dict[str, Any] = {
+        "all_evidence": [],
+        "article_violations": {},
+        "article_fulfills": {},
+        "judgment_cache": judgment_cache,
+    }
+    parts = _gather_shards(futures, shards, analysis_mode)
+
+    # Reduce: rules are decided on the merged term hits, then shard results are merged in document order
+    term_hits: dict[str, list[int]] = {}
+    for part in parts:
+        for term, offsets in part["term_hits"].items():
+            term_hits.setdefault(term, []).extend(offsets)
+    article_severity_map = _add_rule_based_evidence(
+        _rule_engine().decide(term_hits),
+        collections["all_evidence"],
+        collections["article_violations"],
+        collections["article_fulfills"],
+    )
+    clauses_analyzed = total_words = 0
+    for part in parts:
+        clauses_analyzed += part["clauses"]
+        total_words += part["words"]
+        collections["all_evidence"].extend(part["all_evidence"])
+        for key in ("article_violations", "article_fulfills"):
+            counts = collections[key]
+            for art, n in part[key].items():
+                counts[art] = counts.get(art, 0) + n
+        judgment_cache.hits += part["judgment_cache_hits"]
+        judgment_cache.misses += part["judgment_cache_misses"]
+        judgment_cache.settled += part["cascade_settled"]
+        judgment_cache.escalated += part["cascade_escalated"]
+
+    skip_expensive_processing = not have_key or analysis_mode not in {"balanced", "detailed"}
+    result = _build_analysis_result(
+        analysis_mode, have_key, [], collections, article_severity_map, skip_expensive_processing, total_words
+    )
+    result["metrics"].update(clauses_analyzed=clauses_analyzed, shards=len(shards))
+    return _store_result(text, analysis_mode, result, "verify-full")
+
+
+async def analyze_policy_stream(
+    text: str, analysis_mode: str = "fast", progress_cb=None, deadline_seconds: float | None = None
+) -> dict[str, Any]:
     """Async streaming variant of analyze_policy. Calls progress_cb(step_name, payload) during processing.
 
     progress_cb should be an async callable accepting (event_name: str, data: dict).
+    Results are cached like ``analyze_policy``'s (under their own keys, since the
+    streaming pass judges clauses differently); a hit is reported as a "cached" event.
+    No analysis record is saved, so re-verifying against the returned
+    ``analysis_id`` uses /verify's record for the same text, if there is one.
+    With ``deadline_seconds`` clauses are judged in priority order and those the
+    LLM doesn't reach in time keep their heuristic judgments, as in ``analyze_policy``.
     """
+    deadline = Deadline(deadline_seconds) if deadline_seconds is not None else None
+    cached = _cached_result(text, analysis_mode, "verify-stream")
+    if cached is not None:
+        if progress_cb:
+            await progress_cb("cached", {"mode": analysis_mode, "age": cached["cache_age"]})
+        return cached
+
     s = get_settings()
-    clauses = [c.text for c in split_into_paragraphs(text)]
-    clauses = [c for c in clauses if len(c.split()) >= MIN_MEANINGFUL_WORDS][:MAX_CLAUSES_TO_PROCESS]
+    clauses = _meaningful_clauses(text)
 
     # Initial progress
     if progress_cb:
         await progress_cb("started", {"clauses": len(clauses), "mode": analysis_mode})
 
-    # Rule-based baseline
-    rule_based = _rule_based_compliance_check(text)
+    # Rule-based baseline (one pass over the whole document; keep it off the event loop)
+    rule_based = await asyncio.to_thread(_rule_based_compliance_check, text)
     if progress_cb:
         await progress_cb("rule_based", {"violations": len(rule_based.get("violations", []))})
 
     all_evidence: list[dict[str, Any]] = []
     article_violations: dict[str, int] = {}
     article_fulfills: dict[str, int] = {}
+    judgment_cache = JudgmentCacheCounter()
+    collections = {
+        "all_evidence": all_evidence,
+        "article_violations": article_violations,
+        "article_fulfills": article_fulfills,
+        "judgment_cache": judgment_cache,
+    }
 
     article_severity_map = _add_rule_based_evidence(
         rule_based, all_evidence, article_violations, article_fulfills
     )
 
     have_key = bool(s.openai_api_key)
-
-    # Process clauses one by one and stream progress
-    processed = 0
-    for clause in clauses:
-        # lightweight heuristic first
-        judgments = _heuristic_judge_clause(clause, [])
-        _add_judgments_to_collections(judgments, clause, {"all_evidence": all_evidence, "article_violations": article_violations, "article_fulfills": article_fulfills})
-
-        # Optionally run LLM for important clauses
-        if have_key and len(clause.split()) > MIN_WORDS_FOR_LLM_PROCESSING:
-            try:
-                ctx = retrieve(clause, k=s.top_k)
-                if ctx:
-                    judgments = _llm_judge_clause(clause, ctx)
-                    _add_judgments_to_collections(judgments, clause, {"all_evidence": all_evidence, "article_violations": article_violations, "article_fulfills": article_fulfills})
-            except Exception as e:
-                logging.warning("LLM clause processing failed in stream: %s", e)
-
-        processed += 1
-        if progress_cb:
-            await progress_cb("progress", {"processed": processed, "total": len(clauses)})
-
-    # Finalize as in analyze_policy
-    findings, recommendations = _generate_findings_and_recommendations(article_violations, article_severity_map)
-    score, verdict = _calculate_score_and_verdict(article_violations, article_fulfills)
-    total_violations = sum(article_violations.values())
-    total_fulfills = sum(article_fulfills.values())
-    critical_articles = ["Article 6(1)", "Article 13", "Article 5(1)(e)"]
-    critical_violations = sum(1 for art in critical_articles if art in article_violations)
-    compliance_summary = _get_compliance_summary(verdict, score, critical_violations, total_violations)
-
-    evidence_sorted = sorted(all_evidence, key=lambda e: (1 if e.get("verdict") == "fulfills" else 0, e.get("score", 0.0)), reverse=True)
-    top_evidence = [{k: v for k, v in e.items() if k in {"article", "policy_excerpt", "score"}} for e in evidence_sorted[:10]]
-
-    confidence = _calculate_analysis_confidence(analysis_mode, have_key, all_evidence, clauses, False)
-
-    result = {
-        "verdict": verdict,
-        "score": score,
-        "confidence": confidence,
-        "evidence": top_evidence,
-        "findings": findings,
-        "recommendations": recommendations,
-        "summary": compliance_summary,
-        "metrics": {"total_violations": total_violations, "total_fulfills": total_fulfills, "critical_violations": critical_violations},
-    }
+    llm_slots = asyncio.Semaphore(max(1, s.verification_llm_concurrency))
+    llm_judged: set[int] = set()
+    no_context: set[int] = set()
+
+    async def judge(
+        index: int, clause: ClauseFeatures
+    ) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
+        # Lightweight heuristic first, then the LLM for substantial clauses
+        heuristic = _heuristic_judgments(clause)
+        llm: list[dict[str, Any]] = []
+        if have_key and clause.word_count > MIN_WORDS_FOR_LLM_PROCESSING:
+            async with llm_slots:
+                if deadline is not None and deadline.expired:
+                    return index, heuristic, llm
+                try:
+                    ctx = await asyncio.wait_for(
+                        retrieve_async(clause.text, k=s.top_k), deadline.remaining() if deadline else None
+                    )
+                    if ctx:
+                        llm = await asyncio.wait_for(
+                            _cascade_judge_async(clause.text, ctx, judgment_cache, deadline),
+                            _timeout(deadline, s.verification_clause_timeout_seconds),
+                        )
+                        llm_judged.add(index)
+                    else:
+                        no_context.add(index)
+                except Exception as e:
+                    logging.warning("LLM clause processing failed in stream: %s", e)
+        return index, heuristic, llm
+
+    # Judge clauses concurrently and stream each one as it finishes; under a
+    # deadline the most important clauses queue for the LLM first
+    order = _by_priority(clauses, rule_based) if deadline is not None else range(len(clauses))
+    results: dict[int, tuple[list[dict[str, Any]], list[dict[str, Any]]]] = {}
+    tasks = [asyncio.create_task(judge(i, clauses[i])) for i in order]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, heuristic, llm = await next_done
+            results[index] = (heuristic, llm)
+            if progress_cb:
+                await progress_cb(
+                    "clause_result",
+                    {
+                        "index": index,
+                        "clause": clauses[index].text[:200],
+                        "judgments": heuristic + llm,
+                        "source": "llm" if llm else "heuristic",
+                        "processed": len(results),
+                        "total": len(clauses),
+                    },
+                )
+                await progress_cb("progress", {"processed": len(results), "total": len(clauses)})
+    finally:
+        # Client went away (or a callback failed): stop outstanding LLM calls
+        for task in tasks:
+            task.cancel()
+
+    # Fold into the collections in document order so results don't depend on completion order
+    for index, clause in enumerate(clauses):
+        heuristic, llm = results[index]
+        _add_judgments_to_collections(heuristic, clause, collections)
+        _add_judgments_to_collections(llm, clause, collections)
+
+    result = _build_analysis_result(analysis_mode, have_key, clauses, collections, article_severity_map, False)
+    result["analysis_id"] = _analysis_id(text, analysis_mode)
+    complete = True
+    if deadline is not None:
+        # Clauses retrieval found no context for are never judged, deadline or not
+        planned = sum(1 for c in clauses if have_key and c.word_count > MIN_WORDS_FOR_LLM_PROCESSING)
+        planned -= len(no_context)
+        result["metrics"].update(_coverage_metrics(len(llm_judged), planned))
+        complete = len(llm_judged) >= planned
+    # No analysis record: the stream judges clauses differently from /verify, and
+    # its record would replace /verify's under the same analysis_id
+    result = _store_result(text, analysis_mode, result, "verify-stream") if complete else {**result, "cache": "bypass"}
 
     if progress_cb:
         await progress_cb("completed", result)
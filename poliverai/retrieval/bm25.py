@@ -0,0 +1,183 @@
+"""Inverted index with Okapi BM25 scoring.
+
+Documents are added as pre-tokenized term lists so the index stays agnostic of
+the tokenizer. Only the forward index (term frequencies per document) is
+persisted; postings and collection statistics are rebuilt on load. Several
+processes may maintain one index file: ``save`` merges this process's changes
+into whatever another process wrote since, under a file lock.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    # Exclusive across processes; threads of one process are serialized by the index's lock
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class BM25Index:
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self.dirty = False
+        self._docs: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_length = 0
+        # Changes since the last load or save: doc id -> term frequencies, or None when removed
+        self._pending: dict[str, dict[str, int] | None] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, doc_id: str, terms: Iterable[str]) -> None:
+        """Index (or re-index) one document."""
+        tf = dict(Counter(terms))
+        with self._lock:
+            self._index(doc_id, tf)
+            self._pending[doc_id] = tf
+
+    def _index(self, doc_id: str, tf: dict[str, int]) -> None:
+        self._remove(doc_id)
+        self._docs[doc_id] = tf
+        length = sum(tf.values())
+        self._lengths[doc_id] = length
+        self._total_length += length
+        for term, n in tf.items():
+            self._postings.setdefault(term, {})[doc_id] = n
+        self.dirty = True
+
+    def remove(self, doc_ids: Iterable[str]) -> None:
+        with self._lock:
+            for doc_id in doc_ids:
+                self._remove(doc_id)
+                self._pending[doc_id] = None
+
+    def _remove(self, doc_id: str) -> None:
+        tf = self._docs.pop(doc_id, None)
+        if tf is None:
+            return
+        self._total_length -= self._lengths.pop(doc_id, 0)
+        for term in tf:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self._postings[term]
+        self.dirty = True
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        n = len(self._docs)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def _term_score(self, idf: float, tf: int, length: int, avg_length: float) -> float:
+        norm = self.k1 * (1.0 - self.b + self.b * length / avg_length)
+        return idf * tf * (self.k1 + 1.0) / (tf + norm)
+
+    def score(self, terms: list[str], doc_ids: Iterable[str]) -> dict[str, float]:
+        """BM25 scores of ``doc_ids`` for the query ``terms`` (unknown ids score 0)."""
+        wanted = list(doc_ids)
+        with self._lock:
+            scores = dict.fromkeys(wanted, 0.0)
+            if not self._docs:
+                return scores
+            avg_length = self._total_length / len(self._docs) or 1.0
+            for term in set(terms):
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                idf = self._idf(term)
+                for doc_id in wanted:
+                    tf = posting.get(doc_id)
+                    if tf:
+                        scores[doc_id] += self._term_score(idf, tf, self._lengths[doc_id], avg_length)
+            return scores
+
+    def search(self, terms: list[str], k: int) -> list[tuple[str, float]]:
+        """Top-``k`` documents by BM25 score, walking only the postings of the query terms."""
+        with self._lock:
+            if not self._docs:
+                return []
+            avg_length = self._total_length / len(self._docs) or 1.0
+            scores: dict[str, float] = {}
+            for term in set(terms):
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                idf = self._idf(term)
+                for doc_id, tf in posting.items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + self._term_score(
+                        idf, tf, self._lengths[doc_id], avg_length
+                    )
+        return sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:k]
+
+    def save(self, path: str | Path) -> None:
+        """Write the index atomically (readers never see a partial file).
+
+        Under a lock file next to ``path``, the file is re-read first and only
+        the documents this index added or removed since its last load or save
+        are applied on top, so concurrent writers don't drop each other's
+        documents. Afterwards this index holds the merged contents.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with self._lock, _file_lock(path.with_suffix(path.suffix + ".lock")):
+            if path.exists():
+                try:
+                    self._rebase(BM25Index.load(path))
+                except (OSError, ValueError) as e:
+                    logger.warning("Could not merge with BM25 index at %s: %s; overwriting", path, e)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"k1": self.k1, "b": self.b, "docs": self._docs}, f)
+            os.replace(tmp, path)
+            self._pending.clear()
+            self.dirty = False
+
+    def _rebase(self, base: BM25Index) -> None:
+        # Adopt ``base``'s documents, then replay this index's pending changes on top
+        for doc_id, tf in self._pending.items():
+            if tf is None:
+                base._remove(doc_id)
+            else:
+                base._index(doc_id, tf)
+        self._docs, self._lengths = base._docs, base._lengths
+        self._postings, self._total_length = base._postings, base._total_length
+
+    @classmethod
+    def load(cls, path: str | Path) -> BM25Index:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        index = cls(k1=float(data.get("k1", 1.2)), b=float(data.get("b", 0.75)))
+        for doc_id, tf in (data.get("docs") or {}).items():
+            index._index(doc_id, tf)
+        index.dirty = False
+        return index
@@ -0,0 +1,403 @@
+"""Flat float32 vector store with the subset of the Chroma collection API the RAG service uses.
+
+Embeddings live in append-only ``.npy`` segments that readers open with
+``mmap_mode="r"``, so every worker process on a host shares the same
+page-cache copy. Each segment has a JSON file next to it with the ids,
+documents and metadata of its rows, plus the ids it deletes from earlier
+segments. A write adds one segment holding only the rows it writes (a delete
+adds a segment of tombstones) and atomically swaps ``index.json`` to list it;
+readers notice the swap on their next call and map the new segments.
+
+Rows in later segments shadow earlier rows with the same id. The last two
+segments are merged whenever the older one is at most twice the size of the
+newer, which keeps O(log N) segments and makes a bulk ingest O(N log N)
+overall. Writers serialize on a lock file, so several processes can write to
+the same collection.
+
+Search is exact (brute force) and returns squared L2 distances like Chroma's
+default space, so hybrid scoring behaves the same with either backend. When
+``use_faiss`` is set and ``faiss`` is installed, a flat FAISS index is built
+per segment instead of the NumPy matmul. FAISS copies the vectors into its
+own memory, so in that mode each process holds a private copy of the index
+rather than sharing the mapped files.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from bisect import bisect_right
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+
+try:
+    import faiss
+except Exception:  # pragma: no cover - optional dependency
+    faiss = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_POINTER_FILE = "index.json"
+_LOCK_FILE = "write.lock"
+# Readers retry when a concurrent merge unlinks a segment between reading the pointer and mapping it
+_LOAD_ATTEMPTS = 3
+
+
+class VectorCollection(Protocol):
+    """Structural type for the collection operations used by ``poliverai.rag.service``."""
+
+    def upsert(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str] | None = None,
+        metadatas: list[dict[str, Any]] | None = None,
+    ) -> None: ...
+
+    def delete(self, ids: list[str]) -> None: ...
+
+    def get(
+        self, ids: list[str] | None = None, where: dict[str, Any] | None = None, include: list[str] | None = None
+    ) -> dict[str, Any]: ...
+
+    def query(
+        self, query_embeddings: list[list[float]], n_results: int = 10, include: list[str] | None = None
+    ) -> dict[str, Any]: ...
+
+    def count(self) -> int: ...
+
+
+def _matches(meta: dict[str, Any] | None, where: dict[str, Any] | None) -> bool:
+    # Only flat equality filters are supported (all the service needs)
+    if not where:
+        return True
+    meta = meta or {}
+    return all(meta.get(k) == v for k, v in where.items())
+
+
+@contextmanager
+def _write_lock(path: Path) -> Iterator[None]:
+    # Exclusive across processes; threads of one process are serialized by the collection's lock
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@dataclass
+class _Segment:
+    matrix: np.ndarray  # memory-mapped rows; (0, 0) for a segment of tombstones only
+    ids: list[str]
+    documents: list[str]
+    metadatas: list[dict[str, Any]]
+    deleted: list[str]  # ids removed from earlier segments
+    sq_norms: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    live: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))  # rows not shadowed later
+    faiss_index: Any = None
+
+
+@dataclass
+class _Snapshot:
+    """One consistent view of the collection; replaced as a whole when the pointer changes."""
+
+    segments: list[_Segment] = field(default_factory=list)
+    offsets: list[int] = field(default_factory=list)  # first flat row of each segment
+    positions: dict[str, int] = field(default_factory=dict)  # live id -> flat row
+
+    def row(self, flat: int) -> tuple[_Segment, int]:
+        k = bisect_right(self.offsets, flat) - 1
+        return self.segments[k], flat - self.offsets[k]
+
+
+class NumpyVectorCollection:
+    """Exact-search vector collection persisted as memory-mapped NumPy segments under ``path``."""
+
+    def __init__(self, path: str | Path, use_faiss: bool = False) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.use_faiss = use_faiss and faiss is not None
+        if use_faiss and faiss is None:
+            logger.warning("faiss is not installed; falling back to NumPy search")
+        self._lock = threading.RLock()
+        self._stamp: tuple[int, int] | None = None
+        self._snapshot = _Snapshot()
+        self._refresh()
+
+    # -- persistence -----------------------------------------------------------
+
+    def _read_manifest(self) -> dict[str, Any]:
+        try:
+            info = json.loads((self.path / _POINTER_FILE).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {"segments": [], "next": 1}
+        if "generation" in info:
+            # Single-generation layout written by earlier versions: read it as one segment
+            gen = int(info["generation"])
+            entry = {
+                "embeddings": f"embeddings-{gen}.npy",
+                "records": f"records-{gen}.json",
+                "rows": int(info.get("count", 0)),
+                "deleted": 0,
+            }
+            return {"segments": [entry], "next": 1}
+        return info
+
+    def _load_segment(self, entry: dict[str, Any]) -> _Segment:
+        with open(self.path / entry["records"], encoding="utf-8") as f:
+            records = json.load(f)
+        if entry.get("embeddings"):
+            matrix = np.load(self.path / entry["embeddings"], mmap_mode="r")
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        return _Segment(
+            matrix, records["ids"], records["documents"], records["metadatas"], records.get("deleted", [])
+        )
+
+    def _refresh(self) -> None:
+        """Map the current segments if another process (or this one) replaced the pointer."""
+        for attempt in range(_LOAD_ATTEMPTS):
+            try:
+                st = os.stat(self.path / _POINTER_FILE)
+            except OSError:
+                return
+            # os.replace gives the pointer a new inode, so this changes even on coarse-mtime filesystems
+            stamp = (st.st_ino, st.st_mtime_ns)
+            if stamp == self._stamp:
+                return
+            with self._lock:
+                try:
+                    segments = [self._load_segment(e) for e in self._read_manifest()["segments"]]
+                except (OSError, ValueError, KeyError) as e:
+                    if attempt + 1 < _LOAD_ATTEMPTS:
+                        continue
+                    logger.warning("Failed to load vector index from %s: %s", self.path, e)
+                    return
+                self._snapshot = self._build_snapshot(segments)
+                self._stamp = stamp
+                return
+
+    def _build_snapshot(self, segments: list[_Segment]) -> _Snapshot:
+        snap = _Snapshot(segments=segments)
+        flat = 0
+        for seg in segments:
+            snap.offsets.append(flat)
+            for cid in seg.deleted:
+                snap.positions.pop(cid, None)
+            for r, cid in enumerate(seg.ids):
+                snap.positions[cid] = flat + r
+            flat += len(seg.ids)
+        for seg in segments:
+            seg.live = np.zeros(len(seg.ids), dtype=bool)
+        for flat_row in snap.positions.values():
+            seg, r = snap.row(flat_row)
+            seg.live[r] = True
+        for seg in segments:
+            if not len(seg.ids):
+                continue
+            seg.sq_norms = np.einsum("ij,ij->i", seg.matrix, seg.matrix)
+            if self.use_faiss:
+                index = faiss.IndexFlatL2(seg.matrix.shape[1])
+                index.add(np.ascontiguousarray(seg.matrix, dtype=np.float32))
+                seg.faiss_index = index
+        return snap
+
+    def _write_segment(
+        self,
+        name: str,
+        matrix: np.ndarray | None,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+        deleted: list[str],
+    ) -> dict[str, Any]:
+        embeddings = None
+        if ids:
+            embeddings = f"{name}.npy"
+            np.save(self.path / embeddings, np.ascontiguousarray(matrix, dtype=np.float32))
+        with open(self.path / f"{name}.json", "w", encoding="utf-8") as f:
+            json.dump({"ids": ids, "documents": documents, "metadatas": metadatas, "deleted": deleted}, f)
+        return {"embeddings": embeddings, "records": f"{name}.json", "rows": len(ids), "deleted": len(deleted)}
+
+    def _merge(self, older: dict[str, Any], newer: dict[str, Any], name: str, first: bool) -> dict[str, Any]:
+        a, b = self._load_segment(older), self._load_segment(newer)
+        gone = set(b.deleted) | set(b.ids)
+        keep = [r for r, cid in enumerate(a.ids) if cid not in gone]
+        ids = [a.ids[r] for r in keep] + b.ids
+        parts = [np.asarray(a.matrix[keep]) if keep else None, np.asarray(b.matrix) if b.ids else None]
+        parts = [p for p in parts if p is not None]
+        matrix = np.concatenate(parts) if parts else None
+        # Tombstones only matter while there are earlier segments to apply them to
+        deleted = [] if first else list(dict.fromkeys(a.deleted + b.deleted))
+        return self._write_segment(
+            name,
+            matrix,
+            ids,
+            [a.documents[r] for r in keep] + b.documents,
+            [a.metadatas[r] for r in keep] + b.metadatas,
+            deleted,
+        )
+
+    def _append(
+        self,
+        matrix: np.ndarray | None,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+        deleted: list[str],
+    ) -> None:
+        with self._lock, _write_lock(self.path / _LOCK_FILE):
+            # Re-read under the lock: another process may have written since our last refresh
+            manifest = self._read_manifest()
+            segments, nxt = list(manifest["segments"]), int(manifest["next"])
+            segments.append(self._write_segment(f"seg-{nxt}", matrix, ids, documents, metadatas, deleted))
+            nxt += 1
+            obsolete: list[dict[str, Any]] = []
+
+            def size(entry: dict[str, Any]) -> int:
+                return entry["rows"] + entry["deleted"]
+
+            while len(segments) >= 2 and size(segments[-2]) <= 2 * size(segments[-1]):
+                older, newer = segments[-2], segments[-1]
+                merged = self._merge(older, newer, f"seg-{nxt}", first=len(segments) == 2)
+                nxt += 1
+                obsolete += [older, newer]
+                segments[-2:] = [merged]
+
+            tmp = self.path / f"{_POINTER_FILE}.tmp"
+            tmp.write_text(json.dumps({"segments": segments, "next": nxt}), encoding="utf-8")
+            os.replace(tmp, self.path / _POINTER_FILE)
+            # Readers may still map merged-away segments; unlinking is safe on POSIX
+            for entry in obsolete:
+                for name in (entry["embeddings"], entry["records"]):
+                    if name:
+                        try:
+                            (self.path / name).unlink()
+                        except OSError:
+                            pass
+        self._refresh()
+
+    # -- collection API --------------------------------------------------------
+
+    def count(self) -> int:
+        self._refresh()
+        return len(self._snapshot.positions)
+
+    def upsert(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str] | None = None,
+        metadatas: list[dict[str, Any]] | None = None,
+    ) -> None:
+        if not ids:
+            return
+        new = np.asarray(embeddings, dtype=np.float32)
+        docs = documents or [""] * len(ids)
+        metas = metadatas or [{}] * len(ids)
+        self._refresh()
+        dim = next((seg.matrix.shape[1] for seg in self._snapshot.segments if len(seg.ids)), None)
+        if dim is not None and new.shape[1] != dim:
+            raise ValueError(f"Embedding dimension {new.shape[1]} does not match index dimension {dim}")
+        # A repeated id within the batch keeps its last row
+        last = list({cid: i for i, cid in enumerate(ids)}.values())
+        self._append(
+            new[last],
+            [ids[i] for i in last],
+            [docs[i] for i in last],
+            [metas[i] for i in last],
+            [],
+        )
+
+    def delete(self, ids: list[str]) -> None:
+        self._refresh()
+        drop = [cid for cid in dict.fromkeys(ids) if cid in self._snapshot.positions]
+        if drop:
+            self._append(None, [], [], [], drop)
+
+    def get(
+        self, ids: list[str] | None = None, where: dict[str, Any] | None = None, include: list[str] | None = None
+    ) -> dict[str, Any]:
+        self._refresh()
+        snap = self._snapshot
+        include = ["documents", "metadatas"] if include is None else include
+        if ids is not None:
+            flat_rows = [snap.positions[c] for c in ids if c in snap.positions]
+        else:
+            flat_rows = list(snap.positions.values())
+        rows = [snap.row(f) for f in flat_rows]
+        rows = [(seg, r) for seg, r in rows if _matches(seg.metadatas[r], where)]
+        out: dict[str, Any] = {"ids": [seg.ids[r] for seg, r in rows]}
+        if "documents" in include:
+            out["documents"] = [seg.documents[r] for seg, r in rows]
+        if "metadatas" in include:
+            out["metadatas"] = [seg.metadatas[r] for seg, r in rows]
+        if "embeddings" in include:
+            out["embeddings"] = [seg.matrix[r].tolist() for seg, r in rows]
+        return out
+
+    def query(
+        self, query_embeddings: list[list[float]], n_results: int = 10, include: list[str] | None = None
+    ) -> dict[str, Any]:
+        self._refresh()
+        snap = self._snapshot
+        include = ["documents", "metadatas", "distances"] if include is None else include
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        n = min(n_results, len(snap.positions))
+        if n == 0 or queries.size == 0:
+            rows_idx: list[list[int]] = [[] for _ in range(len(query_embeddings))]
+            rows_dist: list[list[float]] = [[] for _ in range(len(query_embeddings))]
+        else:
+            # Best live rows of each segment, then the best of those overall
+            q_norms = np.einsum("ij,ij->i", queries, queries)
+            cand_dist, cand_idx = [], []
+            for seg, offset in zip(snap.segments, snap.offsets, strict=True):
+                live = int(seg.live.sum())
+                if not live:
+                    continue
+                m = min(n, live)
+                if seg.faiss_index is not None:
+                    # Ask for enough rows to get m live ones past the shadowed rows
+                    k = min(len(seg.ids), m + len(seg.ids) - live)
+                    dist, idx = seg.faiss_index.search(np.ascontiguousarray(queries), k)
+                    dist = np.where((idx >= 0) & seg.live[np.maximum(idx, 0)], dist, np.inf)
+                else:
+                    # Squared L2: |q|^2 + |x|^2 - 2 q.x, computed for all queries in one matmul
+                    dist = q_norms[:, None] + seg.sq_norms[None, :] - 2.0 * (queries @ seg.matrix.T)
+                    np.maximum(dist, 0.0, out=dist)
+                    dist[:, ~seg.live] = np.inf
+                    if m < dist.shape[1]:
+                        idx = np.argpartition(dist, m - 1, axis=1)[:, :m]
+                    else:
+                        idx = np.tile(np.arange(dist.shape[1]), (len(queries), 1))
+                    dist = np.take_along_axis(dist, idx, axis=1)
+                cand_dist.append(dist)
+                cand_idx.append(idx + offset)
+            dist, idx = np.concatenate(cand_dist, axis=1), np.concatenate(cand_idx, axis=1)
+            order = dist.argsort(axis=1, kind="stable")[:, :n]
+            rows_idx = np.take_along_axis(idx, order, axis=1).tolist()
+            rows_dist = np.take_along_axis(dist, order, axis=1).tolist()
+        rows = [[snap.row(i) for i in row] for row in rows_idx]
+        out: dict[str, Any] = {"ids": [[seg.ids[r] for seg, r in row] for row in rows]}
+        if "documents" in include:
+            out["documents"] = [[seg.documents[r] for seg, r in row] for row in rows]
+        if "metadatas" in include:
+            out["metadatas"] = [[seg.metadatas[r] for seg, r in row] for row in rows]
+        if "distances" in include:
+            out["distances"] = rows_dist
+        return out
@@ -1,6 +1,313 @@
-from functools import lru_cache
+from __future__ import annotations
 
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from pathlib import Path
+from typing import Any
 
-@lru_cache(maxsize=128)
-def cached_answer(question: str) -> str:
-    return f"Cached placeholder answer for: {question}"
+logger = logging.getLogger(__name__)
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_SQLITE_MAX_PARAMS = 500
+# Memory-map up to 256MB of the database file for reads
+_SQLITE_MMAP_BYTES = 256 * 1024 * 1024
+# Evict a little more than strictly needed so every insert doesn't trigger a delete
+_EVICTION_SLACK = 0.1
+
+
+class MemoryLRUCache:
+    """Thread-safe, size-bounded in-process LRU map with hit/miss counters.
+
+    A ``max_entries`` of 0 disables the cache: every lookup misses and writes
+    are dropped.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(0, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> None:
+        """Drop every entry whose value satisfies ``predicate``."""
+        with self._lock:
+            for key in [k for k, v in self._data.items() if predicate(v)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+        }
+
+
+class DiskLRUCache:
+    """SQLite-backed key/value cache with size-bounded LRU eviction.
+
+    The database runs in WAL mode with memory-mapped reads, so one file can be
+    shared by every uvicorn worker on the host. Values are raw bytes; callers
+    own serialization. All operations are best-effort: a storage error is
+    logged and treated as a miss so the cache can never break its caller.
+    Hit/miss counters are tracked per process. ``clear`` bumps a generation
+    number stored in the same file, so other processes can tell that copies
+    they hold in memory are stale.
+    """
+
+    def __init__(self, path: str, max_entries: int) -> None:
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+        self._local = threading.local()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, accessed REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed)")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread and per process (connections must not cross a fork)
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={_SQLITE_MMAP_BYTES}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, hits: int, misses: int) -> None:
+        with self._counter_lock:
+            self.hits += hits
+            self.misses += misses
+
+    def get(self, key: str) -> bytes | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        """Return the cached values for ``keys`` that are present, refreshing their recency."""
+        wanted = list(dict.fromkeys(keys))
+        if not wanted:
+            return {}
+        found: dict[str, bytes] = {}
+        try:
+            conn = self._connect()
+            now = time.time()
+            for start in range(0, len(wanted), _SQLITE_MAX_PARAMS):
+                part = wanted[start : start + _SQLITE_MAX_PARAMS]
+                marks = ",".join("?" * len(part))
+                rows = conn.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({marks})", part  # noqa: S608
+                ).fetchall()
+                found.update((k, bytes(v)) for k, v in rows)
+                if rows:
+                    hit_keys = [k for k, _ in rows]
+                    conn.execute(
+                        f"UPDATE entries SET accessed = ? WHERE key IN ({','.join('?' * len(hit_keys))})",  # noqa: S608
+                        [now, *hit_keys],
+                    )
+        except sqlite3.Error as e:
+            logger.warning("Cache read failed for %s: %s", self.path, e)
+        self._count(len(found), len(wanted) - len(found))
+        return found
+
+    def set(self, key: str, value: bytes) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        if not items:
+            return
+        try:
+            conn = self._connect()
+            now = time.time()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, value, accessed) VALUES (?, ?, ?)",
+                    [(k, sqlite3.Binary(v), now) for k, v in items.items()],
+                )
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.warning("Cache write failed for %s: %s", self.path, e)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        wanted = list(dict.fromkeys(keys))
+        try:
+            conn = self._connect()
+            for start in range(0, len(wanted), _SQLITE_MAX_PARAMS):
+                part = wanted[start : start + _SQLITE_MAX_PARAMS]
+                conn.execute(
+                    f"DELETE FROM entries WHERE key IN ({','.join('?' * len(part))})",  # noqa: S608
+                    part,
+                )
+        except sqlite3.Error as e:
+            logger.warning("Cache delete failed for %s: %s", self.path, e)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        if count <= self.max_entries:
+            return
+        excess = count - self.max_entries + int(self.max_entries * _EVICTION_SLACK)
+        conn.execute(
+            "DELETE FROM entries WHERE key IN "
+            "(SELECT key FROM entries ORDER BY accessed ASC LIMIT ?)",
+            (excess,),
+        )
+
+    def generation(self) -> int | None:
+        """Return the number of times the cache was cleared, or None when the file can't be read."""
+        try:
+            row = self._connect().execute("SELECT value FROM meta WHERE name = 'generation'").fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Cache read failed for %s: %s", self.path, e)
+            return None
+        return row[0] if row else 0
+
+    def clear(self) -> None:
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM entries")
+                conn.execute(
+                    "INSERT INTO meta (name, value) VALUES ('generation', 1) "
+                    "ON CONFLICT(name) DO UPDATE SET value = value + 1"
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.warning("Cache clear failed for %s: %s", self.path, e)
+
+    def stats(self) -> dict[str, Any]:
+        try:
+            (entries,) = self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()
+        except sqlite3.Error:
+            entries = None
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+        }
+
+
+class TTLCache:
+    """JSON-value cache with a TTL, backed by memory and optionally by a shared SQLite file.
+
+    The in-process LRU is consulted first; with ``disk_path`` set, misses fall
+    through to a ``DiskLRUCache`` shared by every worker on the host and hits
+    are promoted to memory. Memory entries are tagged with the disk tier's
+    generation and dropped once any worker clears the cache; expired entries
+    are dropped when looked up and swept on every insert. Entries remember
+    when they were stored so callers can report their age.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, disk_path: str | None = None) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._memory = MemoryLRUCache(max_entries)
+        self._disk: DiskLRUCache | None = None
+        if disk_path:
+            try:
+                self._disk = DiskLRUCache(disk_path, max_entries)
+            except Exception as e:
+                logger.warning("Shared cache unavailable at %s: %s", disk_path, e)
+
+    def _fresh(self, entry: dict[str, Any] | None) -> bool:
+        return entry is not None and time.time() - entry["stored"] < self.ttl_seconds
+
+    def _generation(self) -> int | None:
+        return self._disk.generation() if self._disk is not None else None
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        """Return ``(value, age_seconds)`` for a live entry, else None."""
+        generation = self._generation()
+        entry = self._memory.get(key)
+        if entry is not None and not (self._fresh(entry) and entry.get("generation") == generation):
+            self._memory.discard(key)
+            entry = None
+        if entry is None and self._disk is not None:
+            raw = self._disk.get(key)
+            if raw is not None:
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    entry = None
+                if self._fresh(entry):
+                    self._memory.set(key, {**entry, "generation": generation})  # type: ignore[dict-item]
+                else:
+                    self._disk.delete_many([key])
+        if not self._fresh(entry):
+            return None
+        return entry["value"], time.time() - entry["stored"]  # type: ignore[index]
+
+    def set(self, key: str, value: Any) -> None:
+        entry = {"stored": time.time(), "value": value}
+        self._memory.discard_where(lambda e: not self._fresh(e))
+        self._memory.set(key, {**entry, "generation": self._generation()})
+        if self._disk is not None:
+            try:
+                self._disk.set(key, json.dumps(entry).encode("utf-8"))
+            except (TypeError, ValueError) as e:
+                logger.warning("Value for %s is not JSON-serializable; kept in memory only: %s", key, e)
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def stats(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"ttl_seconds": self.ttl_seconds, "memory": self._memory.stats()}
+        if self._disk is not None:
+            out["disk"] = self._disk.stats()
+        return out
@@ -0,0 +1,129 @@
+"""In-process job queue for multi-document work (e.g. batch verification).
+
+A job is a list of named items processed by a shared thread pool, one task
+per item. Progress and per-item results are kept in memory for polling; the
+most recent ``max_jobs`` jobs are retained.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+@dataclass
+class JobItem:
+    index: int
+    name: str
+    status: str = QUEUED
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+
+
+@dataclass
+class Job:
+    id: str
+    owner: str | None
+    items: list[JobItem]
+    meta: dict[str, Any] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def done(self) -> int:
+        return sum(1 for it in self.items if it.status in (COMPLETED, FAILED))
+
+    @property
+    def status(self) -> str:
+        if self.done == len(self.items):
+            return COMPLETED
+        return RUNNING if any(it.status != QUEUED for it in self.items) else QUEUED
+
+    def snapshot(self, include_results: bool = True) -> dict[str, Any]:
+        total = len(self.items)
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "total": total,
+            "completed": sum(1 for it in self.items if it.status == COMPLETED),
+            "failed": sum(1 for it in self.items if it.status == FAILED),
+            "progress": round(100 * self.done / total) if total else 100,
+            **self.meta,
+            "documents": [
+                {
+                    "index": it.index,
+                    "name": it.name,
+                    "status": it.status,
+                    **({"result": it.result} if include_results and it.result is not None else {}),
+                    **({"error": it.error} if it.error else {}),
+                }
+                for it in self.items
+            ],
+        }
+
+
+class JobQueue:
+    """Runs job items on a bounded thread pool shared by all jobs."""
+
+    def __init__(self, max_workers: int, max_jobs: int = 100) -> None:
+        self.max_jobs = max(1, max_jobs)
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="poliverai-job")
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        names: list[str],
+        work: Callable[[int], dict[str, Any]],
+        owner: str | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> Job:
+        """Create a job and enqueue ``work(index)`` for each item; exceptions mark the item failed."""
+        job = Job(id=uuid.uuid4().hex, owner=owner, items=[JobItem(i, n) for i, n in enumerate(names)], meta=meta or {})
+        with self._lock:
+            self._jobs[job.id] = job
+            self._evict()
+        for item in job.items:
+            self._pool.submit(self._run, item, work)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, item: JobItem, work: Callable[[int], dict[str, Any]]) -> None:
+        item.status = RUNNING
+        item.started_at = time.time()
+        try:
+            item.result = work(item.index)
+            item.status = COMPLETED
+        except Exception as e:
+            logger.warning("Job item %s (%s) failed: %s", item.index, item.name, e)
+            item.error = str(getattr(e, "detail", None) or e)
+            item.status = FAILED
+        finally:
+            item.finished_at = time.time()
+
+    def _evict(self) -> None:
+        # Drop the oldest finished jobs first; running jobs are only dropped as a last resort
+        while len(self._jobs) > self.max_jobs:
+            victim = next((jid for jid, j in self._jobs.items() if j.status == COMPLETED), None)
+            self._jobs.pop(victim if victim is not None else next(iter(self._jobs)))
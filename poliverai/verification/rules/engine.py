@@ -0,0 +1,140 @@
+"""Single-pass keyword rule engine.
+
+Rules are plain data (``Rule``). ``RuleEngine`` collects every term used by
+its rules and compiles them into one trie-shaped regular expression, so a
+document is scanned once no matter how many rules or terms there are; each
+rule is then decided from the set of terms found. Matching is case-insensitive
+substring matching, the same as ``term in text.lower()``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A document-level check.
+
+    A rule applies when ``trigger_any`` is empty or one of its terms occurs.
+    An applicable rule fires when it has no requirements, when none of
+    ``require_any`` occurs, or when some ``require_all`` term is missing.
+    ``reason`` may contain ``{missing}`` (the comma-separated missing terms).
+    """
+
+    id: str
+    article: str
+    kind: str  # "violation" or "fulfill"
+    reason: str
+    severity: str = "medium"
+    trigger_any: tuple[str, ...] = ()
+    require_any: tuple[str, ...] = ()
+    require_all: tuple[str, ...] = ()
+
+    def terms(self) -> set[str]:
+        return {*self.trigger_any, *self.require_any, *self.require_all}
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """Regex for the union of ``terms`` with shared prefixes factored out.
+
+    Optional tails are greedy, so at any position the longest term starting
+    there is the one reported.
+    """
+    trie: dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class TermMatcher:
+    """Find every occurrence of a fixed set of terms in one pass over the text."""
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms = sorted({t.lower() for t in terms if t})
+        self._pattern = re.compile(_trie_pattern(self.terms)) if self.terms else None
+        # The longest match at a position hides shorter terms inside it; expand those here
+        self._contained = {
+            t: [(s, i) for s in self.terms if s != t for i in _find_all(t, s)] for t in self.terms
+        }
+
+    def find(self, text: str) -> dict[str, list[int]]:
+        """Offsets of each term found in ``text`` (case-insensitive)."""
+        hits: dict[str, list[int]] = {}
+        if self._pattern is None:
+            return hits
+        lowered = text.lower()
+        search = self._pattern.search
+        m = search(lowered)
+        while m is not None:
+            term, start = m.group(), m.start()
+            hits.setdefault(term, []).append(start)
+            for inner, offset in self._contained[term]:
+                hits.setdefault(inner, []).append(start + offset)
+            # Resume one character later (not at the match end) so overlapping terms are found
+            m = search(lowered, start + 1)
+        # Inner terms can be reported twice (directly and via an enclosing match)
+        return {t: sorted(set(o)) for t, o in hits.items()}
+
+
+def _find_all(haystack: str, needle: str) -> list[int]:
+    out, i = [], haystack.find(needle)
+    while i != -1:
+        out.append(i)
+        i = haystack.find(needle, i + 1)
+    return out
+
+
+class RuleEngine:
+    """Evaluate a rule catalogue against a document with a single text scan."""
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.rules = tuple(rules)
+        self.matcher = TermMatcher(t for rule in self.rules for t in rule.terms())
+        payload = json.dumps([asdict(r) for r in self.rules], sort_keys=True)
+        self.fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def evaluate(self, text: str) -> dict[str, list[dict[str, Any]]]:
+        """Fired rules as ``{"violations": [...], "fulfills": [...]}`` in catalogue order.
+
+        Each entry carries the rule's article, reason and severity (violations
+        only), its id, and the sorted offsets of the matched terms it used.
+        """
+        return self.decide(self.matcher.find(text))
+
+    def decide(self, hits: dict[str, list[int]]) -> dict[str, list[dict[str, Any]]]:
+        """``evaluate`` from term hits gathered separately (e.g. merged from parts of a document)."""
+        out: dict[str, list[dict[str, Any]]] = {"violations": [], "fulfills": []}
+        for rule in self.rules:
+            if rule.trigger_any and not any(t.lower() in hits for t in rule.trigger_any):
+                continue
+            missing = [t for t in rule.require_all if t.lower() not in hits]
+            if rule.require_any or rule.require_all:
+                require_any_met = not rule.require_any or any(t.lower() in hits for t in rule.require_any)
+                if require_any_met and not missing:
+                    continue
+            entry: dict[str, Any] = {"article": rule.article, "reason": rule.reason.format(missing=", ".join(missing))}
+            if rule.kind == "violation":
+                entry["severity"] = rule.severity
+            entry["rule"] = rule.id
+            entry["offsets"] = sorted({o for t in rule.terms() for o in hits.get(t.lower(), ())})
+            out["violations" if rule.kind == "violation" else "fulfills"].append(entry)
+        return out
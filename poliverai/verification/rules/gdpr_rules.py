@@ -1,4 +1,5 @@
 from ...domain.models import Clause, Finding
+from .engine import Rule
 
 
 def check_retention_limits(clause: Clause) -> list[Finding]:
@@ -21,3 +22,110 @@ def run_all_rules(clauses: list[Clause]) -> list[Finding]:
     for c in clauses:
         out.extend(check_retention_limits(c))
     return out
+
+
+# Document-level checks used by the RAG verifier's rule-based baseline.
+# Evaluated in order by ``RuleEngine``; see ``engine.Rule`` for the semantics.
+GDPR_DOCUMENT_RULES: tuple[Rule, ...] = (
+    Rule(
+        id="lawful-basis-missing",
+        article="Article 6(1)",
+        kind="violation",
+        reason="No clear lawful basis for processing stated",
+        severity="high",
+        require_any=("lawful basis", "consent", "contract", "legal obligation"),
+    ),
+    Rule(
+        id="information-missing",
+        article="Article 13",
+        kind="violation",
+        reason="Missing required information: {missing}",
+        require_all=("purpose", "data controller", "contact"),
+    ),
+    Rule(
+        id="erasure-missing",
+        article="Article 17",
+        kind="violation",
+        reason="No mention of data deletion or right to erasure",
+        require_any=("delete", "erasure", "remove data", "right to be forgotten"),
+    ),
+    Rule(
+        id="retention-missing",
+        article="Article 5(1)(e)",
+        kind="violation",
+        reason="No data retention period specified",
+        require_any=("retention", "how long", "storage period", "delete after"),
+    ),
+    Rule(
+        id="automatic-collection-undisclosed",
+        article="Article 13(1)(c)",
+        kind="violation",
+        reason="Automatic data collection mentioned but insufficient disclosure of what data is collected",
+        severity="high",
+        trigger_any=(
+            "automatically collect",
+            "automatic collection",
+            "may collect automatically",
+            "collect automatically",
+            "automatically obtained",
+            "automatic information",
+        ),
+        require_any=(
+            "automatically collected information includes",
+            "types of information automatically collected",
+            "automatically collect the following",
+            "information collected automatically",
+        ),
+    ),
+    Rule(
+        id="sharing-without-basis",
+        article="Article 6(1)",
+        kind="violation",
+        reason="Data sharing mentioned without clear lawful basis",
+        severity="high",
+        trigger_any=("share", "sharing", "disclose", "third party", "third-party"),
+        require_any=("lawful basis", "consent", "legitimate interest", "legal obligation"),
+    ),
+    Rule(
+        id="gdpr-acknowledged",
+        article="General Compliance",
+        kind="fulfill",
+        reason="Acknowledges GDPR compliance",
+        trigger_any=("gdpr", "data protection regulation"),
+    ),
+    Rule(
+        id="lawful-basis-stated",
+        article="Article 6(1)",
+        kind="fulfill",
+        reason="Mentions lawful basis or consent",
+        trigger_any=("consent", "lawful basis", "article 6"),
+    ),
+    Rule(
+        id="controller-identified",
+        article="Article 13",
+        kind="fulfill",
+        reason="Identifies data controller",
+        trigger_any=("data controller", "controller"),
+    ),
+    Rule(
+        id="contact-provided",
+        article="Article 13",
+        kind="fulfill",
+        reason="Provides contact information",
+        trigger_any=("contact", "email", "phone"),
+    ),
+    Rule(
+        id="retention-addressed",
+        article="Article 5(1)(e)",
+        kind="fulfill",
+        reason="Addresses data retention/deletion",
+        trigger_any=("retention", "delete", "deletion", "remove"),
+    ),
+    Rule(
+        id="erasure-right-stated",
+        article="Article 17",
+        kind="fulfill",
+        reason="Mentions right to erasure",
+        trigger_any=("erasure", "right to be forgotten"),
+    ),
+)
@@ -4,6 +4,17 @@ from fastapi.testclient import TestClient
 from poliverai.app.main import create_app
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _cache_dir(tmp_path_factory):
+    # Keep the on-disk caches out of the working tree
+    cache_dir = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ("judgment_cache", "verification_cache", "embedding_cache"):
+            mp.setenv(f"POLIVERAI_{name.upper()}_PATH", str(cache_dir / f"{name}.sqlite3"))
+        mp.setenv("POLIVERAI_ANALYSIS_RECORDS_PATH", str(cache_dir / "analyses.sqlite3"))
+        yield cache_dir
+
+
 @pytest.fixture(scope="session")
 def client() -> TestClient:
     app = create_app()
@@ -0,0 +1,62 @@
+import time
+
+from poliverai.services.cache import DiskLRUCache, MemoryLRUCache, TTLCache
+
+
+def test_disk_lru_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = DiskLRUCache(str(tmp_path / "c.sqlite3"), max_entries=2)
+    cache.set_many({"a": b"1", "b": b"2"})
+    assert cache.get("a") == b"1"  # refreshes "a"
+    cache.set("c", b"3")
+    assert cache.get("b") is None
+    assert cache.get_many(["a", "c"]) == {"a": b"1", "c": b"3"}
+    stats = cache.stats()
+    assert stats["hits"] == 3 and stats["misses"] == 1 and stats["entries"] == 2
+
+
+def test_memory_lru_cache_bounds_size() -> None:
+    cache = MemoryLRUCache(max_entries=2)
+    cache.set(("q", 5), [1])
+    cache.set(("r", 5), [2])
+    assert cache.get(("q", 5)) == [1]
+    cache.set(("s", 5), [3])
+    assert cache.get(("r", 5)) is None
+    assert cache.stats()["entries"] == 2
+    disabled = MemoryLRUCache(max_entries=0)
+    disabled.set("k", 1)
+    assert disabled.get("k") is None
+
+
+def test_ttl_cache_shares_entries_through_disk_and_expires(tmp_path) -> None:
+    path = str(tmp_path / "answers.sqlite3")
+    writer = TTLCache(max_entries=8, ttl_seconds=60, disk_path=path)
+    writer.set("q", {"answer": "a"})
+    reader = TTLCache(max_entries=8, ttl_seconds=60, disk_path=path)
+    value, age = reader.get("q")
+    assert value == {"answer": "a"} and age >= 0
+    expired = TTLCache(max_entries=8, ttl_seconds=0, disk_path=path)
+    assert expired.get("q") is None
+
+
+def test_ttl_cache_clear_reaches_other_workers_memory_and_expired_entries_are_evicted(tmp_path) -> None:
+    path = str(tmp_path / "results.sqlite3")
+    worker_a = TTLCache(max_entries=8, ttl_seconds=60, disk_path=path)
+    worker_b = TTLCache(max_entries=8, ttl_seconds=60, disk_path=path)
+    worker_a.set("k", 1)
+    assert worker_b.get("k")[0] == 1  # promoted to worker b's memory
+    worker_a.clear()
+    assert worker_b.get("k") is None
+
+    worker_b.ttl_seconds = 0.05
+    worker_b.set("stale", 2)
+    time.sleep(0.1)
+    worker_b.set("fresh", 3)  # sweeps "stale" out of memory
+    assert worker_b.stats()["memory"]["entries"] == 1
+    time.sleep(0.1)
+    assert worker_b.get("fresh") is None
+    assert worker_b.stats()["memory"]["entries"] == 0
+
+
+def test_clearing_the_verification_cache_requires_auth(client) -> None:
+    r = client.delete("/api/v1/stats/cache/verification")
+    assert r.status_code in (401, 403)
@@ -1,3 +1,117 @@
 def test_comparison_imports() -> None:
     import poliverai.comparison.diff  # noqa: F401
     import poliverai.comparison.scoring  # noqa: F401
+
+
+def test_align_clauses_pairs_exact_and_near_duplicate_clauses() -> None:
+    from poliverai.comparison.diff import align_clauses
+
+    draft = [
+        "We collect your name and email address when you register for an account.",
+        "We keep personal data for as long as your account remains active and then for two more years.",
+        "We may share data with advertising partners.",
+    ]
+    final = [
+        "We keep personal data for as long as your account remains active and then for one more year.",
+        "We collect your name and email address  when you register for an account.",
+        "You may ask us to delete your data at any time.",
+    ]
+    alignment = align_clauses(draft, final)
+    assert alignment.unchanged == [(0, 1)]
+    assert [(i, j) for i, j, _ in alignment.modified] == [(1, 0)]
+    assert alignment.removed == [2] and alignment.added == [2]
+
+
+def test_compare_endpoint_reports_score_and_article_deltas(client) -> None:
+    draft = b"We collect your email address to send newsletters to you every week."
+    final = (
+        b"We collect your email address to send newsletters to you every week.\n\n"
+        b"You can ask us to delete your data at any time, and we keep it for 12 months. "
+        b"We rely on your consent as our lawful basis."
+    )
+    r = client.post("/api/v1/compare", files={"draft": ("draft.txt", draft), "final": ("final.txt", final)})
+    assert r.status_code == 200
+    data = r.json()
+    assert data["more_compliant"] == "final" and data["score_delta"] > 0
+    assert data["alignment"] == {"unchanged": 1, "modified": 0, "added": 1, "removed": 0}
+    assert any(d["article"] == "Article 17" and d["delta"] > 0 for d in data["article_deltas"])
+
+
+def test_compare_policies_keeps_verify_budget_and_judges_shared_clauses_once(monkeypatch) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_BATCH_JUDGING", "false")
+    calls = []
+
+    def fake_judge(clause: str, k: int, counter=None, deadline=None):
+        calls.append(clause)
+        return [{"article": "Article 5(1)(e)", "verdict": "fulfills", "confidence": 0.8}]
+
+    monkeypatch.setattr(verification, "_retrieve_and_judge", fake_judge)
+    clauses = [
+        f"Clause {i}: we keep the account details you give us for {i + 1} years and then remove them from every system we run."
+        for i in range(12)
+    ]
+    draft = "\n\n".join(clauses)
+    final = "\n\n".join(clauses[:10] + ["Clause 99: " + clauses[11][9:] + " Backups are kept one more month."])
+
+    draft_result, final_result = verification.compare_policies(draft, final, "detailed")
+    # Each document gets at most MAX_LLM_CLAUSES judgments and shared clauses are judged once
+    assert len(calls) == len(set(calls)) <= 2 * verification.MAX_LLM_CLAUSES
+    calls.clear()
+    for text, result in ((draft, draft_result), (final, final_result)):
+        assert result["score"] == verification.analyze_policy(text, "detailed")["score"]
+        assert result["evidence"] == verification.analyze_policy(text, "detailed")["evidence"]
+
+
+def test_compare_policies_judges_both_documents_concurrently(monkeypatch) -> None:
+    import threading
+
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_BATCH_JUDGING", "false")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_LLM_CONCURRENCY", "1")
+    final_started = threading.Event()
+    overlapped = []
+
+    def fake_judge(clause: str, k: int, counter=None, deadline=None):
+        if clause.startswith("Final"):
+            final_started.set()
+        else:
+            # The draft's walk only sees the final's call if both run at once
+            overlapped.append(final_started.wait(timeout=2))
+        return [{"article": "Article 17", "verdict": "fulfills", "confidence": 0.8}]
+
+    monkeypatch.setattr(verification, "_retrieve_and_judge", fake_judge)
+    body = "we keep the account details you give us for two years and then remove them from every system we run."
+    verification.compare_policies(f"Draft clause: {body}", f"Final clause: {body}", "detailed")
+    assert overlapped == [True]
+
+
+def test_compare_policies_batches_distinct_clauses_of_both_documents_once(monkeypatch) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_BATCH_JUDGING", "true")
+    batches = []
+
+    def fake_batched(entries, model, s, lookups, deadline=None):
+        batches.append([clause for _, clause, _ in entries])
+        return {i: [{"article": "Article 17", "verdict": "fulfills", "confidence": 0.8}] for i, _, _ in entries}
+
+    monkeypatch.setattr(verification, "retrieve", lambda clause, k=None: [{"id": "gdpr", "doc": "x", "meta": {}}])
+    monkeypatch.setattr(verification, "_judge_entries_batched", fake_batched)
+    clauses = [
+        f"Clause {i}: we keep the account details you give us for {i + 1} years and then remove them from every system we run."
+        for i in range(4)
+    ]
+    draft_result, final_result = verification.compare_policies(
+        "\n\n".join(clauses[:3]), "\n\n".join(clauses[1:]), "detailed"
+    )
+    assert len(batches) == 1 and sorted(batches[0]) == sorted(clauses)
+    assert final_result["evidence"] == verification.analyze_policy("\n\n".join(clauses[1:]), "detailed")["evidence"]
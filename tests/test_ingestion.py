@@ -2,3 +2,42 @@ def test_placeholder_ingestion_imports() -> None:
     import poliverai.ingestion.readers.docx_reader  # noqa: F401
     import poliverai.ingestion.readers.html_reader  # noqa: F401
     import poliverai.ingestion.readers.pdf_reader  # noqa: F401
+
+
+def test_extract_text_task_reports_errors(tmp_path) -> None:
+    from poliverai.ingestion.extract import extract_text_task
+
+    p = tmp_path / "policy.txt"
+    p.write_text("We retain data for 12 months.")
+    path, text, error, _ = extract_text_task(str(p))
+    assert path == str(p) and text == "We retain data for 12 months." and error is None
+
+    _, text, error, _ = extract_text_task(str(tmp_path / "missing.txt"))
+    assert text is None and error and error.startswith("error:")
+
+
+def test_same_file_name_from_different_owners_keeps_both_sources(tmp_path, monkeypatch) -> None:
+    from poliverai.rag import service
+    from poliverai.retrieval.vector_store import NumpyVectorCollection
+
+    store = NumpyVectorCollection(tmp_path / "store.vectors")
+    monkeypatch.setenv("POLIVERAI_CHROMA_PERSIST_DIR", str(tmp_path))
+    monkeypatch.setenv("POLIVERAI_BM25_ENABLED", "false")
+    monkeypatch.setattr(service, "_rag_state", service.RAGInit(collection=store, client=None, enc_name=""))
+    monkeypatch.setattr(service, "chunk_tokens", lambda text, size, overlap: [(text, [])])
+    monkeypatch.setattr(service, "_embed_texts", lambda texts, tokens=None: [[1.0, 0.0] for _ in texts])
+
+    def ingest(owner: str, content: str) -> dict:
+        p = tmp_path / owner / "policy.txt"
+        p.parent.mkdir(exist_ok=True)
+        p.write_text(content)
+        source = service.upload_source_id(owner, p.name, content.encode())
+        return service.ingest_paths([str(p)], sources={str(p): source})
+
+    ingest("alice", "Alice retains data for 12 months.")
+    ingest("bob", "Bob retains data for 6 months.")
+    stats = ingest("alice", "Alice retains data for 24 months.")
+    assert stats["chunks_deleted"] == 1
+
+    docs = store.get(where={"source": "policy.txt"})["documents"]
+    assert sorted(docs) == ["Alice retains data for 24 months.", "Bob retains data for 6 months."]
@@ -1,2 +1,31 @@
 def test_query_imports() -> None:
     import poliverai.query.ask as _  # noqa: F401
+
+
+def test_saturated_llm_route_does_not_block_other_routes(monkeypatch) -> None:
+    import asyncio
+
+    from poliverai.rag import llm
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_LLM_MAX_CONCURRENCY", "2")
+    monkeypatch.setenv("POLIVERAI_LLM_ROUTE_CONCURRENCY", '{"reports": 1, "query": 1}')
+
+    async def main() -> None:
+        release = asyncio.Event()
+
+        async def report_call() -> None:
+            async with llm.llm_slot("reports"):
+                await release.wait()
+
+        reports = [asyncio.create_task(report_call()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        # Four report calls queue on their route; the query still gets a global slot
+        async with asyncio.timeout(1):
+            async with llm.llm_slot("query"):
+                pass
+        release.set()
+        await asyncio.gather(*reports)
+        await llm.aclose()
+
+    asyncio.run(main())
@@ -1,3 +1,5 @@
+import pytest
+
 from poliverai.retrieval.search import build_and_search
 
 
@@ -6,3 +8,155 @@ def test_build_and_search() -> None:
     results = build_and_search(corpus, query="retention")
     assert isinstance(results, list)
     assert results
+
+
+def test_numpy_vector_collection_roundtrip(tmp_path) -> None:
+    pytest.importorskip("numpy")
+    from poliverai.retrieval.vector_store import NumpyVectorCollection
+
+    coll = NumpyVectorCollection(tmp_path / "idx")
+    coll.upsert(
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]],
+        documents=["retention", "erasure", "cookies"],
+        metadatas=[{"source": "x.txt"}, {"source": "x.txt"}, {"source": "y.txt"}],
+    )
+    res = coll.query(query_embeddings=[[0.9, 0.1], [0.0, 2.0]], n_results=2)
+    assert [row[0] for row in res["ids"]] == ["a", "b"]
+    assert res["distances"][0][0] <= res["distances"][0][1]
+
+    coll.delete(ids=["a"])
+    reopened = NumpyVectorCollection(tmp_path / "idx")
+    assert reopened.count() == 2
+    assert reopened.get(where={"source": "x.txt"}, include=[])["ids"] == ["b"]
+
+
+def _write_rows(path, prefix: str) -> None:
+    from poliverai.retrieval.vector_store import NumpyVectorCollection
+
+    coll = NumpyVectorCollection(path)
+    for i in range(20):
+        coll.upsert(ids=[f"{prefix}{i}"], embeddings=[[float(i), 1.0]], documents=[prefix])
+
+
+def test_numpy_vector_collection_concurrent_writers_append_segments(tmp_path) -> None:
+    pytest.importorskip("numpy")
+    import json
+    import multiprocessing
+
+    from poliverai.retrieval.vector_store import NumpyVectorCollection
+
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_write_rows, args=(tmp_path / "idx", p)) for p in ("a", "b")]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+    coll = NumpyVectorCollection(tmp_path / "idx")
+    # Neither process lost the other's rows, and single-row upserts merged into few segments
+    assert coll.count() == 40
+    assert len(coll.get(where={})["ids"]) == 40
+    segments = json.loads((tmp_path / "idx" / "index.json").read_text())["segments"]
+    assert len(segments) <= 6
+    coll.upsert(ids=["a3"], embeddings=[[100.0, 100.0]])
+    assert coll.query(query_embeddings=[[100.0, 100.0]], n_results=1)["ids"] == [["a3"]]
+    assert coll.count() == 40
+
+
+def test_bm25_index_ranks_and_persists(tmp_path) -> None:
+    from poliverai.retrieval.bm25 import BM25Index
+
+    idx = BM25Index()
+    idx.add("a", ["data", "retention", "period"])
+    idx.add("b", ["cookies", "consent"])
+    idx.add("c", ["retention", "cookies"])
+    assert [cid for cid, _ in idx.search(["retention", "period"], k=2)] == ["a", "c"]
+
+    idx.remove(["a"])
+    idx.save(tmp_path / "bm25.json")
+    loaded = BM25Index.load(tmp_path / "bm25.json")
+    assert len(loaded) == 2
+    scores = loaded.score(["retention"], ["b", "c", "missing"])
+    assert scores["c"] > 0 and scores["b"] == 0 and scores["missing"] == 0
+
+
+def test_bm25_index_saves_merge_concurrent_writers(tmp_path) -> None:
+    from poliverai.retrieval.bm25 import BM25Index
+
+    path = tmp_path / "bm25.json"
+    base = BM25Index()
+    base.add("shared", ["data"])
+    base.add("old", ["cookies"])
+    base.save(path)
+    worker_a, worker_b = BM25Index.load(path), BM25Index.load(path)
+    worker_a.add("a1", ["retention"])
+    worker_b.add("b1", ["consent"])
+    worker_b.remove(["old"])
+    worker_a.save(path)
+    worker_b.save(path)
+
+    merged = BM25Index.load(path)
+    assert sorted(merged._docs) == ["a1", "b1", "shared"]
+    assert sorted(worker_b._docs) == ["a1", "b1", "shared"]
+
+
+def test_bm25_index_for_empty_collection_is_built_once(tmp_path, monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from poliverai.rag import service
+
+    calls = []
+
+    class EmptyCollection:
+        def get(self, **kwargs):
+            calls.append(kwargs)
+            return {"ids": [], "documents": []}
+
+    monkeypatch.setenv("POLIVERAI_CHROMA_PERSIST_DIR", str(tmp_path))
+    monkeypatch.setattr(service, "_init", lambda: SimpleNamespace(collection=EmptyCollection()))
+    monkeypatch.setattr(service, "_bm25_state", None)
+    monkeypatch.setattr(service, "_bm25_stamp", None)
+
+    assert len(service._bm25_index()) == 0
+    assert len(service._bm25_index()) == 0
+    assert len(calls) == 1
+    assert (tmp_path / "poliverai.bm25.json").exists()
+
+
+def test_min_squared_l2_matches_pairwise_distances() -> None:
+    from poliverai.rag.service import _min_squared_l2
+
+    queries = [[0.0, 0.0, 1.0], [2.0, 1.0, 0.0]]
+    embeddings = [[0.0, 0.0, 1.0], [1.0, 1.0, 1.0], [3.0, 0.0, -1.0]]
+    expected = [min(sum((a - b) ** 2 for a, b in zip(q, e)) for q in queries) for e in embeddings]
+    assert _min_squared_l2(queries, embeddings) == pytest.approx(expected, abs=1e-5)
+    assert _min_squared_l2([], embeddings) == [1e9] * 3
+
+
+def test_retrieve_async_serves_cache_hits_without_embedding(tmp_path, monkeypatch) -> None:
+    import asyncio
+
+    from poliverai.rag import service
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_CHROMA_PERSIST_DIR", str(tmp_path))
+    monkeypatch.setenv("POLIVERAI_BM25_ENABLED", "false")
+    monkeypatch.setattr(service, "_retrieval_cache_state", None)
+    embedded = []
+
+    async def fake_embed(queries):
+        embedded.append(queries)
+        return [[0.0, 1.0] for _ in queries]
+
+    def fake_query(queries, n_results, query_vectors):
+        return {"ids": [["c1"]] * len(queries), "documents": [["data retention"]] * len(queries),
+                "metadatas": [[{}]] * len(queries), "distances": [[0.1]] * len(queries)}
+
+    monkeypatch.setattr(service, "_embed_queries_async", fake_embed)
+    monkeypatch.setattr(service, "_query_collection_many", fake_query)
+    first = asyncio.run(service.retrieve_async("how long is data kept", 1))
+    second = asyncio.run(service.retrieve_async("how long is data kept", 1))
+    assert first == second and [r["id"] for r in first] == ["c1"]
+    assert len(embedded) == 1
+    monkeypatch.setattr(service, "_retrieval_cache_state", None)
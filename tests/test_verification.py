@@ -1,3 +1,5 @@
+import pytest
+
 from httpx import Response
 
 # Constants
@@ -11,3 +13,587 @@ def test_verify_endpoint_smoke(client) -> None:
     assert r.status_code == HTTP_OK
     data = r.json()
     assert "score" in data and "verdict" in data
+
+
+def test_clause_judging_runs_concurrently_and_keeps_serial_selection(monkeypatch) -> None:
+    import threading
+    import time
+
+    from poliverai.core.config import Settings
+    from poliverai.rag import verification
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_judge(clause: str, k: int, counter=None, deadline=None):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        if clause == "no context":
+            return None
+        return [{"article": clause, "verdict": "fulfills", "confidence": 0.9}]
+
+    monkeypatch.setattr(verification, "_retrieve_and_judge", fake_judge)
+    clauses = ["a", "no context", "b", "c", "d"]
+    s = Settings(verification_llm_concurrency=3)
+    results = verification._judge_clauses_concurrently(clauses, list(range(5)), 3, s)
+
+    # Same clauses a serial walk would pick: the one without context is replaced by the next
+    assert sorted(results) == [0, 2, 3]
+    assert active["peak"] > 1
+
+
+def test_batched_judging_packs_clauses_and_shares_context(monkeypatch) -> None:
+    from poliverai.core.config import Settings
+    from poliverai.rag import verification
+
+    monkeypatch.setattr(verification, "_encode", lambda text: text.split())
+    shared = {"id": "gdpr-5", "doc": "storage limitation " * 50, "meta": {"article": "Article 5(1)(e)"}}
+    entries = [(i, f"clause {i} " + "we retain data " * 10, [shared]) for i in range(6)]
+    s = Settings(verification_batch_max_clauses=4, verification_batch_token_budget=10_000)
+
+    batches = verification._pack_judge_batches(entries, s)
+    assert [len(b) for b in batches] == [4, 2]
+    user_prompt = verification._batch_judge_messages(batches[0], s.top_k)[1]["content"]
+    assert user_prompt.count("[E1 |") == 1 and 'excerpts="E1"' in user_prompt
+
+
+def test_judgment_cache_reuses_llm_result_for_same_clause_and_context(monkeypatch, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_JUDGMENT_CACHE_PATH", str(tmp_path / "judgments.sqlite3"))
+    monkeypatch.setattr(verification, "_judgment_cache_state", None)
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        content = '{"judgments": [{"article": "Article 17", "verdict": "fulfills", "confidence": 0.9}]}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(verification, "_init", lambda: SimpleNamespace(client=client))
+    ctx = [{"id": "gdpr-17", "doc": "Right to erasure", "meta": {"article": "Article 17"}}]
+    counter = verification.JudgmentCacheCounter()
+
+    first = verification._llm_judge_clause("We delete data on request.", ctx, counter)
+    second = verification._llm_judge_clause("  we DELETE data on request. ", ctx, counter)
+    other_ctx = [{"id": "gdpr-5", "doc": "Storage limitation", "meta": {"article": "Article 5"}}]
+    verification._llm_judge_clause("We delete data on request.", other_ctx, counter)
+
+    assert first == second and len(calls) == 2
+    assert counter.as_metrics() == {
+        "judgment_cache_hits": 1,
+        "judgment_cache_misses": 2,
+        "judgment_cache_hit_ratio": 0.3333,
+    }
+    monkeypatch.setattr(verification, "_judgment_cache_state", None)
+
+
+def test_verification_result_cache_hits_on_same_text_and_invalidates_on_rules_version(monkeypatch, tmp_path) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_PATH", str(tmp_path / "verification.sqlite3"))
+    monkeypatch.setattr(verification, "_result_cache_state", None)
+    text = "We collect your email address to send newsletters. You can ask us to delete your data at any time."
+
+    first = verification.analyze_policy(text, analysis_mode="fast")
+    second = verification.analyze_policy(text, analysis_mode="fast")
+    assert (first["cache"], second["cache"]) == ("miss", "hit")
+    assert second["score"] == first["score"] and second["findings"] == first["findings"]
+
+    monkeypatch.setattr(verification, "VERIFICATION_RULES_VERSION", "rules-test")
+    assert verification.analyze_policy(text, analysis_mode="fast")["cache"] == "miss"
+    monkeypatch.setattr(verification, "_result_cache_state", None)
+
+
+def test_rule_engine_finds_overlapping_terms_in_one_pass() -> None:
+    from poliverai.verification.rules.engine import Rule, RuleEngine, TermMatcher
+
+    hits = TermMatcher(["delete", "delete after", "after", "data controller", "controller"]).find(
+        "Delete after use. The Data Controller is us."
+    )
+    assert hits == {"delete": [0], "delete after": [0], "after": [7], "data controller": [22], "controller": [27]}
+
+    engine = RuleEngine(
+        [
+            Rule(id="info", article="Article 13", kind="violation", reason="Missing: {missing}",
+                 require_all=("purpose", "contact")),
+            Rule(id="share", article="Article 6(1)", kind="violation", reason="Sharing without basis",
+                 severity="high", trigger_any=("share",), require_any=("consent",)),
+            Rule(id="ctrl", article="Article 13", kind="fulfill", reason="Controller", trigger_any=("controller",)),
+        ]
+    )
+    out = engine.evaluate("We share data. Contact the controller.")
+    assert [(v["rule"], v["reason"]) for v in out["violations"]] == [("info", "Missing: purpose"), ("share", "Sharing without basis")]
+    assert out["violations"][1]["offsets"] == [3] and out["fulfills"][0]["offsets"] == [27]
+
+
+def test_clause_features_match_keyword_mapping_and_hash() -> None:
+    from poliverai.knowledge.mappings import map_requirement_to_articles
+    from poliverai.preprocessing.features import clause_hash, extract_clause_features
+
+    texts = ["Too short.", "We keep your data under our Retention policy and ask for consent.", "Hello there our good friends."]
+    features = extract_clause_features(texts, min_words=5)
+    assert [f.text for f in features] == texts[1:]
+    first, second = features
+    assert first.word_count == 12 and first.lower == texts[1].lower()
+    assert first.sensitive_terms == ("retention", "consent") and not second.sensitive
+    assert list(first.articles) == list(map_requirement_to_articles(texts[1])) == ["Article 5(1)(e)"]
+    assert first.hash == clause_hash("we keep your  DATA under our retention policy and ask for consent.")
+
+
+def test_streaming_segmenter_matches_whole_text_and_reports_offsets() -> None:
+    from itertools import islice
+
+    from poliverai.preprocessing.segment import iter_clauses, split_into_paragraphs
+
+    pages = [
+        "PRIVACY NOTICE\nWe collect your name and email address\nwhen you register.",
+        "We keep personal data for twelve months after closure.\nContact us at privacy@example.com to ask anything.",
+    ]
+    text = "\n".join(pages)
+    clauses = list(iter_clauses(pages))
+    assert [c.text for c in clauses] == [c.text for c in split_into_paragraphs(text)]
+    # The short header is dropped; paragraphs are rebuilt across line breaks
+    assert clauses[0].text == "We collect your name and email address when you register."
+    assert text[clauses[1].start : clauses[1].end] == "We keep personal data for twelve months after closure."
+
+    # Blank-line layout: offsets are exact and the generator can be stopped early
+    blocks = "\n\n".join(f"Clause number {i} describes how we share data." for i in range(10_000))
+    first = list(islice(iter_clauses(blocks), 2))
+    assert [blocks[c.start : c.end] for c in first] == [c.text for c in first]
+    assert first[1].text.startswith("Clause number 1 ")
+
+
+def test_full_analysis_covers_every_clause_across_shards(monkeypatch) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setenv("POLIVERAI_FULL_ANALYSIS_SHARD_CLAUSES", "20")
+    monkeypatch.setenv("POLIVERAI_FULL_ANALYSIS_WORKERS", "1")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_BATCH_JUDGING", "false")
+
+    def fake_judge(clauses, candidates, max_judged, s, counter=None):
+        return {i: [{"article": "Article 44", "verdict": "violates", "confidence": 0.9}]
+                for i in candidates[:max_judged] if "overseas" in clauses[i]}
+
+    monkeypatch.setattr(verification, "_judge_clauses_concurrently", fake_judge)
+    filler = "This section explains how the account settings page of our service works for every registered user today."
+    late = (
+        "We transfer your personal data overseas to our processing partners and affiliates "
+        "without any additional safeguards or contractual clauses in place at all."
+    )
+    text = "\n\n".join([filler] * 55 + [late])
+
+    assert "Article 44" not in verification.analyze_policy(text, "detailed")["articles"]["violations"]
+    result = verification.analyze_policy_full(text, "detailed")
+    assert result["articles"]["violations"]["Article 44"] == 1
+    assert result["metrics"]["clauses_analyzed"] == 56 and result["metrics"]["shards"] == 3
+    # Document-level rules are decided as over the whole text
+    rules = verification._rule_based_compliance_check(text)
+    assert {v["article"] for v in rules["violations"]} <= set(result["articles"]["violations"])
+
+
+@pytest.mark.parametrize("batch_judging", ["false", "true"])
+def test_full_analysis_keeps_the_document_llm_budget_across_shards(monkeypatch, batch_judging) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setenv("POLIVERAI_FULL_ANALYSIS_SHARD_CLAUSES", "4")
+    monkeypatch.setenv("POLIVERAI_FULL_ANALYSIS_WORKERS", "1")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_BATCH_JUDGING", batch_judging)
+    judged = []
+
+    def fake_concurrent(clauses, candidates, max_judged, s, counter=None):
+        judged.extend(candidates[:max_judged])
+        return {}
+
+    def fake_batched(clauses, candidates, s, counter=None):
+        judged.extend(candidates)
+        return {}
+
+    monkeypatch.setattr(verification, "_judge_clauses_concurrently", fake_concurrent)
+    monkeypatch.setattr(verification, "_judge_clauses_batched", fake_batched)
+    clause = (
+        "We share your personal data with advertising partners and analytics providers "
+        "for marketing purposes and we keep it for as long as we find it useful."
+    )
+    result = verification.analyze_policy_full("\n\n".join([clause] * 40), "detailed")
+    assert result["metrics"]["shards"] == 10
+    assert len(judged) == verification.MAX_LLM_CLAUSES
+
+
+def test_analysis_with_deadline_judges_priority_clauses_first(monkeypatch) -> None:
+    import time
+
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_BATCH_JUDGING", "false")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_LLM_CONCURRENCY", "1")
+    judged = []
+
+    def slow_judge(clause: str, k: int, counter=None, deadline=None):
+        judged.append(clause)
+        time.sleep(0.3)
+        return [{"article": "Article 44", "verdict": "violates", "confidence": 0.9}]
+
+    monkeypatch.setattr(verification, "_retrieve_and_judge", slow_judge)
+    filler = "This section explains how the account settings page of our service works for every registered user today and tomorrow."
+    late = (
+        "We transfer your personal data overseas to our processing partners and affiliates "
+        "without any additional safeguards or contracts in place at all."
+    )
+    text = "\n\n".join([filler + f" Part {i}." for i in range(8)] + [late])
+
+    started = time.monotonic()
+    result = verification.analyze_policy(text, "detailed", deadline_seconds=0.5)
+    assert time.monotonic() - started < 1.5
+    assert judged[0] == late
+    metrics = result["metrics"]
+    assert metrics["clauses_planned"] == verification.MAX_LLM_CLAUSES
+    assert 0 < metrics["clauses_judged"] < metrics["clauses_planned"] and metrics["coverage"] < 1
+    assert result["articles"]["violations"]["Article 44"] == metrics["clauses_judged"]
+    assert result["cache"] == "bypass"
+
+
+def test_analysis_with_deadline_is_complete_when_clauses_lack_context(monkeypatch, tmp_path) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_PATH", str(tmp_path / "verification.sqlite3"))
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_BATCH_JUDGING", "false")
+    monkeypatch.setattr(verification, "_result_cache_state", None)
+
+    def judge(clause: str, k: int, counter=None, deadline=None):
+        # Retrieval finds nothing for the filler clauses
+        if "overseas" not in clause:
+            return None
+        return [{"article": "Article 44", "verdict": "violates", "confidence": 0.9}]
+
+    monkeypatch.setattr(verification, "_retrieve_and_judge", judge)
+    filler = "This section explains how the account settings page of our service works for every registered user today and tomorrow."
+    late = (
+        "We transfer your personal data overseas to our processing partners and affiliates "
+        "without any additional safeguards or contracts in place at all."
+    )
+    text = "\n\n".join([filler + f" Part {i}." for i in range(3)] + [late])
+
+    result = verification.analyze_policy(text, "detailed", deadline_seconds=30)
+    metrics = result["metrics"]
+    assert (metrics["clauses_judged"], metrics["clauses_planned"], metrics["coverage"]) == (1, 1, 1.0)
+    assert result["cache"] == "miss"
+    monkeypatch.setattr(verification, "_result_cache_state", None)
+
+
+@pytest.mark.parametrize("batch_judging", ["false", "true"])
+def test_completed_deadline_run_matches_plain_run(monkeypatch, batch_judging) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_BATCH_JUDGING", batch_judging)
+
+    def judgment(clause: str) -> list[dict]:
+        article = "Article 44" if "overseas" in clause else "Article 17"
+        verdict = "violates" if len(clause) % 2 else "fulfills"
+        return [{"article": article, "verdict": verdict, "confidence": 0.5 + len(clause) % 40 / 100}]
+
+    monkeypatch.setattr(verification, "_retrieve_and_judge", lambda clause, k, counter=None, deadline=None: judgment(clause))
+    monkeypatch.setattr(verification, "retrieve", lambda clause, k=None: [{"id": "gdpr", "doc": "x", "meta": {}}])
+    monkeypatch.setattr(
+        verification,
+        "_judge_entries_batched",
+        lambda entries, model, s, lookups, deadline=None: {i: judgment(clause) for i, clause, _ in entries},
+    )
+    parts = [
+        "We transfer your personal data overseas to our processing partners without any additional safeguards at all.",
+        "You can ask us to delete your personal data and we will erase it from our systems within thirty days of asking.",
+        "This section explains how the account settings page of our service works for every registered user today.",
+    ]
+    text = "\n\n".join(f"{p} Item {i} of the policy text." for i in range(4) for p in parts)
+
+    for mode in ("balanced", "detailed"):
+        plain = verification.analyze_policy(text, mode)
+        timed = verification.analyze_policy(text, mode, deadline_seconds=30)
+        assert timed["metrics"].pop("coverage") == 1.0
+        for key in ("clauses_judged", "clauses_planned"):
+            timed["metrics"].pop(key)
+        assert timed == plain
+
+
+def test_judging_cascade_escalates_unsure_and_critical_clauses(monkeypatch) -> None:
+    from poliverai.core.config import get_settings
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_CHAT_MODEL", "big-model")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CASCADE_TIERS", '{"small-model": 0.8}')
+    cheap = {
+        "erasure": {"article": "Article 17", "verdict": "fulfills", "confidence": 0.9},
+        "vague": {"article": "Article 17", "verdict": "unclear", "confidence": 0.4},
+        "contact": {"article": "Article 13(1)", "verdict": "fulfills", "confidence": 0.95},
+    }
+    calls = []
+
+    def fake_llm(clause, ctx, counter=None, deadline=None, model=None):
+        calls.append((clause, model))
+        if model == "small-model":
+            return [cheap[clause]]
+        return [{**cheap[clause], "confidence": 0.99}]
+
+    monkeypatch.setattr(verification, "retrieve", lambda clause, k: [{"id": "gdpr", "doc": "x", "meta": {}}])
+    monkeypatch.setattr(verification, "_llm_judge_clause", fake_llm)
+    counter = verification.JudgmentCacheCounter()
+    clauses = ["erasure", "vague", "contact"]
+    results = verification._judge_clauses_concurrently(clauses, [0, 1, 2], 3, get_settings(), counter)
+
+    assert {c for c, m in calls if m is None} == {"vague", "contact"}
+    assert results[0][0]["confidence"] == 0.9 and results[1][0]["confidence"] == 0.99
+    assert counter.as_metrics()["cascade_settled"] == 1 and counter.as_metrics()["cascade_escalated"] == 2
+    assert "small-model@0.8>big-model" in verification._judge_signature("detailed", True)
+
+
+def test_cascade_escalates_clauses_whose_keywords_map_to_critical_articles(monkeypatch) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_CHAT_MODEL", "big-model")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CASCADE_TIERS", '{"small-model": 0.8}')
+    calls = []
+
+    def fake_llm(clause, ctx, counter=None, deadline=None, model=None):
+        calls.append(model)
+        # The cheap model misses the retention period the clause is about
+        return [{"article": "Article 17", "verdict": "fulfills", "confidence": 0.95}]
+
+    monkeypatch.setattr(verification, "_llm_judge_clause", fake_llm)
+    verification._cascade_judge("Our retention of your data ends when you close the account.", [])
+    assert calls == ["small-model", None]
+    calls.clear()
+    verification._cascade_judge("You can ask for erasure of your data when you close the account.", [])
+    assert calls == ["small-model"]
+
+
+def test_cascade_counts_cache_lookups_once_per_clause_and_escalates_titled_articles(monkeypatch, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_JUDGMENT_CACHE_PATH", str(tmp_path / "judgments.sqlite3"))
+    monkeypatch.setenv("POLIVERAI_OPENAI_CHAT_MODEL", "big-model")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CASCADE_TIERS", '{"small-model": 0.8}')
+    monkeypatch.setattr(verification, "_judgment_cache_state", None)
+    calls = []
+
+    def create(model, **kwargs):
+        calls.append(model)
+        article = "Article 13 Information to be provided"
+        content = '{"judgments": [{"article": "%s", "verdict": "fulfills", "confidence": 0.95}]}' % article
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(verification, "_init", lambda: SimpleNamespace(client=client))
+    ctx = [{"id": "gdpr-13", "doc": "Information to be provided", "meta": {}}]
+
+    first, second = verification.JudgmentCacheCounter(), verification.JudgmentCacheCounter()
+    verification._cascade_judge("We tell you who we are and how to contact us.", ctx, first)
+    verification._cascade_judge("We tell you who we are and how to contact us.", ctx, second)
+
+    # The titled Article 13 answer is critical, so the small tier escalates
+    assert calls == ["small-model", "big-model"]
+    assert (first.hits, first.misses, first.escalated) == (0, 1, 1)
+    assert (second.hits, second.misses, second.escalated) == (1, 0, 1)
+    monkeypatch.setattr(verification, "_judgment_cache_state", None)
+
+
+def test_stream_judges_clauses_concurrently_and_emits_clause_results(monkeypatch) -> None:
+    import asyncio
+
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    active = {"now": 0, "peak": 0}
+
+    async def fake_retrieve(clause, k=None):
+        return [{"id": "gdpr-17", "doc": "Right to erasure", "meta": {}}]
+
+    async def fake_judge(clause, ctx, counter=None, deadline=None):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.05 if clause.startswith("Slow") else 0.01)
+        active["now"] -= 1
+        return [{"article": "Article 17", "verdict": "fulfills", "confidence": 0.8}]
+
+    monkeypatch.setattr(verification, "retrieve_async", fake_retrieve)
+    monkeypatch.setattr(verification, "_llm_judge_clause_async", fake_judge)
+    body = "we collect personal data for the purposes described here and delete it when it is no longer needed by us"
+    text = "\n\n".join(f"{'Slow' if i == 0 else 'Fast'} clause {i}: {body}" for i in range(4))
+    events = []
+
+    async def progress_cb(event, data):
+        events.append((event, data))
+
+    asyncio.run(verification.analyze_policy_stream(text, "detailed", progress_cb))
+
+    clause_results = [d for e, d in events if e == "clause_result"]
+    assert len(clause_results) == 4 and clause_results[-1]["index"] == 0
+    assert clause_results[0]["source"] == "llm" and active["peak"] > 1
+
+
+def test_stream_does_not_replace_the_verify_analysis_record(monkeypatch, tmp_path) -> None:
+    import asyncio
+
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_ANALYSIS_RECORDS_PATH", str(tmp_path / "analyses.sqlite3"))
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setenv("POLIVERAI_OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(verification, "_analysis_records_state", None)
+
+    async def fake_retrieve(clause, k):
+        return [{"id": "gdpr-5", "doc": "storage limitation", "meta": {}}]
+
+    async def fake_judge(clause, ctx, counter=None, deadline=None):
+        return [{"article": "Article 5(1)(e)", "verdict": "violates", "confidence": 0.9}]
+
+    monkeypatch.setattr(verification, "retrieve_async", fake_retrieve)
+    monkeypatch.setattr(verification, "_cascade_judge_async", fake_judge)
+    text = "\n\n".join(
+        f"Section {i}: we keep your account data for as long as your account stays active and a while after it is closed."
+        for i in range(3)
+    )
+    analysis_id = verification.analyze_policy(text, "fast")["analysis_id"]
+    record = verification._load_analysis_record(analysis_id)
+
+    assert asyncio.run(verification.analyze_policy_stream(text, "fast"))["analysis_id"] == analysis_id
+    assert verification._load_analysis_record(analysis_id) == record
+    monkeypatch.setattr(verification, "_analysis_records_state", None)
+
+
+def test_reverify_reuses_unchanged_clauses(client, monkeypatch, tmp_path) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_ANALYSIS_RECORDS_PATH", str(tmp_path / "analyses.sqlite3"))
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setattr(verification, "_analysis_records_state", None)
+    paragraphs = [f"Section {i}: we keep your account data for as long as your account stays active." for i in range(4)]
+    original = "\n\n".join(paragraphs)
+    first = client.post("/api/v1/verify", files={"file": ("policy.txt", original.encode())}).json()
+
+    paragraphs[2] = "Section 2: you can ask us to delete your account data at any time by email."
+    revised = "\n\n".join(paragraphs)
+    r = client.post(
+        "/api/v1/re-verify",
+        files={"file": ("policy.txt", revised.encode())},
+        data={"previous_analysis_id": first["analysis_id"]},
+    )
+    assert r.status_code == HTTP_OK
+    data = r.json()
+    assert data["incremental"] == {"baseline": True, "reused": 3, "judged": 1, "removed": 1}
+    assert data["score"] == verification.analyze_policy(revised)["score"]
+    monkeypatch.setattr(verification, "_analysis_records_state", None)
+
+
+def test_reverify_matches_a_full_run_past_the_mode_budget(monkeypatch, tmp_path) -> None:
+    from poliverai.rag import verification
+
+    monkeypatch.setenv("POLIVERAI_ANALYSIS_RECORDS_PATH", str(tmp_path / "analyses.sqlite3"))
+    monkeypatch.setenv("POLIVERAI_VERIFICATION_CACHE_ENABLED", "false")
+    monkeypatch.setattr(verification, "_analysis_records_state", None)
+    paragraphs = [f"Section {i}: we keep your account data for as long as your account stays active." for i in range(14)]
+    first = verification.analyze_policy("\n\n".join(paragraphs), "fast")
+
+    paragraphs[12] = "Section 12: you can ask us to delete your account data at any time by email."
+    revised = "\n\n".join(paragraphs)
+    result = verification.reanalyze_policy(revised, "fast", previous_analysis_id=first["analysis_id"])
+    full = verification.analyze_policy(revised, "fast")
+    for key in ("score", "confidence", "evidence", "findings", "articles"):
+        assert result[key] == full[key]
+    # Clause 12 is past fast mode's 10-clause budget, so nothing new is judged
+    assert result["incremental"] == {"baseline": True, "reused": 10, "judged": 0, "removed": 1}
+    monkeypatch.setattr(verification, "_analysis_records_state", None)
+
+
+def test_verify_batch_accepts_zip_and_reports_per_document_results(client) -> None:
+    import io
+    import time
+    import zipfile
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.txt", "We keep your data for 12 months and you may ask us to delete it.")
+        zf.writestr("b.txt", "We share personal data with third party advertisers.")
+    files = [
+        ("files", ("vendors.zip", archive.getvalue())),
+        ("files", ("c.txt", b"Contact our data controller by email for any purpose related question.")),
+    ]
+    r = client.post("/api/v1/verify-batch", files=files)
+    assert r.status_code == 202
+    job = r.json()
+    assert job["total"] == 3
+
+    for _ in range(100):
+        status = client.get(job["status_url"]).json()
+        if status["status"] == "completed":
+            break
+        time.sleep(0.05)
+    assert status["completed"] == 3 and status["progress"] == 100
+    assert [d["name"] for d in status["documents"]] == ["vendors.zip/a.txt", "vendors.zip/b.txt", "c.txt"]
+    assert all("score" in d["result"] for d in status["documents"])
+
+    events = client.get(job["events_url"]).text
+    assert events.count("document_completed") == 3 and '"event": "completed"' in events
+
+
+def test_batch_expansion_enforces_limits_before_reading_zip_members(monkeypatch) -> None:
+    import io
+    import zipfile
+
+    from fastapi import HTTPException
+
+    from poliverai.app.api.routes import verification as routes
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        for i in range(3):
+            zf.writestr(f"{i}.txt", "x" * 100)
+    reads = []
+    original_read = zipfile.ZipFile.read
+    monkeypatch.setattr(zipfile.ZipFile, "read", lambda self, info: reads.append(info) or original_read(self, info))
+    uploads = [("vendors.zip", archive.getvalue())]
+
+    assert len(routes._expand_batch_uploads(uploads, 3, 300)) == 3
+    reads.clear()
+    with pytest.raises(HTTPException) as too_many:
+        routes._expand_batch_uploads(uploads, 2, 10_000)
+    assert too_many.value.status_code == 413 and len(reads) == 2
+    reads.clear()
+    with pytest.raises(HTTPException) as too_large:
+        routes._expand_batch_uploads(uploads, 10, 250)
+    assert too_large.value.status_code == 413 and len(reads) == 2
+
+
+def test_batch_document_checks_balance_before_analyzing(monkeypatch) -> None:
+    from datetime import datetime
+
+    from fastapi import HTTPException
+
+    from poliverai.app.api.routes import verification as routes
+    from poliverai.domain.auth import User
+
+    user = User(id="u1", name="Ada", email="ada@example.com", created_at=datetime.now())
+    monkeypatch.setattr(routes.user_db, "get_user_by_id", lambda user_id: user)
+    analyzed = []
+    monkeypatch.setattr(routes, "analyze_policy", lambda text, analysis_mode: analyzed.append(text))
+
+    with pytest.raises(HTTPException) as exc:
+        routes._verify_document("a.txt", b"We keep your data for 12 months.", "balanced", user)
+    assert exc.value.status_code == 402 and analyzed == []